@@ -0,0 +1,5 @@
+"""로컬 개발/부하 테스트용 도구 (앱에서는 import 하지 않음)
+
+    python -m devtools.fake_spotify        # 로컬 Spotify 대역 서버
+    python -m devtools.bench_playlist_sync # 플레이리스트 동기화 벤치마크
+"""
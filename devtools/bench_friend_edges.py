@@ -0,0 +1,235 @@
+"""친구 목록/친구 여부 조회 벤치마크 (Friend 테이블 직접 조회 vs friend_edge)
+
+임시 SQLite DB에 사용자와 친구 신청을 대량으로 만든 뒤 `flask rebuild-friend-edges`와
+같은 방식으로 friend_edge를 채우고, 무작위로 고른 사용자에 대해 예전 쿼리(Friend 테이블
+양방향 조인 + set() 중복 제거, OR 조건)와 현재 쿼리의 지연 시간 백분위수를 비교함
+
+    python -m devtools.bench_friend_edges                       # 사용자 10만 명 / 친구 신청 200만 건
+    python -m devtools.bench_friend_edges --users 10000 --friendships 200000 --samples 500
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from devtools.bench_playlist_sync import git_revision, percentile
+
+
+INSERT_CHUNK = 50_000
+
+
+def configure(workdir):
+    from vibeapp.config import Config
+
+    Config.SECRET_KEY = Config.SECRET_KEY or "bench"
+    Config.SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(workdir, "bench.db")
+    Config.RATE_LIMIT_DB_NAME = os.path.join(workdir, "rate_limit.db")
+    Config.HTTP_CACHE_DB_NAME = os.path.join(workdir, "http_cache.db")
+    Config.FRIEND_GRAPH_SNAPSHOT_NAME = os.path.join(workdir, "friend_graph.bin")
+    return os.path.join(workdir, "bench.db")
+
+
+def populate(db_path, users, friendships, pending_ratio, seed):
+    """사용자 users명과 친구 신청 friendships건을 sqlite3로 직접 넣음 (ORM을 거치면 너무 느림)
+
+    신청자마다 서로 다른 상대를 골라 (requester_id, receiver_id)가 겹치지 않게 하고,
+    pending_ratio 비율은 대기중, 나머지는 수락 상태로 둠
+    """
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    with conn:
+        conn.executemany(
+            "INSERT INTO user (id, username, display_name, is_admin) VALUES (?, ?, ?, 0)",
+            ((i, f"user{i}", f"User {i}") for i in range(1, users + 1)),
+        )
+
+    per_user, extra = divmod(friendships, users)
+
+    def rows():
+        for requester in range(1, users + 1):
+            count = per_user + (1 if requester <= extra else 0)
+            for offset in rng.sample(range(1, users), count):
+                status = "pending" if rng.random() < pending_ratio else "accepted"
+                yield requester, (requester - 1 + offset) % users + 1, status
+
+    sql = "INSERT INTO friend (requester_id, receiver_id, status, created_at, updated_at) VALUES (?, ?, ?, datetime('now'), datetime('now'))"
+    batch = []
+    for row in rows():
+        batch.append(row)
+        if len(batch) >= INSERT_CHUNK:
+            with conn:
+                conn.executemany(sql, batch)
+            batch.clear()
+    if batch:
+        with conn:
+            conn.executemany(sql, batch)
+    conn.close()
+
+
+def legacy_get_friends_for_user(user_id):
+    """friend_edge 도입 전 Friend.get_friends_for_user (비교용으로 그대로 옮김)"""
+    from vibeapp.extensions import db
+    from vibeapp.models import Friend, User
+
+    friends1 = db.session.query(User).join(
+        Friend, User.id == Friend.receiver_id
+    ).filter((Friend.requester_id == user_id) & (Friend.status == "accepted")).all()
+    friends2 = db.session.query(User).join(
+        Friend, User.id == Friend.requester_id
+    ).filter((Friend.receiver_id == user_id) & (Friend.status == "accepted")).all()
+    return list(set(friends1 + friends2))
+
+
+def legacy_are_friends(user1_id, user2_id):
+    """friend_edge 도입 전 Friend.are_friends (비교용으로 그대로 옮김)"""
+    from vibeapp.models import Friend
+
+    return Friend.query.filter(
+        (
+            ((Friend.requester_id == user1_id) & (Friend.receiver_id == user2_id)) |
+            ((Friend.requester_id == user2_id) & (Friend.receiver_id == user1_id))
+        ) & (Friend.status == "accepted")
+    ).first() is not None
+
+
+def timed(func, args_list):
+    """args_list의 각 인자로 func를 호출한 지연 시간(초) 목록과 결과 목록"""
+    from vibeapp.extensions import db
+
+    durations, results = [], []
+    for args in args_list:
+        #이전 호출에서 읽은 객체가 식별자 맵에 남아 있으면 조회를 건너뛰므로 매번 비움
+        db.session.expunge_all()
+        started = time.perf_counter()
+        result = func(*args)
+        durations.append(time.perf_counter() - started)
+        results.append(result)
+    return durations, results
+
+
+def summarize(durations):
+    values = sorted(durations)
+    return {
+        "calls": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p90_ms": round(percentile(values, 90) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+
+def query_plans():
+    """대표 쿼리의 EXPLAIN QUERY PLAN (인덱스를 타는지 확인용)"""
+    from vibeapp.extensions import db
+
+    statements = {
+        "legacy_friends_as_receiver": "SELECT requester_id FROM friend WHERE receiver_id = 1 AND status = 'accepted'",
+        "legacy_are_friends": (
+            "SELECT id FROM friend WHERE ((requester_id = 1 AND receiver_id = 2) OR "
+            "(requester_id = 2 AND receiver_id = 1)) AND status = 'accepted'"
+        ),
+        "edge_friends": "SELECT friend_id FROM friend_edge WHERE user_id = 1",
+        "edge_are_friends": "SELECT 1 FROM friend_edge WHERE user_id = 1 AND friend_id = 2",
+    }
+    return {
+        name: [row[3] for row in db.session.execute(db.text("EXPLAIN QUERY PLAN " + sql))]
+        for name, sql in statements.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="friend_edge 조회 벤치마크")
+    parser.add_argument("--users", type=int, default=100_000, help="사용자 수")
+    parser.add_argument("--friendships", type=int, default=2_000_000, help="친구 신청 수")
+    parser.add_argument("--pending-ratio", type=float, default=0.05, help="대기중 신청 비율")
+    parser.add_argument("--samples", type=int, default=200, help="조회할 무작위 사용자 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench-results/friend_edges.json", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="vibe-bench-") as workdir:
+        db_path = configure(workdir)
+        from vibeapp import create_app
+        from vibeapp.extensions import db
+        from vibeapp.models import Friend, FriendEdge
+
+        app = create_app()
+        with app.app_context():
+            db.create_all()
+
+            started = time.perf_counter()
+            populate(db_path, args.users, args.friendships, args.pending_ratio, args.seed)
+            populate_seconds = time.perf_counter() - started
+            print(f"데이터 생성: 사용자 {args.users}명, 친구 신청 {args.friendships}건 ({populate_seconds:.1f}s)")
+
+            started = time.perf_counter()
+            edges = FriendEdge.rebuild()
+            db.session.commit()
+            rebuild_seconds = time.perf_counter() - started
+            print(f"friend_edge 재생성: {edges}개 ({rebuild_seconds:.1f}s)")
+
+            user_ids = [(rng.randint(1, args.users),) for _ in range(args.samples)]
+            #친구 여부는 절반은 실제 친구, 절반은 무작위 사용자로 확인
+            pairs = []
+            for (user_id,) in user_ids:
+                friend_ids = FriendEdge.friend_ids(user_id)
+                if friend_ids and len(pairs) % 2 == 0:
+                    pairs.append((user_id, rng.choice(friend_ids)))
+                else:
+                    pairs.append((user_id, rng.randint(1, args.users)))
+
+            results = {}
+            cases = {
+                "get_friends_for_user": (legacy_get_friends_for_user, Friend.get_friends_for_user, user_ids),
+                "are_friends": (legacy_are_friends, Friend.are_friends, pairs),
+            }
+            for name, (legacy, current, inputs) in cases.items():
+                legacy_durations, legacy_results = timed(legacy, inputs)
+                edge_durations, edge_results = timed(current, inputs)
+
+                #두 구현의 결과가 같은지 확인 (친구 목록은 순서 무관)
+                if name == "get_friends_for_user":
+                    legacy_results = [sorted(user.id for user in users) for users in legacy_results]
+                    edge_results = [sorted(user.id for user in users) for users in edge_results]
+                if legacy_results != edge_results:
+                    raise SystemExit(f"{name}: 예전 구현과 결과가 다릅니다")
+
+                results[name] = {"legacy": summarize(legacy_durations), "friend_edge": summarize(edge_durations)}
+                speedup = results[name]["legacy"]["p50_ms"] / max(results[name]["friend_edge"]["p50_ms"], 1e-6)
+                results[name]["p50_speedup"] = round(speedup, 1)
+                print(f"  {name:<22} legacy {json.dumps(results[name]['legacy'])}")
+                print(f"  {'':<22} edge   {json.dumps(results[name]['friend_edge'])}  (p50 {speedup:.1f}x)")
+
+            plans = query_plans()
+            for name, plan in plans.items():
+                print(f"  plan {name:<28} {' / '.join(plan)}")
+
+    report = {
+        "benchmark": "friend_edges",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "params": {key: value for key, value in vars(args).items() if key != "output"},
+        "setup_seconds": {"populate": round(populate_seconds, 1), "rebuild_friend_edges": round(rebuild_seconds, 1)},
+        "friend_edges": edges,
+        "query_plans": plans,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""친구 그래프 탐색 벤치마크 (SQL로 한 단계씩 BFS vs mmap CSR 스냅샷)
+
+임시 SQLite DB에 사용자와 친구 신청을 대량으로 만들고 friend_edge와 그래프 스냅샷을 만든 뒤,
+무작위 사용자 쌍의 최단 경로(양방향 BFS)와 2단계 이웃 수를 구하는 지연 시간 백분위수를 잼.
+비교용 SQL BFS는 방문한 사용자마다 friend_edge를 한 번씩 조회함 (느려서 일부 표본만)
+
+    python -m devtools.bench_friend_graph                       # 사용자 10만 명 / 친구 신청 200만 건
+    python -m devtools.bench_friend_graph --users 10000 --friendships 200000 --samples 200
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from devtools.bench_friend_edges import configure, populate, summarize, timed
+from devtools.bench_playlist_sync import git_revision
+
+
+def sql_shortest_distance(source_id, target_id, max_depth):
+    """friend_edge를 사용자마다 조회하는 단방향 BFS (그래프 스냅샷 도입 전 방식, 비교용)"""
+    from vibeapp.models import FriendEdge
+
+    if source_id == target_id:
+        return 0
+    visited = {source_id}
+    frontier = [source_id]
+    for depth in range(1, max_depth + 1):
+        next_frontier = []
+        for node in frontier:
+            for friend_id in FriendEdge.friend_ids(node):
+                if friend_id == target_id:
+                    return depth
+                if friend_id not in visited:
+                    visited.add(friend_id)
+                    next_frontier.append(friend_id)
+        frontier = next_frontier
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="친구 그래프 탐색 벤치마크")
+    parser.add_argument("--users", type=int, default=100_000, help="사용자 수")
+    parser.add_argument("--friendships", type=int, default=2_000_000, help="친구 신청 수")
+    parser.add_argument("--pending-ratio", type=float, default=0.05, help="대기중 신청 비율")
+    parser.add_argument("--samples", type=int, default=500, help="그래프 탐색 표본 수")
+    parser.add_argument("--sql-samples", type=int, default=5, help="SQL BFS 표본 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench-results/friend_graph.json", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="vibe-bench-") as workdir:
+        db_path = configure(workdir)
+        from vibeapp import create_app
+        from vibeapp.config import Config
+        from vibeapp.extensions import db
+        from vibeapp.models import FriendEdge
+        from vibeapp.services.friend_graph import FriendGraph
+
+        app = create_app()
+        with app.app_context():
+            db.create_all()
+
+            started = time.perf_counter()
+            populate(db_path, args.users, args.friendships, args.pending_ratio, args.seed)
+            edges = FriendEdge.rebuild()
+            db.session.commit()
+            print(f"데이터 생성: 사용자 {args.users}명, 간선 {edges}개 ({time.perf_counter() - started:.1f}s)")
+
+            graph = FriendGraph(app)
+            snapshot = graph.rebuild_snapshot()
+            db.session.commit()
+            print(f"스냅샷 생성: {snapshot['snapshot_bytes'] / 1024 / 1024:.1f}MB ({snapshot['seconds']}s)")
+
+            #새 워커가 처음 스냅샷을 여는 시간 (mmap이라 파일 크기와 거의 무관)
+            started = time.perf_counter()
+            graph = FriendGraph(app)
+            graph.stats()
+            open_ms = (time.perf_counter() - started) * 1000
+            print(f"스냅샷 열기: {open_ms:.2f}ms")
+
+            pairs = [tuple(rng.sample(range(1, args.users + 1), 2)) for _ in range(args.samples)]
+            max_depth = Config.FRIEND_GRAPH_MAX_DEPTH
+            path_durations, paths = timed(graph.shortest_path, pairs)
+            hop_durations, _ = timed(graph.neighborhood, [(source_id, 2) for source_id, _ in pairs])
+            sql_pairs = pairs[:args.sql_samples]
+            sql_durations, sql_distances = timed(sql_shortest_distance, [(*pair, max_depth) for pair in sql_pairs])
+
+            #SQL BFS와 거리가 같은지 확인
+            graph_distances = [None if path is None else len(path) - 1 for path in paths[:args.sql_samples]]
+            if graph_distances != sql_distances:
+                raise SystemExit(f"SQL BFS와 결과가 다릅니다: {graph_distances} != {sql_distances}")
+
+            distances = {}
+            for path in paths:
+                key = "none" if path is None else str(len(path) - 1)
+                distances[key] = distances.get(key, 0) + 1
+
+            results = {
+                "shortest_path": summarize(path_durations),
+                "neighborhood_2_hops": summarize(hop_durations),
+                "sql_bfs": summarize(sql_durations),
+            }
+            for name, summary in results.items():
+                print(f"  {name:<20} {json.dumps(summary)}")
+            print(f"  거리 분포 {json.dumps(distances)}")
+
+            db.session.remove()
+            db.engine.dispose()
+
+    report = {
+        "benchmark": "friend_graph",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "params": {key: value for key, value in vars(args).items() if key != "output"},
+        "friend_edges": edges,
+        "snapshot": snapshot,
+        "open_ms": round(open_ms, 2),
+        "distance_histogram": distances,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""PlaylistService.get_and_save_playlists 종단간(end-to-end) 벤치마크
+
+로컬 Spotify 대역 서버(devtools.fake_spotify)를 별도 프로세스로 띄우고
+라이브러리 크기별로 동기화 지연 시간 백분위수와 처리량을 측정해 JSON으로 저장함
+
+    python -m devtools.bench_playlist_sync --sizes 50,500,2000 --rounds 5
+    python -m devtools.bench_playlist_sync --latency 0.03 --error-429 0.01 --output bench-results/slow-api.json
+    python -m devtools.bench_playlist_sync --compare bench-results/baseline.json  # p50이 느려지면 종료 코드 1
+
+시나리오 (크기마다 rounds번씩 반복):
+    cold     빈 DB에서 첫 동기화 (플레이리스트 + 트랙)
+    warm     바뀐 것이 없는 상태에서 강제 재동기화
+    changed  플레이리스트 10%의 snapshot_id가 바뀐 상태에서 재동기화
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone, timedelta
+
+import requests
+
+from devtools.fake_spotify import start_in_process
+
+
+SCENARIOS = ("cold", "warm", "changed")
+FAKE_USER = "bench-user"
+
+
+def percentile(values, p):
+    """선형 보간 백분위수 (values는 정렬된 리스트)"""
+    if len(values) == 1:
+        return values[0]
+    rank = (len(values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def summarize(durations, size, failures):
+    values = sorted(durations)
+    if not values:
+        return {"rounds": 0, "failures": failures}
+    mean = sum(values) / len(values)
+    return {
+        "rounds": len(values),
+        "failures": failures,
+        "min_ms": round(values[0] * 1000, 2),
+        "mean_ms": round(mean * 1000, 2),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p90_ms": round(percentile(values, 90) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2),
+        "playlists_per_sec": round(size / mean, 1),
+    }
+
+
+def configure(workdir, api_base, args):
+    """앱을 만들기 전에 Config를 벤치마크용으로 덮어씀 (DB/캐시 파일은 모두 workdir 안에)"""
+    from vibeapp.config import Config
+
+    Config.SECRET_KEY = Config.SECRET_KEY or "bench"
+    Config.SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(workdir, "bench.db")
+    Config.RATE_LIMIT_DB_NAME = os.path.join(workdir, "rate_limit.db")
+    Config.HTTP_CACHE_DB_NAME = os.path.join(workdir, "http_cache.db")
+    Config.HTTP_CACHE_ENABLED = not args.no_cache
+    Config.PLAYLIST_SYNC_TRACKS = not args.no_tracks
+    Config.SPOTIFY_API_BASE = f"{api_base}/v1"
+    Config.SPOTIFY_ACCOUNTS_BASE = api_base
+    Config.PLATFORM_OAUTH["spotify"]["TOKEN_URL"] = f"{api_base}/api/token"
+    Config.PLATFORM_OAUTH["spotify"]["USER_INFO_URL"] = f"{api_base}/v1/me"
+    if args.rate_limit:
+        Config.PLATFORM_RATE_LIMITS = {"spotify": {"rate": args.rate_limit, "capacity": args.rate_limit * 2},
+                                       "default": {"rate": args.rate_limit, "capacity": args.rate_limit * 2}}
+    else:
+        #레이트 리미터 대기 대신 앱 자체의 처리 시간을 보기 위해 사실상 해제
+        Config.PLATFORM_RATE_LIMITS = {"spotify": {"rate": 1e6, "capacity": 1e6},
+                                       "default": {"rate": 1e6, "capacity": 1e6}}
+    return Config
+
+
+def reset_database(app):
+    """빈 DB와 빈 응답 캐시로 초기화하고 벤치마크용 연결 생성, 연결 ID 반환"""
+    from vibeapp.extensions import db
+    from vibeapp.models import PlatformConnection, PlatformToken, User
+    from vibeapp.services.response_cache import response_cache
+    from vibeapp.services.token_manager import token_manager
+
+    db.drop_all()
+    db.create_all()
+    response_cache.forget(FAKE_USER)
+
+    #측정 대상이 아니므로 주입된 오류는 성공할 때까지 다시 요청
+    while True:
+        res = requests.post(
+            app.config["PLATFORM_OAUTH"]["spotify"]["TOKEN_URL"],
+            data={"grant_type": "authorization_code", "code": FAKE_USER},
+            timeout=10,
+        )
+        if res.status_code == 200:
+            break
+    token_data = res.json()
+
+    user = User(display_name=FAKE_USER)
+    db.session.add(user)
+    db.session.flush()
+    token = PlatformToken(
+        access_token=token_data["access_token"],
+        refresh_token=token_data["refresh_token"],
+        expire_at=datetime.now(timezone.utc) + timedelta(seconds=token_data["expires_in"]),
+    )
+    db.session.add(token)
+    db.session.flush()
+    connection = PlatformConnection(
+        user_id=user.id, platform="spotify", platform_user_id=FAKE_USER, token_id=token.id,
+    )
+    db.session.add(connection)
+    db.session.commit()
+
+    token_manager.invalidate(connection.id)
+    return connection.id
+
+
+def timed_sync(connection_id):
+    """강제 동기화 한 번의 소요 시간(초), 실패하면 None"""
+    from vibeapp.extensions import db
+    from vibeapp.models import PlatformConnection
+    from vibeapp.services.playlist_service import PlaylistService
+
+    db.session.expire_all()
+    connection = db.session.get(PlatformConnection, connection_id)
+    started = time.perf_counter()
+    try:
+        PlaylistService().get_and_save_playlists(connection, force=True)
+    except Exception as e:
+        db.session.rollback()
+        print(f"    동기화 실패: {type(e).__name__}: {str(e).splitlines()[0][:200]}")
+        return None
+    return time.perf_counter() - started
+
+
+def bench_size(app, api_base, size, args):
+    fake_config = {"playlists": size, "tracks": args.tracks, "snapshot_version": 1, "changed_playlists": 0}
+    requests.post(f"{api_base}/_fake/config", json=fake_config, timeout=10)
+
+    results = {}
+    durations = {scenario: [] for scenario in SCENARIOS}
+    failures = {scenario: 0 for scenario in SCENARIOS}
+
+    def record(scenario, duration):
+        if duration is None:
+            failures[scenario] += 1
+        else:
+            durations[scenario].append(duration)
+
+    for _ in range(args.rounds):
+        requests.post(f"{api_base}/_fake/config", json={"changed_playlists": 0}, timeout=10)
+        connection_id = reset_database(app)
+        record("cold", timed_sync(connection_id))
+        record("warm", timed_sync(connection_id))
+
+        #앞쪽 10%의 snapshot_id만 바꿔서 재동기화
+        changed = max(1, size // 10)
+        requests.post(f"{api_base}/_fake/config", json={"changed_playlists": changed}, timeout=10)
+        record("changed", timed_sync(connection_id))
+
+    for scenario in SCENARIOS:
+        results[scenario] = summarize(durations[scenario], size, failures[scenario])
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    """기준 결과보다 p50이 threshold 비율 넘게 느려진 항목 목록 반환"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    for size, scenarios in results.items():
+        for scenario, summary in scenarios.items():
+            before = baseline.get(size, {}).get(scenario, {}).get("p50_ms")
+            after = summary.get("p50_ms")
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            marker = "  <-- 느려짐" if change > threshold else ""
+            print(f"  {size:>6} {scenario:<8} p50 {before:>10.1f}ms -> {after:>10.1f}ms ({change:+.1%}){marker}")
+            if change > threshold:
+                regressions.append((size, scenario, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="플레이리스트 동기화 벤치마크")
+    parser.add_argument("--sizes", default="50,500,2000", help="쉼표로 구분한 라이브러리 크기(플레이리스트 수)")
+    parser.add_argument("--rounds", type=int, default=5, help="크기/시나리오별 반복 횟수")
+    parser.add_argument("--tracks", type=int, default=30, help="플레이리스트당 트랙 수")
+    parser.add_argument("--no-tracks", action="store_true", help="트랙 동기화 끄기 (PLAYLIST_SYNC_TRACKS=False)")
+    parser.add_argument("--no-cache", action="store_true", help="ETag 응답 캐시 끄기 (HTTP_CACHE_ENABLED=False)")
+    parser.add_argument("--latency", type=float, default=0.0, help="대역 서버 요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="대역 서버 추가 무작위 지연(초)")
+    parser.add_argument("--error-429", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="5xx 응답 비율")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--rate-limit", type=float, default=0, help="초당 요청 한도 (0이면 레이트 리미터 해제)")
+    parser.add_argument("--output", default="bench-results/playlist_sync.json", help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.2, help="느려짐으로 볼 p50 증가 비율")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    fake_process, api_base = start_in_process(
+        latency=args.latency, jitter=args.jitter, error_429=args.error_429,
+        error_5xx=args.error_5xx, retry_after=args.retry_after,
+    )
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="vibe-bench-") as workdir:
+            configure(workdir, api_base, args)
+            from vibeapp import create_app
+
+            app = create_app()
+            results = {}
+            with app.app_context():
+                for size in sizes:
+                    print(f"[{size} playlists]")
+                    results[str(size)] = bench_size(app, api_base, size, args)
+                    for scenario, summary in results[str(size)].items():
+                        print(f"  {scenario:<8} {json.dumps(summary, ensure_ascii=False)}")
+            fake_stats = requests.get(f"{api_base}/_fake/stats", timeout=10).json()["stats"]
+    finally:
+        fake_process.terminate()
+
+    report = {
+        "benchmark": "playlist_sync",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "params": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "fake_api_requests": fake_stats,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+    if args.compare:
+        print(f"기준 결과와 비교: {args.compare}")
+        if compare(results, args.compare, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
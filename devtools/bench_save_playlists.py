@@ -0,0 +1,210 @@
+"""플레이리스트 DB 저장 벤치마크 (항목마다 조회하던 예전 save_playlists vs 일괄 upsert)
+
+네트워크 없이 저장 단계만 잼. 임시 SQLite DB에 연결 하나를 만들고 크기별로 같은 플레이리스트
+목록을 두 구현에 넣어, 빈 DB에 처음 저장(initial)하는 경우와 10%의 snapshot_id/이름이 바뀐
+목록으로 다시 저장(resync)하는 경우의 지연 시간 백분위수와 실행된 SQL 문 수를 비교함.
+두 구현이 저장한 결과(외부 ID, 이름, snapshot_id, 공개 여부)가 같은지도 확인함
+
+    python -m devtools.bench_save_playlists                     # 50, 500, 5000개
+    python -m devtools.bench_save_playlists --sizes 50,500 --rounds 10
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from devtools.bench_friend_edges import configure
+from devtools.bench_playlist_sync import git_revision, percentile
+from vibeapp.utils.query_counter import QueryCounter
+
+
+SCENARIOS = ("initial", "resync")
+
+
+def make_playlists(size, changed=0):
+    """Spotify 응답 형태의 플레이리스트 목록 (앞쪽 changed개는 snapshot_id와 이름이 바뀐 상태)"""
+    return [
+        {
+            "id": f"playlist{i:06d}",
+            "name": f"Playlist {i}" + (" (edited)" if i < changed else ""),
+            "snapshot_id": f"snapshot-{i}-{2 if i < changed else 1}",
+            "public": i % 3 != 0,
+        }
+        for i in range(size)
+    ]
+
+
+def legacy_save_playlists(connection, playlists_data):
+    """일괄 upsert 도입 전 SpotifyService.save_playlists (비교용으로 그대로 옮김)"""
+    from vibeapp.extensions import db
+    from vibeapp.models import Playlist
+
+    for item in playlists_data:
+        external_id = item["id"]
+        name = item["name"]
+        snapshot_id = item.get("snapshot_id")
+        is_public = item.get("public", True)
+
+        existing = Playlist.query.filter_by(
+            platform=connection.platform,
+            platform_user_id=connection.platform_user_id,
+            spotify_id=external_id
+        ).first()
+
+        if existing:
+            existing.name = name
+            existing.snapshot_id = snapshot_id
+            existing.is_public = is_public
+        else:
+            new_playlist = Playlist(
+                external_id=external_id,
+                spotify_id=external_id,
+                name=name,
+                snapshot_id=snapshot_id,
+                is_public=is_public,
+                platform=connection.platform,
+                platform_user_id=connection.platform_user_id,
+                platform_connection_id=connection.id
+            )
+            db.session.add(new_playlist)
+
+    db.session.commit()
+
+
+def bulk_save_playlists(connection, playlists_data):
+    from vibeapp.services.platform_adapter import get_adapter
+
+    get_adapter(connection.platform).save_playlists(connection, playlists_data)
+
+
+def create_connection():
+    from vibeapp.extensions import db
+    from vibeapp.models import PlatformConnection, PlatformToken, User
+
+    user = User(display_name="bench-user")
+    connection = PlatformConnection(
+        platform="spotify", platform_user_id="bench-user", user=user, token=PlatformToken(access_token="token"),
+    )
+    db.session.add_all([user, connection])
+    db.session.commit()
+    return connection.id
+
+
+def saved_state(connection_id):
+    from vibeapp.extensions import db
+    from vibeapp.models import Playlist
+
+    return db.session.execute(
+        db.select(Playlist.spotify_id, Playlist.name, Playlist.snapshot_id, Playlist.is_public)
+        .where(Playlist.platform_connection_id == connection_id)
+        .order_by(Playlist.spotify_id)
+    ).all()
+
+
+def run_once(save, connection_id, playlists):
+    """저장 한 번의 (소요 시간(초), 실행된 SQL 문 수)"""
+    from vibeapp.extensions import db
+    from vibeapp.models import PlatformConnection
+
+    #이전 실행에서 읽은 객체가 식별자 맵에 남아 조회가 생략되지 않도록 비움
+    db.session.expunge_all()
+    connection = db.session.get(PlatformConnection, connection_id)
+    with QueryCounter(db.engine) as counter:
+        started = time.perf_counter()
+        save(connection, playlists)
+        duration = time.perf_counter() - started
+    return duration, counter.count
+
+
+def summarize(durations, statements):
+    values = sorted(durations)
+    return {
+        "rounds": len(values),
+        "statements": statements,
+        "mean_ms": round(sum(values) / len(values) * 1000, 2),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p90_ms": round(percentile(values, 90) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2),
+    }
+
+
+def bench_size(connection_id, size, rounds):
+    from vibeapp.extensions import db
+    from vibeapp.models import Playlist
+
+    initial = make_playlists(size)
+    changed = make_playlists(size, changed=max(1, size // 10))
+    implementations = {"legacy": legacy_save_playlists, "bulk": bulk_save_playlists}
+
+    results = {}
+    states = {}
+    for name, save in implementations.items():
+        durations = {scenario: [] for scenario in SCENARIOS}
+        statements = {}
+        for _ in range(rounds):
+            db.session.execute(db.delete(Playlist))
+            db.session.commit()
+            for scenario, playlists in zip(SCENARIOS, (initial, changed)):
+                duration, count = run_once(save, connection_id, playlists)
+                durations[scenario].append(duration)
+                statements[scenario] = count
+        states[name] = saved_state(connection_id)
+        results[name] = {scenario: summarize(durations[scenario], statements[scenario]) for scenario in SCENARIOS}
+
+    if states["legacy"] != states["bulk"]:
+        raise SystemExit(f"{size}개: 두 구현의 저장 결과가 다릅니다")
+    for scenario in SCENARIOS:
+        speedup = results["legacy"][scenario]["p50_ms"] / max(results["bulk"][scenario]["p50_ms"], 1e-6)
+        results.setdefault("p50_speedup", {})[scenario] = round(speedup, 1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="플레이리스트 DB 저장 벤치마크")
+    parser.add_argument("--sizes", default="50,500,5000", help="쉼표로 구분한 플레이리스트 수")
+    parser.add_argument("--rounds", type=int, default=5, help="크기/구현별 반복 횟수")
+    parser.add_argument("--output", default="bench-results/save_playlists.json", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    with tempfile.TemporaryDirectory(prefix="vibe-bench-") as workdir:
+        configure(workdir)
+        from vibeapp import create_app
+        from vibeapp.extensions import db
+
+        app = create_app()
+        results = {}
+        with app.app_context():
+            connection_id = create_connection()
+            for size in sizes:
+                print(f"[{size} playlists]")
+                results[str(size)] = bench_size(connection_id, size, args.rounds)
+                for name in ("legacy", "bulk"):
+                    for scenario, summary in results[str(size)][name].items():
+                        print(f"  {name:<6} {scenario:<8} {json.dumps(summary)}")
+                print(f"  p50 {json.dumps(results[str(size)]['p50_speedup'])}")
+
+            db.session.remove()
+            db.engine.dispose()
+
+    report = {
+        "benchmark": "save_playlists",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "params": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""사용자 검색 벤치마크 (ilike '%q%' 전체 스캔 vs user_search FTS5 trigram 인덱스)
+
+임시 SQLite DB에 이름이 다양한 사용자를 대량으로 넣고(동기화 트리거가 user_search도 함께 채움)
+검색창에 입력될 법한 검색어 - 정확한 사용자명, 두 글자 앞부분, 두 글자 부분 문자열(LIKE로 훑는 경로),
+세~다섯 글자 부분 문자열, 흔한 음절, 없는 문자열(두 글자/세 글자 이상) - 로 UserService.search_users의 지연 시간 백분위수를 잼.
+예전 ilike 검색은 매번 전체 스캔이라 일부 표본만 잼
+
+    python -m devtools.bench_user_search                        # 사용자 100만 명
+    python -m devtools.bench_user_search --users 100000 --samples 500
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from devtools.bench_friend_edges import INSERT_CHUNK, configure, summarize, timed
+from devtools.bench_playlist_sync import git_revision
+
+
+SYLLABLES = ["ka", "ki", "ko", "min", "su", "jin", "hyun", "woo", "lee", "park", "choi", "jung", "ra", "el", "an", "to", "mi", "ne", "vo", "zy"]
+WORDS = ["music", "vibe", "beat", "sound", "wave", "lofi", "jazz", "rock", "indie", "pop", "night", "sky", "moon"]
+FAMILY_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+GIVEN_NAMES = ["민수", "서연", "지훈", "하은", "도윤", "서준", "지우", "예린", "현우", "수아", "유진", "준호"]
+
+
+def make_names(rng, user_id):
+    """무작위 (사용자명, 표시 이름) - 사용자명은 ID를 붙여 겹치지 않게 함"""
+    username = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 3)))
+    if rng.random() < 0.4:
+        username += "_" + rng.choice(WORDS)
+    username = username[:20 - len(str(user_id))] + str(user_id)
+    if rng.random() < 0.5:
+        display_name = rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+    else:
+        display_name = f"{rng.choice(WORDS).title()} {rng.choice(SYLLABLES).title()}"
+    return username, display_name
+
+
+def populate(db_path, users, seed):
+    """사용자 users명을 sqlite3로 직접 넣음 (트리거가 user_search를 같은 트랜잭션에서 채움)"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    sql = "INSERT INTO user (id, username, display_name, is_admin) VALUES (?, ?, ?, 0)"
+    for start in range(1, users + 1, INSERT_CHUNK):
+        with conn:
+            conn.executemany(sql, ((i, *make_names(rng, i)) for i in range(start, min(start + INSERT_CHUNK, users + 1))))
+    conn.close()
+
+
+def make_queries(rng, samples, users):
+    """(종류, 검색어) 목록 - 종류마다 같은 수"""
+    from vibeapp.extensions import db
+
+    def username_of(user_id):
+        return db.session.scalar(db.text('SELECT username FROM "user" WHERE id = :id'), {"id": user_id})
+
+    def substring(text, length):
+        start = rng.randint(0, max(len(text) - length, 0))
+        return text[start:start + length]
+
+    kinds = {
+        "exact": lambda: username_of(rng.randint(1, users)),
+        "prefix_2": lambda: username_of(rng.randint(1, users))[:2],
+        "substring_2": lambda: substring(rng.choice(GIVEN_NAMES + SYLLABLES + WORDS), 2),
+        "substring_3_5": lambda: substring(username_of(rng.randint(1, users)), rng.randint(3, 5)),
+        "common": lambda: rng.choice(WORDS + GIVEN_NAMES + SYLLABLES),
+        "missing_2": lambda: "".join(rng.choice("qxz") for _ in range(2)),
+        "missing": lambda: "".join(rng.choice("qxz") for _ in range(rng.randint(3, 6))),
+    }
+    per_kind = max(samples // len(kinds), 1)
+    return [(kind, make()) for kind, make in kinds.items() for _ in range(per_kind)]
+
+
+def legacy_search_users(query, current_user_id, limit=10):
+    """user_search 도입 전 UserService.search_users (비교용으로 그대로 옮김)"""
+    from vibeapp.models import User
+    from vibeapp.models.loader_profiles import USER_CARD
+
+    return User.query.filter(
+        User.username.ilike(f'%{query}%'),
+        User.id != current_user_id,
+        User.username.isnot(None)
+    ).options(*USER_CARD).limit(limit).all()
+
+
+def query_plans():
+    """검색 단계별 EXPLAIN QUERY PLAN (인덱스를 타는지 확인용)"""
+    from vibeapp.extensions import db
+
+    statements = {
+        "legacy_ilike": "SELECT id FROM user WHERE username LIKE '%kim%' AND username IS NOT NULL LIMIT 10",
+        "exact": "SELECT id FROM user WHERE lower(username) = lower('kim') OR lower(display_name) = lower('kim') LIMIT 10",
+        "prefix": (
+            "SELECT id FROM user WHERE lower(username) >= lower('ki') AND lower(username) < lower('ki') || char(1114111) "
+            "ORDER BY lower(username) LIMIT 10"
+        ),
+        "substring": "SELECT rowid FROM user_search WHERE user_search MATCH '\"kim\"' LIMIT 10",
+    }
+    return {
+        name: [row[3] for row in db.session.execute(db.text("EXPLAIN QUERY PLAN " + sql))]
+        for name, sql in statements.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 검색 벤치마크")
+    parser.add_argument("--users", type=int, default=1_000_000, help="사용자 수")
+    parser.add_argument("--samples", type=int, default=1000, help="검색어 수 (종류별로 나눔)")
+    parser.add_argument("--legacy-samples", type=int, default=20, help="예전 ilike 검색 표본 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench-results/user_search.json", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="vibe-bench-") as workdir:
+        db_path = configure(workdir)
+        from vibeapp import create_app
+        from vibeapp.extensions import db
+        from vibeapp.services.user_services import UserService
+
+        app = create_app()
+        with app.app_context():
+            started = time.perf_counter()
+            populate(db_path, args.users, args.seed)
+            populate_seconds = time.perf_counter() - started
+            print(f"데이터 생성: 사용자 {args.users}명, 검색 인덱스 포함 ({populate_seconds:.1f}s)")
+
+            queries = make_queries(rng, args.samples, args.users)
+            viewer_id = rng.randint(1, args.users)
+            results = {}
+            by_kind = {}
+            for kind, query in queries:
+                by_kind.setdefault(kind, []).append((query, viewer_id))
+            all_durations, empty = [], {}
+            for kind, inputs in by_kind.items():
+                durations, found = timed(UserService.search_users, inputs)
+                all_durations += durations
+                results[kind] = summarize(durations)
+                empty[kind] = sum(1 for users in found if not users)
+                print(f"  {kind:<14} {json.dumps(results[kind])}  (결과 없음 {empty[kind]}건)")
+            results["all"] = summarize(all_durations)
+            print(f"  {'all':<14} {json.dumps(results['all'])}")
+
+            #예전 검색과 비교 - 부분 일치 검색어는 순위만 다를 뿐 결과 수가 예전보다 적으면 안 됨
+            legacy_inputs = [
+                input_ for kind in ("substring_2", "substring_3_5") for input_ in by_kind[kind][:args.legacy_samples // 2]
+            ]
+            legacy_durations, legacy_found = timed(legacy_search_users, legacy_inputs)
+            _, current_found = timed(UserService.search_users, legacy_inputs)
+            for (query, _), legacy_users, current_users in zip(legacy_inputs, legacy_found, current_found):
+                if len(current_users) < len(legacy_users):
+                    raise SystemExit(f"{query!r}: 예전 검색보다 결과가 적습니다 ({len(current_users)} < {len(legacy_users)})")
+            results["legacy_ilike"] = summarize(legacy_durations)
+            print(f"  {'legacy_ilike':<14} {json.dumps(results['legacy_ilike'])}")
+
+            plans = query_plans()
+            for name, plan in plans.items():
+                print(f"  plan {name:<12} {' / '.join(plan)}")
+
+            db.session.remove()
+            db.engine.dispose()
+            db_bytes = sum(os.path.getsize(os.path.join(workdir, name)) for name in os.listdir(workdir) if name.startswith("bench.db"))
+
+    report = {
+        "benchmark": "user_search",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "params": {key: value for key, value in vars(args).items() if key != "output"},
+        "setup_seconds": {"populate": round(populate_seconds, 1)},
+        "db_bytes": db_bytes,
+        "query_plans": plans,
+        "empty_results": empty,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
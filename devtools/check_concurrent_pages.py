@@ -0,0 +1,96 @@
+"""플레이리스트 페이지 동시 조회 속도 검사 (순차 조회 vs 동시 조회)
+
+로컬 Spotify 대역 서버(devtools.fake_spotify)를 별도 프로세스로 띄워 페이지마다 지연을 주고,
+PlatformAdapter.get_playlists를 concurrency=1(순차)과 여러 동시 요청 수로 호출해 벽시계
+시간을 잼. 결과 목록이 순차 조회와 순서까지 같은지 확인하고, 기본 동시 요청 수
+(PLATFORM_FETCH_CONCURRENCY)의 속도 향상이 --min-speedup보다 작으면 종료 코드 1로 끝남
+
+    python -m devtools.check_concurrent_pages
+    python -m devtools.check_concurrent_pages --playlists 1000 --latency 0.05 --concurrency 1,2,4,8
+"""
+import argparse
+import sys
+import tempfile
+import time
+
+import requests
+
+from devtools.bench_playlist_sync import configure, percentile
+from devtools.fake_spotify import start_in_process
+
+
+FAKE_USER = "pages-user"
+
+
+def fetch_all(adapter, access_token, concurrency):
+    """get_playlists 한 번의 (소요 시간(초), 플레이리스트 ID 목록)"""
+    started = time.perf_counter()
+    playlists = adapter.get_playlists(access_token, concurrency=concurrency)
+    return time.perf_counter() - started, [playlist["id"] for playlist in playlists]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="플레이리스트 페이지 동시 조회 속도 검사")
+    parser.add_argument("--playlists", type=int, default=1000, help="대역 서버의 플레이리스트 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="대역 서버 요청당 지연(초)")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="쉼표로 구분한 동시 요청 수 (1은 순차 조회)")
+    parser.add_argument("--rounds", type=int, default=3, help="동시 요청 수별 반복 횟수 (p50 사용)")
+    parser.add_argument("--min-speedup", type=float, default=2.0, help="기본 동시 요청 수에서 요구하는 최소 속도 향상")
+    args = parser.parse_args()
+
+    levels = sorted({int(level) for level in args.concurrency.split(",") if level.strip()} | {1})
+    fake_process, api_base = start_in_process(playlists=args.playlists, latency=args.latency)
+    try:
+        with tempfile.TemporaryDirectory(prefix="vibe-pages-") as workdir:
+            #레이트 리미터는 해제하고 응답 캐시는 꺼서 매번 실제로 모든 페이지를 요청함
+            options = argparse.Namespace(no_cache=True, no_tracks=True, rate_limit=0)
+            config = configure(workdir, api_base, options)
+            from vibeapp import create_app
+            from vibeapp.services.platform_adapter import get_adapter
+
+            app = create_app()
+            with app.app_context():
+                token = requests.post(
+                    config.PLATFORM_OAUTH["spotify"]["TOKEN_URL"],
+                    data={"grant_type": "authorization_code", "code": FAKE_USER},
+                    timeout=10,
+                ).json()["access_token"]
+                adapter = get_adapter("spotify")
+                default_level = adapter.fetch_concurrency
+                levels = sorted(set(levels) | {default_level})
+                pages = -(-args.playlists // adapter.PLAYLIST_PAGE_SIZE)
+                print(f"플레이리스트 {args.playlists}개 ({pages}페이지), 페이지당 지연 {args.latency * 1000:.0f}ms")
+
+                timings = {}
+                expected = None
+                for level in levels:
+                    durations = []
+                    for _ in range(args.rounds):
+                        duration, playlist_ids = fetch_all(adapter, token, level)
+                        if expected is None:
+                            expected = playlist_ids
+                        elif playlist_ids != expected:
+                            raise SystemExit(f"concurrency={level}: 순차 조회와 결과(순서 포함)가 다릅니다")
+                        durations.append(duration)
+                    timings[level] = percentile(sorted(durations), 50)
+
+        if len(expected) != args.playlists:
+            raise SystemExit(f"플레이리스트 {len(expected)}개만 받았습니다 (기대 {args.playlists}개)")
+    finally:
+        fake_process.terminate()
+
+    sequential = timings[1]
+    for level in levels:
+        marker = "  <- 기본값" if level == default_level else ""
+        label = "순차" if level == 1 else f"동시 {level}"
+        print(f"  {label:<8} p50 {timings[level] * 1000:>8.1f}ms  ({sequential / timings[level]:.1f}x){marker}")
+
+    speedup = sequential / timings[default_level]
+    if speedup < args.min_speedup:
+        print(f"기본 동시 요청 수({default_level})의 속도 향상 {speedup:.1f}x가 기준 {args.min_speedup:.1f}x보다 작습니다.")
+        sys.exit(1)
+    print(f"기본 동시 요청 수({default_level})에서 순차 조회보다 {speedup:.1f}배 빠릅니다.")
+
+
+if __name__ == "__main__":
+    main()
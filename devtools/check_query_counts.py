@@ -0,0 +1,149 @@
+"""소셜 엔드포인트의 요청당 SQL 문 수 검사 (N+1 쿼리 확인)
+
+임시 SQLite DB에 목록 길이만 다른 두 사용자(작은 쪽/큰 쪽)를 만들고, 같은 엔드포인트를
+각 사용자로 요청하면서 QueryCounter로 요청당 실행된 SQL 문 수를 셈. 응답 행 수가 늘었는데
+쿼리 수도 늘어난 엔드포인트가 있으면 종료 코드 1로 끝남 (로딩 옵션은 vibeapp/models/loader_profiles.py)
+
+    python -m devtools.check_query_counts
+    python -m devtools.check_query_counts --small 2 --large 15 -v
+"""
+import argparse
+import random
+import sys
+import tempfile
+
+from devtools.bench_friend_edges import configure
+from vibeapp.utils.query_counter import QueryCounter
+
+
+#(이름, URL 템플릿) - 템플릿 값은 seed()가 만든 시나리오 dict에서 채움
+ENDPOINTS = [
+    ("social.main", "/social"),
+    ("api.friends", "/api/friends?limit=50"),
+    ("api.friend_requests", "/api/friend-requests?limit=50"),
+    ("api.sent_requests", "/api/sent-requests?limit=50"),
+    ("api.mutual_friends", "/api/users/{target_id}/mutual-friends?limit=50"),
+    ("api.recommendations", "/api/recommendations?limit=50"),
+    ("api.search_users", "/api/search-users?q={search}"),
+    ("api.connection", "/api/users/{target_id}/connection"),
+    ("api.network", "/api/network?hops=3"),
+    ("social.user_profile", "/user/{target_username}"),
+    ("public.home", "/"),
+]
+
+PLATFORMS = ["spotify", "youtube"]
+
+
+def seed(tag, size, rng):
+    """목록마다 size개 항목을 가진 사용자 한 명과 주변 사용자들을 만듦
+
+    친구 size명(모두 target과도 친구라 target과의 공통 친구는 size - 1명), 받은 신청 size건,
+    보낸 신청 size건, 친구마다 추천 후보가 되는 친구의 친구 한 명씩. 모든 사용자는
+    플랫폼 연결을 1~2개 가짐
+    """
+    from vibeapp.extensions import db
+    from vibeapp.models import Friend, PlatformConnection, PlatformToken, User
+
+    def make_user(name):
+        user = User(username=f"{tag}{name}", display_name=name)
+        db.session.add(user)
+        for platform in rng.sample(PLATFORMS, rng.randint(1, len(PLATFORMS))):
+            token = PlatformToken(access_token="token")
+            db.session.add(PlatformConnection(platform=platform, platform_user_id=f"{tag}{name}-{platform}", user=user, token=token))
+        return user
+
+    def befriend(user1, user2):
+        friend_request = Friend.create_request(user1.id, user2.id)
+        db.session.flush()
+        friend_request.accept()
+
+    viewer = make_user("viewer")
+    friends = [make_user(f"friend{i}") for i in range(size)]
+    requesters = [make_user(f"requester{i}") for i in range(size)]
+    receivers = [make_user(f"receiver{i}") for i in range(size)]
+    candidates = [make_user(f"candidate{i}") for i in range(size)]
+    db.session.flush()
+
+    target = friends[0]
+    for friend, candidate in zip(friends, candidates):
+        befriend(viewer, friend)
+        befriend(friend, candidate)
+        if friend is not target:
+            befriend(friend, target)
+    for requester in requesters:
+        Friend.create_request(requester.id, viewer.id)
+    for receiver in receivers:
+        Friend.create_request(viewer.id, receiver.id)
+    db.session.commit()
+    return {
+        "viewer_id": viewer.id,
+        "target_id": target.id,
+        "target_username": target.username,
+        "search": f"{tag}friend",
+    }
+
+
+def count_queries(app, scenario, url, verbose):
+    from vibeapp.extensions import db
+
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session["user"] = {"id": scenario["viewer_id"]}
+        session["_user_id"] = str(scenario["viewer_id"])
+    #이전 요청에서 읽은 객체가 남아 조회가 생략되지 않도록 비움
+    db.session.remove()
+    with QueryCounter(db.engine) as counter:
+        response = client.get(url)
+    if response.status_code != 200:
+        raise SystemExit(f"{url}: HTTP {response.status_code}")
+    if verbose:
+        for statement, _, _ in counter.statements:
+            print(f"      {' '.join(statement.split())[:140]}")
+    return counter.count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드포인트별 SQL 문 수 검사")
+    parser.add_argument("--small", type=int, default=3, help="작은 쪽 사용자의 목록 길이")
+    parser.add_argument("--large", type=int, default=9, help="큰 쪽 사용자의 목록 길이 (검색 결과 최대 10명 이하로)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-v", "--verbose", action="store_true", help="요청마다 실행된 SQL 출력")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix="vibe-queries-") as workdir:
+        configure(workdir)
+        from vibeapp import create_app
+        from vibeapp.extensions import db
+        from vibeapp.services.recommendation_service import RecommendationService
+
+        app = create_app()
+        with app.app_context():
+            db.create_all()
+            small = seed("s", args.small, rng)
+            large = seed("l", args.large, rng)
+            RecommendationService.rebuild()
+            db.session.commit()
+
+            failures = 0
+            for name, template in ENDPOINTS:
+                if args.verbose:
+                    print(f"  {name}")
+                small_count = count_queries(app, small, template.format(**small), args.verbose)
+                large_count = count_queries(app, large, template.format(**large), args.verbose)
+                status = "FAIL" if large_count > small_count else "ok"
+                print(f"{status:<4} {name:<22} {small_count:>3} queries ({args.small} rows) / {large_count:>3} queries ({args.large} rows)")
+                failures += large_count > small_count
+
+            #검사 중 만들어진 연결이 임시 디렉터리 삭제를 막지 않도록 정리
+            db.session.remove()
+            db.engine.dispose()
+
+    if failures:
+        print(f"{failures}개 엔드포인트의 쿼리 수가 응답 행 수에 따라 늘어납니다.")
+        sys.exit(1)
+    print("모든 엔드포인트의 쿼리 수가 응답 행 수와 관계없이 일정합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""소셜/플레이리스트 주요 쿼리의 실행 계획 검사
+
+임시 SQLite DB를 채운 뒤 Friend, User, UserService/FriendService, Playlist의 조회 메서드를
+실제로 호출하면서 실행된 SQL을 모두 기록하고, 같은 SQL/파라미터로 EXPLAIN QUERY PLAN을
+돌려 전체 테이블 스캔(SCAN)이 있으면 종료 코드 1로 끝남 (CI/배포 전 확인용)
+
+    python -m devtools.check_query_plans
+    python -m devtools.check_query_plans --users 20000 --friendships 400000 --analyze -v
+"""
+import argparse
+import os
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+
+from devtools.bench_friend_edges import configure, populate
+from vibeapp.utils.query_counter import QueryCounter
+
+
+#SCAN CONSTANT ROW(S), 서브쿼리 결과 SCAN, FTS5 MATCH 조회(VIRTUAL TABLE INDEX n:M...)는 테이블 스캔이 아님
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW|\d+ CONSTANT ROWS|\(subquery|\S+ VIRTUAL TABLE INDEX \d+:M)(\S+)")
+TEMP_SORT = "USE TEMP B-TREE FOR ORDER BY"
+
+
+class Case:
+    """검사할 쿼리 하나
+
+    Args:
+        run: 샘플 ID dict를 받아 검사 대상 메서드를 호출하는 함수
+        allow_scans: 스캔을 허용하는 테이블 (이유를 함께 적어 둘 것)
+        ordered: True면 ORDER BY를 임시 B-tree 정렬로 처리하는 것도 실패로 봄
+    """
+
+    def __init__(self, name, run, allow_scans=(), ordered=False):
+        self.name = name
+        self.run = run
+        self.allow_scans = set(allow_scans)
+        self.ordered = ordered
+
+
+def build_cases():
+    from vibeapp.extensions import db
+    from vibeapp.models import Friend, Playlist, User
+    from vibeapp.services.recommendation_service import RecommendationService
+    from vibeapp.services.user_services import FriendService, UserService
+
+    def user(ids):
+        return db.session.get(User, ids["user"])
+
+    def second_page(get_page, user_id):
+        _, cursor = get_page(user_id, None, 1)
+        return get_page(user_id, cursor, 1)
+
+    return [
+        Case("Friend.are_friends", lambda ids: Friend.are_friends(ids["user"], ids["friend"])),
+        Case("Friend.get_friendship", lambda ids: Friend.get_friendship(ids["user"], ids["friend"])),
+        Case("Friend.get_pending_request", lambda ids: Friend.get_pending_request(ids["requester"], ids["user"])),
+        Case("Friend.has_pending_request", lambda ids: Friend.has_pending_request(ids["user"], ids["requester"])),
+        Case("Friend.get_friends_for_user", lambda ids: Friend.get_friends_for_user(ids["user"])),
+        Case("User.get_friends", lambda ids: user(ids).get_friends()),
+        Case("User.friends", lambda ids: user(ids).friends.all()),
+        Case("User.get_pending_friend_requests_count", lambda ids: user(ids).get_pending_friend_requests_count()),
+        Case("User.get_pending_received_requests", lambda ids: user(ids).get_pending_received_requests()),
+        Case("User.is_friend_with", lambda ids: user(ids).is_friend_with(ids["friend"])),
+        Case("User.has_pending_request_from", lambda ids: user(ids).has_pending_request_from(ids["requester"])),
+        Case("User.has_sent_request_to", lambda ids: user(ids).has_sent_request_to(ids["receiver"])),
+        Case("User.find_by_username", lambda ids: User.find_by_username(ids["username"])),
+        Case("User.search_by_username", lambda ids: User.search_by_username("user12")),
+        Case("User.to_dict", lambda ids: user(ids).to_dict(include_private=True)),
+        Case("UserService.search_users", lambda ids: UserService.search_users("user12", ids["user"])),
+        #세 글자 미만은 trigram을 못 쓰므로 부분 일치를 user LIKE로 훑음 (limit개를 찾으면 멈추는 스캔)
+        Case(
+            "UserService.search_users (short)",
+            lambda ids: UserService.search_users("us", ids["user"]),
+            allow_scans={"user"},
+        ),
+        Case(
+            "UserService.get_user_relationship_info",
+            lambda ids: UserService.get_user_relationship_info(db.session.get(User, ids["requester"]), ids["user"]),
+        ),
+        Case(
+            "UserService.get_users_relationship_info",
+            lambda ids: UserService.get_users_relationship_info(
+                UserService.search_users("user1", ids["user"]), ids["user"]
+            ),
+        ),
+        #커서 페이지는 첫 페이지의 next_cursor로 두 번째 페이지까지 조회 (정렬도 인덱스로 처리돼야 함)
+        Case("Friend.get_friends_page", lambda ids: second_page(Friend.get_friends_page, ids["user"]), ordered=True),
+        Case(
+            "Friend.get_received_requests_page",
+            lambda ids: second_page(Friend.get_received_requests_page, ids["user"]),
+            ordered=True,
+        ),
+        Case("Friend.get_sent_requests_page", lambda ids: second_page(Friend.get_sent_requests_page, ids["user"]), ordered=True),
+        Case("FriendService.get_friends_list", lambda ids: FriendService.get_friends_list(ids["user"]), ordered=True),
+        Case("FriendService.get_pending_requests", lambda ids: FriendService.get_pending_requests(ids["user"]), ordered=True),
+        Case("FriendService.get_sent_requests", lambda ids: FriendService.get_sent_requests(ids["user"]), ordered=True),
+        Case(
+            "RecommendationService.get_recommendations",
+            lambda ids: RecommendationService.get_recommendations(ids["user"], 10, 10),
+            ordered=True,
+        ),
+        Case("Playlist.get_for_owner", lambda ids: Playlist.get_for_owner("spotify", ids["platform_user_id"]), ordered=True),
+    ]
+
+
+def populate_playlists(db_path, users, playlists_per_user, seed):
+    """사용자마다 Spotify 연결 하나와 플레이리스트 playlists_per_user개를 만듦"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO platform_token (id, access_token) VALUES (?, ?)",
+            ((i, f"token-{i}") for i in range(1, users + 1)),
+        )
+        conn.executemany(
+            "INSERT INTO platform_connection (id, platform, platform_user_id, sync_generation, sync_in_progress, user_id, token_id) "
+            "VALUES (?, 'spotify', ?, 0, 0, ?, ?)",
+            ((i, f"sp-{i}", i, i) for i in range(1, users + 1)),
+        )
+        conn.executemany(
+            "INSERT INTO playlist (external_id, name, is_public, platform, platform_user_id, spotify_id, sync_generation, platform_connection_id) "
+            "VALUES (?, ?, 1, 'spotify', ?, ?, 0, ?)",
+            (
+                (f"sp-{i}-{n}", f"playlist {rng.randint(0, 10**6)}", f"sp-{i}", f"sp-{i}-{n}", i)
+                for i in range(1, users + 1) for n in range(playlists_per_user)
+            ),
+        )
+    conn.close()
+
+
+def sample_ids(users):
+    """검사에 쓸 사용자 ID (친구, 받은/보낸 대기중 신청이 모두 있는 사용자)"""
+    from vibeapp.extensions import db
+    from vibeapp.models import Friend, FriendEdge
+
+    for user_id in range(1, users + 1):
+        friend_ids = FriendEdge.friend_ids(user_id)
+        received = Friend.query.filter_by(receiver_id=user_id, status="pending").first()
+        sent = Friend.query.filter_by(requester_id=user_id, status="pending").first()
+        if friend_ids and received and sent:
+            ids = {
+                "user": user_id,
+                "friend": friend_ids[0],
+                "requester": received.requester_id,
+                "receiver": sent.receiver_id,
+                "username": f"user{user_id}",
+                "platform_user_id": f"sp-{user_id}",
+            }
+            db.session.expunge_all()
+            return ids
+    raise SystemExit("친구와 대기중 신청이 모두 있는 사용자가 없습니다. --friendships를 늘려주세요.")
+
+
+def explain(connection, statement, parameters):
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return [row[3] for row in rows]
+
+
+def check_case(case, ids, verbose):
+    """case를 실행하며 나온 SQL들의 실행 계획을 검사해 문제 목록 반환"""
+    from vibeapp.extensions import db
+
+    #식별자 맵에 남은 객체 때문에 지연 로딩/조회가 생략되지 않도록 매번 비움
+    db.session.expunge_all()
+    try:
+        with QueryCounter(db.engine) as counter:
+            case.run(ids)
+    finally:
+        db.session.rollback()
+    statements = counter.selects()
+
+    problems = []
+    with db.engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = explain(connection, statement, parameters)
+            if verbose:
+                print(f"    {' '.join(statement.split())[:160]}")
+                print(f"      -> {' / '.join(plan)}")
+            for detail in plan:
+                match = FULL_SCAN.match(detail)
+                if match and match.group(1) not in case.allow_scans:
+                    problems.append(f"{detail}  <- {' '.join(statement.split())[:120]}")
+                elif case.ordered and detail == TEMP_SORT:
+                    problems.append(f"{detail}  <- {' '.join(statement.split())[:120]}")
+    return len(statements), problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주요 쿼리 실행 계획 검사")
+    parser.add_argument("--users", type=int, default=2000, help="사용자 수")
+    parser.add_argument("--friendships", type=int, default=40_000, help="친구 신청 수")
+    parser.add_argument("--pending-ratio", type=float, default=0.1, help="대기중 신청 비율")
+    parser.add_argument("--playlists", type=int, default=10, help="사용자당 플레이리스트 수")
+    parser.add_argument("--analyze", action="store_true", help="검사 전에 ANALYZE로 통계 수집")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-v", "--verbose", action="store_true", help="모든 쿼리와 실행 계획 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="vibe-plans-") as workdir:
+        db_path = configure(workdir)
+        from vibeapp import create_app
+        from vibeapp.extensions import db
+        from vibeapp.models import FriendEdge
+        from vibeapp.services.recommendation_service import RecommendationService
+
+        app = create_app()
+        with app.app_context():
+            db.create_all()
+            populate(db_path, args.users, args.friendships, args.pending_ratio, args.seed)
+            populate_playlists(db_path, args.users, args.playlists, args.seed)
+            FriendEdge.rebuild()
+            RecommendationService.rebuild()
+            db.session.commit()
+            if args.analyze:
+                db.session.execute(db.text("ANALYZE"))
+                db.session.commit()
+
+            ids = sample_ids(args.users)
+            failures = 0
+            for case in build_cases():
+                if args.verbose:
+                    print(f"  {case.name}")
+                count, problems = check_case(case, ids, args.verbose)
+                status = "FAIL" if problems else "ok"
+                print(f"{status:<4} {case.name} ({count} queries)")
+                for problem in problems:
+                    print(f"       {problem}")
+                failures += bool(problems)
+
+            #검사 중 만들어진 연결이 임시 디렉터리 삭제를 막지 않도록 정리
+            db.session.remove()
+            db.engine.dispose()
+
+    if failures:
+        print(f"{failures}개 항목에서 전체 테이블 스캔이 발견됐습니다.")
+        sys.exit(1)
+    print("모든 쿼리가 인덱스를 사용합니다.")
+
+
+if __name__ == "__main__":
+    main()
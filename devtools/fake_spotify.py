@@ -0,0 +1,307 @@
+"""로컬 Spotify Web API 대역 서버
+
+SpotifyService와 callback_platform이 사용하는 엔드포인트만 흉내냄
+(authorize, api/token, /me, /me/playlists, /playlists/{id}/tracks, /search)
+
+    python -m devtools.fake_spotify --port 8765 --playlists 2000 --latency 0.05 --error-429 0.01
+
+앱을 대역 서버에 붙여 실행하려면:
+
+    SPOTIFY_API_BASE=http://127.0.0.1:8765/v1 SPOTIFY_ACCOUNTS_BASE=http://127.0.0.1:8765 flask run
+
+- 라이브러리 크기, 지연 시간, 페이지 최대 크기, 429/5xx 주입 비율을 설정할 수 있음
+- 실행 중 설정 변경: POST /_fake/config (JSON), 요청 통계: GET /_fake/stats
+- 응답에 ETag를 붙이고 If-None-Match가 같으면 304 반환
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+
+DEFAULT_SETTINGS = {
+    "playlists": 200,  # 사용자당 플레이리스트 수
+    "tracks": 30,  # 플레이리스트당 트랙 수
+    "track_pool": 20000,  # 전체 트랙 종류 수 (플레이리스트끼리 트랙을 공유하도록)
+    "playlist_page_max": 50,  # /me/playlists 최대 limit
+    "track_page_max": 100,  # /playlists/{id}/tracks 최대 limit
+    "latency": 0.0,  # 요청당 기본 지연(초)
+    "jitter": 0.0,  # 기본 지연에 더해지는 0~jitter초 무작위 지연
+    "error_429": 0.0,  # 429 응답 비율
+    "error_5xx": 0.0,  # 500/502/503 응답 비율
+    "retry_after": 1,  # 429 응답의 Retry-After(초)
+    "snapshot_version": 1,  # 바꾸면 모든 플레이리스트의 snapshot_id가 바뀜
+    "changed_playlists": 0,  # 앞에서부터 이 개수만큼 snapshot_id를 한 세대 더 올림
+    "expires_in": 3600,  # 발급하는 액세스 토큰 유효 시간(초)
+    "seed": 0,
+}
+
+PLAYLIST_TRACKS_PATH = re.compile(r"^/v1/playlists/(?P<playlist_id>[^/]+)/tracks$")
+
+
+class FakeSpotify:
+    """대역 서버 상태 (설정, 발급한 토큰, 통계)"""
+
+    def __init__(self, **settings):
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+        self.random = random.Random(self.settings["seed"])
+        self.lock = threading.Lock()
+        self.tokens = {}  # 액세스 토큰 -> 사용자 ID
+        self.token_count = 0
+        self.stats = {}
+
+    def record(self, key):
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def issue_token(self, user_id):
+        with self.lock:
+            self.token_count += 1
+            access_token = f"fake.{user_id}.{self.token_count}"
+            self.tokens[access_token] = user_id
+        return {
+            "access_token": access_token,
+            "token_type": "Bearer",
+            "expires_in": self.settings["expires_in"],
+            "refresh_token": f"refresh.{user_id}",
+            "scope": "playlist-read-private",
+        }
+
+    def user_for(self, authorization):
+        """Authorization 헤더의 토큰으로 사용자 ID 찾기 (대역 서버 재시작 후에도 토큰 형식으로 복원)"""
+        if not authorization or not authorization.startswith("Bearer "):
+            return None
+        access_token = authorization[len("Bearer "):]
+        user_id = self.tokens.get(access_token)
+        if user_id is None and access_token.startswith("fake."):
+            user_id = access_token.split(".")[1]
+        return user_id
+
+    def injected_error(self):
+        """설정된 지연만큼 기다린 뒤 설정된 비율로 주입할 오류 상태 코드 반환 (없으면 None)"""
+        with self.lock:
+            delay = self.settings["latency"] + self.random.uniform(0, self.settings["jitter"])
+            roll = self.random.random()
+            status = None
+            if roll < self.settings["error_429"]:
+                status = 429
+            elif roll < self.settings["error_429"] + self.settings["error_5xx"]:
+                status = self.random.choice((500, 502, 503))
+        time.sleep(delay)
+        return status
+
+    def playlist(self, user_id, index):
+        settings = self.settings
+        version = settings["snapshot_version"] + (1 if index < settings["changed_playlists"] else 0)
+        return {
+            "id": f"{user_id}-pl{index:06d}",
+            "name": f"Playlist {index}",
+            "public": index % 3 != 0,
+            "snapshot_id": f"snap-{version}-{index}",
+            "tracks": {"total": settings["tracks"]},
+            "owner": {"id": user_id},
+        }
+
+    def track(self, playlist_index, position):
+        number = (playlist_index * 31 + position) % self.settings["track_pool"]
+        return {
+            "id": f"tr{number:07d}",
+            "type": "track",
+            "is_local": False,
+            "name": f"Song {number}",
+            "duration_ms": 180000 + number % 60000,
+            "external_ids": {"isrc": f"FAKE{number:08d}"},
+            "album": {"name": f"Album {number // 10}"},
+            "artists": [{"name": f"Artist {number % 500}"}],
+        }
+
+
+class FakeSpotifyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fake = None  # make_server()에서 FakeSpotify 인스턴스로 설정
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        if url.path == "/authorize":
+            #로그인 화면 없이 바로 콜백으로 (?user=로 사용자 지정)
+            params = {"code": query.get("user", "fake-user"), "state": query.get("state", "")}
+            self.send_response(302)
+            self.send_header("Location", f"{query.get('redirect_uri', '/')}?{urlencode(params)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if url.path == "/_fake/stats":
+            with self.fake.lock:
+                payload = {"settings": dict(self.fake.settings), "stats": dict(self.fake.stats)}
+            return self.send_json(200, payload)
+
+        user_id = self.fake.user_for(self.headers.get("Authorization"))
+        if user_id is None:
+            return self.send_json(401, {"error": {"status": 401, "message": "No token provided"}})
+
+        status = self.fake.injected_error()
+        if status is not None:
+            return self.send_error_status(status)
+
+        if url.path == "/v1/me":
+            self.fake.record("me")
+            return self.send_json(200, {"id": user_id, "display_name": user_id, "email": f"{user_id}@example.com"})
+        if url.path == "/v1/me/playlists":
+            self.fake.record("playlists")
+            return self.send_page(
+                url.path, query, self.fake.settings["playlists"], self.fake.settings["playlist_page_max"],
+                lambda index: self.fake.playlist(user_id, index),
+            )
+
+        match = PLAYLIST_TRACKS_PATH.match(url.path)
+        if match:
+            self.fake.record("playlist_tracks")
+            playlist_id = match.group("playlist_id")
+            playlist_index = int(playlist_id.rsplit("-pl", 1)[-1]) if "-pl" in playlist_id else 0
+            return self.send_page(
+                url.path, query, self.fake.settings["tracks"], self.fake.settings["track_page_max"],
+                lambda position: {"track": self.fake.track(playlist_index, position)},
+            )
+
+        if url.path == "/v1/search":
+            self.fake.record("search")
+            number = int(hashlib.md5(query.get("q", "").encode()).hexdigest(), 16) % self.fake.settings["track_pool"]
+            track = self.fake.track(0, number)
+            return self.send_json(200, {"tracks": {"items": [track], "total": 1, "limit": 1, "offset": 0}})
+
+        self.send_json(404, {"error": {"status": 404, "message": "Not found"}})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode() if length else ""
+
+        if url.path == "/_fake/config":
+            with self.fake.lock:
+                self.fake.settings.update(json.loads(body or "{}"))
+                settings = dict(self.fake.settings)
+            return self.send_json(200, settings)
+
+        if url.path == "/api/token":
+            form = {key: values[0] for key, values in parse_qs(body).items()}
+            status = self.fake.injected_error()
+            if status is not None:
+                return self.send_error_status(status)
+
+            self.fake.record("token")
+            grant_type = form.get("grant_type")
+            if grant_type == "authorization_code":
+                user_id = form.get("code") or "fake-user"
+            elif grant_type == "refresh_token" and form.get("refresh_token", "").startswith("refresh."):
+                user_id = form["refresh_token"].split(".", 1)[1]
+            else:
+                return self.send_json(400, {"error": "invalid_grant"})
+            return self.send_json(200, self.fake.issue_token(user_id))
+
+        self.send_json(404, {"error": {"status": 404, "message": "Not found"}})
+
+    def send_page(self, path, query, total, page_max, make_item):
+        limit = max(1, min(int(query.get("limit", 20)), page_max))
+        offset = max(0, int(query.get("offset", 0)))
+        items = [make_item(index) for index in range(offset, min(offset + limit, total))]
+
+        base = f"http://{self.headers.get('Host')}{path}"
+        next_query = dict(query, limit=limit, offset=offset + limit)
+        self.send_json(200, {
+            "href": f"{base}?{urlencode(dict(query, limit=limit, offset=offset))}",
+            "items": items,
+            "limit": limit,
+            "offset": offset,
+            "total": total,
+            "next": f"{base}?{urlencode(next_query)}" if offset + limit < total else None,
+            "previous": None,
+        })
+
+    def send_error_status(self, status):
+        self.fake.record(f"injected_{status}")
+        headers = {"Retry-After": str(self.fake.settings["retry_after"])} if status == 429 else {}
+        self.send_json(status, {"error": {"status": status, "message": "Injected error"}}, headers)
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if status == 200 and self.command == "GET" and self.headers.get("If-None-Match") == etag:
+            self.fake.record("not_modified")
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 200:
+            self.send_header("ETag", etag)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_server(host="127.0.0.1", port=0, **settings):
+    """대역 서버 생성 (serve_forever는 호출한 쪽에서)"""
+    handler = type("Handler", (FakeSpotifyHandler,), {"fake": FakeSpotify(**settings)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(**settings):
+    """같은 프로세스의 스레드에서 대역 서버 실행, (server, base_url) 반환"""
+    server = make_server(**settings)
+    threading.Thread(target=server.serve_forever, name="fake-spotify", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def _serve_process(port_queue, settings):
+    server = make_server(**settings)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def start_in_process(**settings):
+    """별도 프로세스에서 대역 서버 실행 (측정 대상과 GIL을 나눠 쓰지 않도록), (process, base_url) 반환"""
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve_process, args=(port_queue, settings), daemon=True)
+    process.start()
+    return process, f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Spotify Web API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    for key, default in DEFAULT_SETTINGS.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", dest=key, type=type(default), default=default)
+    args = vars(parser.parse_args())
+
+    host, port = args.pop("host"), args.pop("port")
+    server = make_server(host, port, **args)
+    print(f"fake spotify: http://{host}:{server.server_port}")
+    print(f"  SPOTIFY_API_BASE=http://{host}:{server.server_port}/v1")
+    print(f"  SPOTIFY_ACCOUNTS_BASE=http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import os
+
 from flask import Flask, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
@@ -7,6 +9,10 @@ from zoneinfo import ZoneInfo
 
 from vibeapp.extensions import db, migrate, login_manager
 from vibeapp.config import Config
+from vibeapp.models.friend_edge import FriendEdge
+from vibeapp.models.user import User
+from vibeapp.models.user_search import UserSearch
+from vibeapp.utils.db_utils import add_missing_columns
 
 #errorhandler import
 from vibeapp.exceptions import PlaylistFetchError, TokenRefreshError, UnsupportedPlatformError, FriendRequestError
@@ -15,6 +21,16 @@ from vibeapp.exceptions import PlaylistFetchError, TokenRefreshError, Unsupporte
 #Blueprint import
 from vibeapp.routes import register_routes
 
+#CLI 명령 import
+from vibeapp.commands import register_commands
+
+from vibeapp.services.sync_queue import sync_queue
+from vibeapp.services.rate_limiter import rate_limiter
+from vibeapp.services.response_cache import response_cache
+from vibeapp.services.token_manager import token_manager
+from vibeapp.services.friend_graph import friend_graph
+from vibeapp.services.recommendation_service import RecommendationService
+
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
@@ -24,12 +40,54 @@ def create_app():
     
     login_manager.init_app(app)
     login_manager.login_view = "public.home"
+    
+    sync_queue.init_app(app)
+    rate_limiter.init_app(app)
+    response_cache.init_app(app)
+    token_manager.init_app(app)
+    friend_graph.init_app(app)
 
     # Blueprint 등록
     register_routes(app)
     
+    # CLI 명령 등록
+    register_commands(app)
+    
     with app.app_context():
         db.create_all() # DB 테이블 생성
+        #create_all은 이미 있는 테이블에 새 컬럼을 추가하지 않으므로 빠진 컬럼은 따로 추가함
+        #(없으면 그 모델의 조회가 전부 실패함)
+        added_columns = add_missing_columns(db.engine, db.metadata)
+        for table_name, column_names in added_columns.items():
+            app.logger.info("%s 테이블에 컬럼 추가: %s", table_name, ", ".join(column_names))
+        #friend_edge 도입 전 DB면 create_all이 빈 테이블만 만들었으므로 수락된 친구 관계로 채움
+        #(친구 목록/친구 여부/추천/그래프와 친구 수 카운터가 모두 friend_edge를 읽으므로 가장 먼저)
+        edges_filled = FriendEdge.is_missing()
+        if edges_filled:
+            edges = FriendEdge.rebuild()
+            recommendations = RecommendationService.rebuild()["recommendations"]
+            db.session.commit()
+            if os.path.exists(friend_graph.snapshot_path):
+                friend_graph.rebuild_snapshot()
+                db.session.commit()
+            app.logger.info("friend_edge 채움: 친구 관계 %d건 (추천 %d개 계산)", edges // 2, recommendations)
+        #새로 추가된 친구 카운터 컬럼은 기본값 0 대신 실제 값으로 채움. friend_edge를 방금 채웠다면
+        #이전 실행에서 빈 friend_edge로 센 친구 수(0)가 남아 있을 수 있으므로 다시 계산
+        missing_counters = [name for name in added_columns.get(User.__tablename__, []) if name in User.actual_counters()]
+        if missing_counters or edges_filled:
+            repaired = User.repair_counters()
+            db.session.commit()
+            app.logger.info("친구 카운터 값 채움: %s (사용자 %d명)", ", ".join(missing_counters or User.actual_counters()), repaired)
+        #create_all은 이미 있는 테이블에 새로 추가된 인덱스는 만들지 않으므로 따로 확인
+        #(checkfirst의 리플렉션은 식 인덱스를 못 읽으므로 sqlite_master의 이름으로 확인)
+        with db.engine.connect() as conn:
+            existing_indexes = set(conn.scalars(db.text("SELECT name FROM sqlite_master WHERE type = 'index'")))
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    index.create(db.engine)
+        #사용자 검색용 FTS5 가상 테이블과 동기화 트리거는 모델 메타데이터 밖에 있으므로 따로 만듦
+        UserSearch.create(db.engine)
         
         
     @app.errorhandler(TokenRefreshError)
@@ -0,0 +1,13 @@
+from .sync_commands import sync_all
+from .friend_commands import rebuild_friend_edges, rebuild_friend_graph, rebuild_recommendations, repair_social_counters
+from .track_commands import rebuild_track_match_keys
+from .user_commands import rebuild_user_search
+
+def register_commands(app):
+    app.cli.add_command(sync_all)
+    app.cli.add_command(rebuild_friend_edges)
+    app.cli.add_command(rebuild_friend_graph)
+    app.cli.add_command(rebuild_recommendations)
+    app.cli.add_command(repair_social_counters)
+    app.cli.add_command(rebuild_track_match_keys)
+    app.cli.add_command(rebuild_user_search)
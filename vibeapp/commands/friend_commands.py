@@ -0,0 +1,92 @@
+import click
+from flask.cli import with_appcontext
+
+from vibeapp.extensions import db
+from vibeapp.models.friend_edge import FriendEdge
+from vibeapp.models.user import User
+from vibeapp.services.friend_graph import friend_graph
+from vibeapp.services.recommendation_service import RecommendationService
+
+
+@click.command("rebuild-friend-edges")
+@with_appcontext
+def rebuild_friend_edges():
+    """수락된 친구 신청(Friend)으로 friend_edge 테이블을 다시 만듦 (최초 배포/불일치 복구용)"""
+    before = db.session.scalar(db.select(db.func.count()).select_from(FriendEdge))
+    try:
+        after = FriendEdge.rebuild()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    click.echo(f"friend_edge 재생성 완료: {before}개 → {after}개 (친구 관계 {after // 2}건)")
+    if before != after:
+        click.echo("친구 수 카운터도 어긋났을 수 있으니 `flask repair-social-counters`를 실행하세요.")
+    #재생성은 변경 로그를 남기지 않으므로 그래프 스냅샷도 새로 만듦
+    _rebuild_friend_graph()
+
+
+@click.command("rebuild-friend-graph")
+@with_appcontext
+def rebuild_friend_graph():
+    """친구 그래프 스냅샷 파일을 다시 만들고 반영된 변경 로그를 정리 (주기 실행용)"""
+    _rebuild_friend_graph()
+
+
+def _rebuild_friend_graph():
+    try:
+        result = friend_graph.rebuild_snapshot()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    click.echo(
+        f"친구 그래프 스냅샷 생성 완료: 간선 {result['edges']}개, {result['snapshot_bytes'] / 1024 / 1024:.1f}MB "
+        f"(변경 로그 {result['pruned_changes']}건 정리, {result['seconds']}s)"
+    )
+
+
+@click.command("repair-social-counters")
+@click.option("--dry-run", is_flag=True, help="고치지 않고 어긋난 사용자만 보고")
+@click.option("--show", default=10, show_default=True, help="어긋난 사용자 중 출력할 수")
+@with_appcontext
+def repair_social_counters(dry_run, show):
+    """User의 친구/대기중 신청 카운터를 실제 값과 비교해 보고하고 한 번에 다시 계산"""
+    drift = User.find_counter_drift()
+    if not drift:
+        click.echo("어긋난 카운터가 없습니다.")
+        return
+
+    click.echo(f"카운터가 어긋난 사용자 {len(drift)}명")
+    for user_id, username, columns in drift[:show]:
+        details = ", ".join(f"{name} {stored} → {actual}" for name, (stored, actual) in columns.items())
+        click.echo(f"  #{user_id} {username or '-'}: {details}")
+    if len(drift) > show:
+        click.echo(f"  ... 외 {len(drift) - show}명")
+    if dry_run:
+        return
+
+    try:
+        repaired = User.repair_counters()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    click.echo(f"카운터 복구 완료: {repaired}명")
+
+
+@click.command("rebuild-recommendations")
+@click.option("--max-per-user", type=int, default=None, help="사용자별로 저장할 최대 후보 수 (기본: RECOMMENDATION_MAX_PER_USER)")
+@with_appcontext
+def rebuild_recommendations(max_per_user):
+    """친구 그래프 전체로 알 수도 있는 사람 추천을 다시 계산 (주기 실행용)"""
+    try:
+        result = RecommendationService.rebuild(max_per_user=max_per_user)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    click.echo(
+        f"추천 재계산 완료: 사용자 {result['users']}명, 간선 {result['edges']}개 → 추천 {result['recommendations']}개 "
+        f"(읽기 {result['seconds']['load']}s, 계산/저장 {result['seconds']['compute_and_save']}s)"
+    )
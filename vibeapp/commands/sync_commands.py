@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.platform_connection import PlatformConnection
+from vibeapp.models.sync_job import SyncJob
+from vibeapp.models.sync_run import SyncRun
+from vibeapp.services.playlist_service import PlaylistService
+from vibeapp.services.rate_limiter import BACKGROUND
+from vibeapp.services.sync_queue import sync_queue
+
+
+@click.command("sync-all")
+@click.option("--batch-size", default=100, show_default=True, help="한 번에 읽어 처리할 연결 수")
+@click.option("--workers", default=4, show_default=True, help="동시에 동기화할 최대 연결 수")
+@click.option("--force", is_flag=True, help="최근에 동기화한 연결도 다시 동기화")
+@click.option("--restart", is_flag=True, help="중단된 실행을 이어가지 않고 처음부터 시작")
+@with_appcontext
+def sync_all(batch_size, workers, force, restart):
+    """모든 플랫폼 연결의 플레이리스트를 일괄 동기화 (야간 배치용)"""
+    app = current_app._get_current_object()
+
+    run = None if restart else SyncRun.get_unfinished()
+    if run:
+        click.echo(f"중단된 실행 #{run.id}을(를) 연결 ID {run.last_connection_id} 이후부터 이어서 진행합니다.")
+    else:
+        run = SyncRun()
+        db.session.add(run)
+        db.session.commit()
+        click.echo(f"실행 #{run.id} 시작")
+
+    #플랫폼별 동시 동기화 수 제한
+    platform_limits = {
+        platform: threading.BoundedSemaphore(limit)
+        for platform, limit in Config.SYNC_ALL_PLATFORM_CONCURRENCY.items()
+    }
+    default_limit = threading.BoundedSemaphore(Config.SYNC_ALL_PLATFORM_CONCURRENCY.get("default", workers))
+
+    def sync_one(connection_id, platform):
+        semaphore = platform_limits.get(platform, default_limit)
+        with semaphore, app.app_context():
+            connection = db.session.get(PlatformConnection, connection_id)
+            try:
+                playlist_service = PlaylistService(priority=BACKGROUND)
+                return connection_id, playlist_service.get_and_save_playlists(connection, force=force), None
+            except Exception as e:
+                db.session.rollback()
+                return connection_id, None, e
+
+    started = time.monotonic()
+    totals = Counter()
+    errors = Counter()
+    error_samples = []
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sync-all") as executor:
+        while True:
+            connections = PlatformConnection.query.filter(
+                PlatformConnection.id > run.last_connection_id
+            ).order_by(PlatformConnection.id).limit(batch_size).all()
+            if not connections:
+                break
+
+            #최신 상태이거나 이미 백그라운드 큐에서 동기화중인 연결은 건너뜀 (멈춘 작업은 동기화중으로 보지 않음)
+            active_ids = {
+                connection_id for (connection_id,) in db.session.query(SyncJob.platform_connection_id).filter(
+                    SyncJob.platform_connection_id.in_([connection.id for connection in connections]),
+                    SyncJob.status.in_(SyncJob.ACTIVE_STATUSES),
+                    ~sync_queue.stale_condition(datetime.now(timezone.utc)),
+                )
+            }
+            targets = []
+            for connection in connections:
+                if connection.id in active_ids or (not force and PlaylistService.is_fresh(connection)):
+                    run.skipped += 1
+                else:
+                    targets.append((connection.id, connection.platform.lower()))
+
+            for connection_id, stats, error in executor.map(lambda target: sync_one(*target), targets):
+                if error is not None:
+                    run.failed += 1
+                    errors[type(error).__name__] += 1
+                    if len(error_samples) < 10:
+                        error_samples.append(f"연결 {connection_id}: {str(error).splitlines()[0][:200]}")
+                    continue
+                run.synced += 1
+                for key, value in (stats or {}).items():
+                    totals[key] += value
+
+            #배치 단위 체크포인트
+            run.processed += len(connections)
+            run.last_connection_id = connections[-1].id
+            db.session.commit()
+
+            elapsed = time.monotonic() - started
+            click.echo(
+                f"  ~{run.last_connection_id}: 처리 {run.processed} / 동기화 {run.synced} / "
+                f"건너뜀 {run.skipped} / 실패 {run.failed} ({run.processed / max(elapsed, 1e-9):.1f}개/초)"
+            )
+
+    run.finished_at = datetime.now(timezone.utc)
+    db.session.commit()
+
+    elapsed = time.monotonic() - started
+    click.echo(f"실행 #{run.id} 완료: {elapsed:.1f}초")
+    click.echo(f"  연결 처리 {run.processed}개 (동기화 {run.synced}, 건너뜀 {run.skipped}, 실패 {run.failed})")
+    click.echo(f"  처리량 {run.synced / max(elapsed, 1e-9):.2f}개/초")
+    if totals:
+        click.echo("  " + ", ".join(f"{key} {value}" for key, value in sorted(totals.items())))
+    if errors:
+        click.echo("  실패 유형: " + ", ".join(f"{name} {count}" for name, count in errors.most_common()))
+        for sample in error_samples:
+            click.echo(f"    - {sample}")
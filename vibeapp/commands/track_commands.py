@@ -0,0 +1,27 @@
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import delete
+
+from vibeapp.extensions import db
+from vibeapp.models.track import Track
+from vibeapp.models.track_match import TrackMatch
+
+
+@click.command("rebuild-track-match-keys")
+@click.option("--all", "recompute", is_flag=True, help="비어 있는 키뿐 아니라 모든 트랙의 키를 다시 계산 (정규화 규칙을 바꾼 뒤)")
+@click.option("--retry-unmatched", is_flag=True, help="찾지 못함(none)으로 저장된 매칭 결과를 지워 다음 매칭 때 다시 시도")
+@with_appcontext
+def rebuild_track_match_keys(recompute, retry_unmatched):
+    """트랙의 정규화된 아티스트+제목 매칭 키(match_key)를 채움 (키가 없던 시절에 저장된 트랙 복구용)"""
+    try:
+        changed = Track.fill_match_keys(recompute=recompute)
+        cleared = 0
+        if retry_unmatched:
+            cleared = db.session.execute(delete(TrackMatch).where(TrackMatch.method == TrackMatch.NONE)).rowcount
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    click.echo(f"트랙 매칭 키 갱신 완료: {changed}개")
+    if retry_unmatched:
+        click.echo(f"찾지 못한 매칭 결과 {cleared}건을 지웠습니다. 다음 매칭 때 키/검색 단계부터 다시 시도합니다.")
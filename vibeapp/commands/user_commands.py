@@ -0,0 +1,18 @@
+import click
+from flask.cli import with_appcontext
+
+from vibeapp.extensions import db
+from vibeapp.models.user_search import UserSearch
+
+
+@click.command("rebuild-user-search")
+@with_appcontext
+def rebuild_user_search():
+    """user 테이블로 사용자 검색 인덱스(user_search)를 다시 만듦 (트리거 밖에서 바뀐 데이터 복구용)"""
+    try:
+        users = UserSearch.rebuild()
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    click.echo(f"사용자 검색 인덱스 재생성 완료: 사용자 {users}명")
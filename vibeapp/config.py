@@ -8,21 +8,103 @@ class Config:
     SECRET_KEY = os.getenv("SECRET_KEY")
     
     #SQLite DB 설정
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///users.db'
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", 'sqlite:///users.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    #플레이리스트 동기화 설정
+    PLAYLIST_SYNC_TTL = 300  # 마지막 동기화 후 이 시간(초) 안에는 플랫폼 API 호출 생략
+    PLAYLIST_SYNC_CHUNK_SIZE = 500  # 플레이리스트 일괄 추가/갱신/삭제 시 한 번에 보내는 행 수
+    PLAYLIST_SYNC_TRACKS = True  # 플레이리스트 동기화 후 snapshot_id가 바뀐 플레이리스트의 트랙도 동기화
+    
+    PLAYLIST_SYNC_ON_VIEW = True  # False면 /my-playlists는 저장된 데이터만 보여줌 (동기화는 `flask sync-all`)
+    
+    #`flask sync-all` 설정
+    SYNC_ALL_PLATFORM_CONCURRENCY = {"spotify": 2, "default": 2}  # 플랫폼별 동시 동기화 연결 수
+    
+    #백그라운드 동기화 큐 설정
+    SYNC_QUEUE_WORKERS = 2  # 프로세스당 동기화 워커 스레드 수
+    SYNC_JOB_STALE_AFTER = 600  # 실행중 상태로 이 시간(초) 넘게 남은 작업은 중단된 것으로 보고 재실행
+    SYNC_JOB_QUEUED_STALE_AFTER = 120  # 대기 상태로 이 시간(초) 넘게 남은 작업은 넣은 프로세스가 죽은 것으로 보고 다시 제출
+    SYNC_JOB_RETENTION = 86400  # 완료/실패한 작업 보관 시간(초)
+    
+    #소셜 설정
+    SOCIAL_PAGE_SIZE = 20  # 소셜 허브/친구 API 목록 기본 페이지 크기
+    SOCIAL_MAX_PAGE_SIZE = 100  # 친구 API 목록 최대 페이지 크기
+    FRIEND_INVITE_MAX_USERNAMES = 100  # /send-friend-requests 한 번에 보낼 수 있는 최대 사용자명 수
+    MUTUAL_FRIENDS_SAMPLE_SIZE = 6  # 프로필 페이지에 보여주는 공통 친구 수
+    MUTUAL_FRIENDS_MAX_PAGE_SIZE = 50  # 공통 친구 API 한 페이지 최대 크기
+    RECOMMENDATION_MUTUAL_WEIGHT = 1.0  # 추천 점수에서 공통 친구 한 명의 가중치
+    RECOMMENDATION_PLATFORM_WEIGHT = 0.5  # 추천 점수에서 함께 연결한 플랫폼 하나의 가중치
+    RECOMMENDATION_MAX_PER_USER = 100  # 전체 재계산 시 사용자별로 저장하는 최대 후보 수
+    RECOMMENDATION_REBUILD_CHUNK_SIZE = 5000  # 전체 재계산 시 한 번에 넣는 행 수
+    RECOMMENDATION_PAGE_SIZE = 10  # /api/recommendations 기본 페이지 크기
+    RECOMMENDATION_MAX_PAGE_SIZE = 50  # /api/recommendations 최대 페이지 크기
+    FRIEND_GRAPH_SNAPSHOT_NAME = "friend_graph.bin"  # instance 폴더 안의 친구 그래프 스냅샷 파일 (모든 워커가 mmap으로 공유)
+    FRIEND_GRAPH_REFRESH_SECONDS = 1.0  # 워커가 변경 로그/스냅샷 파일을 다시 확인하는 최소 간격(초)
+    FRIEND_GRAPH_MAX_PENDING_CHANGES = 50_000  # 스냅샷 이후 변경이 이보다 많으면 워커가 스냅샷을 다시 만듦
+    FRIEND_GRAPH_MAX_DEPTH = 6  # 연결 경로 탐색 최대 단계 수
+    FRIEND_GRAPH_MAX_VISITED = 500_000  # 탐색 한 번에 방문하는 최대 사용자 수 (넘으면 찾지 못한 것으로 처리)
+    FRIEND_GRAPH_MAX_HOPS = 3  # /api/network 최대 단계 수
+    
+    #외부 HTTP 호출 설정 (vibeapp.services.http_client)
+    HTTP_CONNECT_TIMEOUT = 3.05  # 연결 타임아웃(초)
+    HTTP_READ_TIMEOUT = 15  # 응답 읽기 타임아웃(초)
+    HTTP_MAX_RETRIES = 3  # 일시적 오류 시 최대 재시도 횟수
+    HTTP_BACKOFF_BASE = 0.5  # 지수 백오프 기본 대기 시간(초)
+    HTTP_BACKOFF_MAX = 30  # 백오프 최대 대기 시간(초)
+    HTTP_RETRY_AFTER_MAX = 60  # Retry-After가 이보다 길면 기다리지 않고 응답 반환(초)
+    HTTP_POOL_CONNECTIONS = 10  # 커넥션 풀을 유지할 호스트 수
+    HTTP_POOL_MAXSIZE = 10  # 호스트당 유지할 커넥션 수
+    
+    #플랫폼 API 응답 캐시 (ETag 조건부 요청, vibeapp.services.response_cache)
+    HTTP_CACHE_ENABLED = True
+    HTTP_CACHE_DB_NAME = "http_cache.db"  # instance 폴더 안의 캐시 파일
+    HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 압축된 본문 기준 최대 크기, 넘으면 LRU로 삭제
+    HTTP_CACHE_PARSED_ENTRIES = 256  # 304 응답에 재사용하려고 프로세스마다 기억해 두는 파싱된 본문 수 (0이면 끔)
+    
+    #플랫폼 API 설정
+    SPOTIFY_API_BASE = os.getenv("SPOTIFY_API_BASE", "https://api.spotify.com/v1")
+    SPOTIFY_ACCOUNTS_BASE = os.getenv("SPOTIFY_ACCOUNTS_BASE", "https://accounts.spotify.com")  # 로컬 테스트 시 devtools.fake_spotify 주소
+    YOUTUBE_API_BASE = os.getenv("YOUTUBE_API_BASE", "https://www.googleapis.com/youtube/v3")
+    PLATFORM_FETCH_CONCURRENCY = {  # 페이지/플레이리스트 동시 요청 수 (레이트 리밋을 고려해 작게 유지)
+        "spotify": 4,
+        "youtube": 4,
+        "default": 2,
+    }
+    
+    #플랫폼 액세스 토큰 관리 (vibeapp.services.token_manager)
+    TOKEN_REFRESH_MARGIN = 300  # 만료까지 이 시간(초) 남은 최근 사용 토큰은 백그라운드에서 미리 갱신
+    TOKEN_EXPIRY_SKEW = 60  # 만료까지 이 시간(초)보다 적게 남은 토큰은 요청 중에라도 갱신
+    TOKEN_REFRESH_INTERVAL = 60  # 백그라운드 갱신 확인 주기(초)
+    TOKEN_ACTIVE_WINDOW = 1800  # 이 시간(초) 동안 사용하지 않은 연결은 미리 갱신하지 않음
+    TOKEN_LEASE_SECONDS = 30  # 프로세스 간 갱신 리스 유지 시간(초)
+    
+    #플랫폼 API 레이트 리밋 (워커 프로세스 간 공유 토큰 버킷)
+    RATE_LIMIT_DB_NAME = "rate_limit.db"  # instance 폴더 안의 버킷 상태 파일
+    #429 응답은 최대 HTTP_RETRY_AFTER_MAX초(Retry-After가 없으면 백오프만큼) 버킷을 막으므로, 백그라운드 작업은
+    #실패하지 않고 기다리도록 최대 대기 시간을 그보다 길게 (차단이 풀린 뒤 토큰이 차는 시간 포함)
+    #사용자 요청(OAuth 콜백, 페이지 요청)은 gunicorn 워커 타임아웃(30초) 전에 실패 응답을 주도록 짧게
+    RATE_LIMIT_BACKGROUND_MAX_WAIT = max(HTTP_RETRY_AFTER_MAX, HTTP_BACKOFF_MAX) + 10  # 백그라운드 작업이 토큰을 기다리는 최대 시간(초)
+    RATE_LIMIT_INTERACTIVE_MAX_WAIT = 10  # 사용자 요청이 토큰(또는 429 Retry-After)을 기다리는 최대 시간(초)
+    RATE_LIMIT_INTERACTIVE_RESERVE = 0.3  # 백그라운드 작업이 남겨둬야 하는 버킷 용량 비율
+    PLATFORM_RATE_LIMITS = {
+        "spotify": {"rate": 5, "capacity": 10},  # 초당 충전 토큰 수, 최대 버스트
+        "youtube": {"rate": 5, "capacity": 10},
+        "default": {"rate": 5, "capacity": 10},
+    }
+    
     #플랫폼별 OAuth 설정
     PLATFORM_OAUTH = {
         "spotify": {
             "CLIENT_ID": os.getenv("SPOTIFY_CLIENT_ID"),
             "CLIENT_SECRET": os.getenv("SPOTIFY_CLIENT_SECRET"),
             "REDIRECT_URI": os.getenv("SPOTIFY_REDIRECT_URI"),
-            "AUTH_URL": "https://accounts.spotify.com/authorize",
-            "TOKEN_URL": "https://accounts.spotify.com/api/token",
-            "USER_INFO_URL": "https://api.spotify.com/v1/me",
+            "AUTH_URL": f"{SPOTIFY_ACCOUNTS_BASE}/authorize",
+            "TOKEN_URL": f"{SPOTIFY_ACCOUNTS_BASE}/api/token",
+            "USER_INFO_URL": f"{SPOTIFY_API_BASE}/me",
             "PARAMS": {
                 "response_type": "code",
-                "scope": "user-read-private user-read-email",
+                "scope": "user-read-private user-read-email playlist-read-private playlist-read-collaborative",
                 "show_dialog": "true"
             },
         },
@@ -11,5 +11,11 @@ class UnsupportedPlatformError(Exception):
     pass
 
 class FriendRequestError(Exception):
-    """친구 신청하는 과정에서 발생하는 에러"""
-    pass
\ No newline at end of file
+    """친구 신청하는 과정에서 발생하는 에러 (code: 실패 사유 코드, Friend.REQUEST_ERRORS 참고)"""
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code
+
+class RateLimitError(Exception):
+    """플랫폼 API 호출 한도 대기 시간이 초과됐을 때 발생하는 에러"""
+    pass
@@ -1,5 +1,14 @@
 from vibeapp.models.platform_connection import PlatformConnection
 from vibeapp.models.platform_token import PlatformToken
 from vibeapp.models.playlist import Playlist
+from vibeapp.models.track import Track
+from vibeapp.models.playlist_track import PlaylistTrack
+from vibeapp.models.track_match import TrackMatch
 from vibeapp.models.friend import Friend
-from vibeapp.models.user import User
\ No newline at end of file
+from vibeapp.models.friend_edge import FriendEdge
+from vibeapp.models.friend_edge_change import FriendEdgeChange
+from vibeapp.models.friend_recommendation import FriendRecommendation
+from vibeapp.models.user import User
+from vibeapp.models.user_search import UserSearch
+from vibeapp.models.sync_job import SyncJob
+from vibeapp.models.sync_run import SyncRun
@@ -1,8 +1,24 @@
+from sqlalchemy import and_, delete, exists, func, literal, or_, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased
+
+from vibeapp.exceptions import FriendRequestError
 from vibeapp.extensions import db
+from vibeapp.models.friend_edge import FriendEdge
+from vibeapp.utils.pagination import keyset_page
 
 class Friend(db.Model):
     __tablename__ = "friend"
 
+    #친구 신청을 보낼 수 없는 사유 코드와 메시지 (FriendRequestError.code, 일괄 신청 결과의 status)
+    REQUEST_ERRORS = {
+        "not_found": "존재하지 않는 사용자입니다.",
+        "self": "자기 자신에게는 친구 신청을 보낼 수 없습니다.",
+        "already_friends": "이미 친구입니다.",
+        "already_sent": "이미 친구 신청을 보냈습니다.",
+        "pending_from_them": "상대방이 이미 친구 신청을 보냈습니다. 받은 신청을 확인해주세요.",
+    }
+
     id = db.Column(db.Integer, primary_key=True)
 
     requester_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)  # 친구 신청한 사람
@@ -14,31 +30,37 @@ class Friend(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint("requester_id", "receiver_id", name="uq_request"),
+        #받은/보낸 신청 목록은 (상대 ID, status)로 거르고 created_at 순으로 보여줌
+        #status는 바인드 파라미터로 전달되므로 WHERE status='pending' 부분 인덱스는 플래너가 쓰지 못해 복합 인덱스로 둠
+        db.Index("ix_friend_receiver_status", "receiver_id", "status", "created_at"),
+        db.Index("ix_friend_requester_status", "requester_id", "status", "created_at"),
     )
 
     requester = db.relationship("User", foreign_keys=[requester_id], backref="friend_requests_sent")
     receiver = db.relationship("User", foreign_keys=[receiver_id], backref="friend_requests_received")
     
     
+    @classmethod
+    def between(cls, user1_id, user2_id):
+        """두 사용자 사이의 신청 (양방향) 조건
+
+        SQLite는 이 OR 조건을 uq_request 인덱스 조회 두 번(MULTI-INDEX OR)으로 처리함
+        (행 값 IN (VALUES ...)으로 쓰면 오히려 전체 스캔이 됨)
+        """
+        return or_(
+            and_(cls.requester_id == user1_id, cls.receiver_id == user2_id),
+            and_(cls.requester_id == user2_id, cls.receiver_id == user1_id),
+        )
+
     @classmethod
     def are_friends(cls, user1_id, user2_id):
         """두 사용자가 친구인지 확인"""
-        return cls.query.filter(
-            (
-                ((cls.requester_id == user1_id) & (cls.receiver_id == user2_id)) |
-                ((cls.requester_id == user2_id) & (cls.receiver_id == user1_id))
-            ) & (cls.status == "accepted")
-        ).first() is not None
+        return FriendEdge.exists(user1_id, user2_id)
 
     @classmethod
     def get_friendship(cls, user1_id, user2_id):
         """두 사용자 간의 친구 관계 레코드 반환"""
-        return cls.query.filter(
-            (
-                ((cls.requester_id == user1_id) & (cls.receiver_id == user2_id)) |
-                ((cls.requester_id == user2_id) & (cls.receiver_id == user1_id))
-            ) & (cls.status == "accepted")
-        ).first()
+        return cls.query.filter(cls.between(user1_id, user2_id), cls.status == "accepted").first()
 
     @classmethod
     def get_pending_request(cls, requester_id, receiver_id):
@@ -52,28 +74,227 @@ class Friend(db.Model):
     @classmethod
     def has_pending_request(cls, user1_id, user2_id):
         """두 사용자 간에 대기중인 신청이 있는지 확인 (양방향)"""
-        return cls.query.filter(
-            (
-                ((cls.requester_id == user1_id) & (cls.receiver_id == user2_id)) |
-                ((cls.requester_id == user2_id) & (cls.receiver_id == user1_id))
-            ) & (cls.status == "pending")
-        ).first() is not None
+        return cls.query.filter(cls.between(user1_id, user2_id), cls.status == "pending").first() is not None
 
     @classmethod
     def get_friends_for_user(cls, user_id):
-        """특정 사용자의 모든 친구 목록 반환"""
+        """특정 사용자의 모든 친구 목록 반환 (friend_edge 범위 조회 한 번)"""
+        from vibeapp.models.user import User
+
+        return User.query.join(FriendEdge, FriendEdge.friend_id == User.id).filter(FriendEdge.user_id == user_id).all()
+
+    @classmethod
+    def get_friends_page(cls, user_id, cursor=None, limit=20):
+        """친구 목록 한 페이지 (친구가 된 순서 최신순, ix_friend_edge_user_created 범위 조회)
+
+        Returns:
+            tuple: (User 리스트, 다음 페이지 커서 또는 None)
+        """
+        from vibeapp.models.loader_profiles import USER_CARD
+        from vibeapp.models.user import User
+
+        statement = (
+            select(User)
+            .join(FriendEdge, FriendEdge.friend_id == User.id)
+            .where(FriendEdge.user_id == user_id)
+            .options(*USER_CARD)
+        )
+        return keyset_page(statement, FriendEdge.created_at, FriendEdge.friend_id, cursor, limit)
+
+    @classmethod
+    def get_received_requests_page(cls, user_id, cursor=None, limit=20):
+        """받은 대기중 신청 한 페이지 (최신순, 신청자 함께 로딩)
+
+        Returns:
+            tuple: (Friend 리스트, 다음 페이지 커서 또는 None)
+        """
+        from vibeapp.models.loader_profiles import RECEIVED_REQUEST
+
+        statement = (
+            select(cls)
+            .where(cls.receiver_id == user_id, cls.status == "pending")
+            .options(*RECEIVED_REQUEST)
+        )
+        return keyset_page(statement, cls.created_at, cls.id, cursor, limit)
+
+    @classmethod
+    def get_sent_requests_page(cls, user_id, cursor=None, limit=20):
+        """보낸 대기중 신청 한 페이지 (최신순, 받는 사람 함께 로딩)
+
+        Returns:
+            tuple: (Friend 리스트, 다음 페이지 커서 또는 None)
+        """
+        from vibeapp.models.loader_profiles import SENT_REQUEST
+
+        statement = (
+            select(cls)
+            .where(cls.requester_id == user_id, cls.status == "pending")
+            .options(*SENT_REQUEST)
+        )
+        return keyset_page(statement, cls.created_at, cls.id, cursor, limit)
+
+    @classmethod
+    def get_mutual_friends(cls, user1_id, user2_id, limit, offset=0):
+        """두 사용자의 공통 친구 수와 그중 한 페이지(사용자 ID 순)를 쿼리 한 번으로 반환
+
+        friend_edge를 자기 자신과 조인해 교집합을 구하고, 전체 개수는 윈도 함수로 같은 쿼리에서 셈
+        (platform_connections는 USER_CARD 프로필로 한 번에 로딩)
+
+        Returns:
+            tuple: (공통 친구 수, User 리스트)
+        """
+        from vibeapp.models.loader_profiles import USER_CARD
         from vibeapp.models.user import User
-        
-        # user가 requester인 경우의 친구들
-        friends1 = db.session.query(User).join(
-            cls, User.id == cls.receiver_id
-        ).filter((cls.requester_id == user_id) & (cls.status == "accepted")).all()
-        
-        # user가 receiver인 경우의 친구들  
-        friends2 = db.session.query(User).join(
-            cls, User.id == cls.requester_id
-        ).filter((cls.receiver_id == user_id) & (cls.status == "accepted")).all()
-        
-        # 중복 제거하고 합치기
-        all_friends = list(set(friends1 + friends2))
-        return all_friends
\ No newline at end of file
+
+        mine = aliased(FriendEdge)
+        theirs = aliased(FriendEdge)
+        rows = db.session.execute(
+            select(User, func.count().over())
+            .join(mine, (mine.friend_id == User.id) & (mine.user_id == user1_id))
+            .join(theirs, (theirs.friend_id == mine.friend_id) & (theirs.user_id == user2_id))
+            .options(*USER_CARD)
+            .order_by(mine.friend_id)
+            .limit(limit)
+            .offset(offset)
+        ).all()
+        if rows:
+            return rows[0][1], [user for user, _ in rows]
+        if not offset:
+            return 0, []
+        #마지막 페이지를 넘어가면 행이 없어 개수를 따로 셈
+        count = db.session.scalar(
+            select(func.count())
+            .select_from(mine)
+            .join(theirs, (theirs.friend_id == mine.friend_id) & (theirs.user_id == user2_id))
+            .where(mine.user_id == user1_id)
+        )
+        return count, []
+
+    @classmethod
+    def create_request(cls, requester_id, receiver_id):
+        """대기중인 친구 신청 생성 (커밋은 호출한 쪽에서)
+
+        보낼 수 없으면 사유 코드가 담긴 FriendRequestError를 던짐 (REQUEST_ERRORS)
+        """
+        if requester_id == receiver_id:
+            raise FriendRequestError(cls.REQUEST_ERRORS["self"], code="self")
+        created = cls.create_requests(requester_id, [receiver_id])
+        if created:
+            return created[0]
+        reason = cls.request_block_reasons(requester_id, [receiver_id]).get(receiver_id, "not_found")
+        raise FriendRequestError(cls.REQUEST_ERRORS[reason], code=reason)
+
+    @classmethod
+    def create_requests(cls, requester_id, receiver_ids):
+        """requester가 receiver_ids 각각에게 친구 신청, 새로 대기중이 된 신청 리스트 반환 (커밋은 호출한 쪽에서)
+
+        uq_request를 기준으로 한 INSERT ... SELECT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로 처리:
+        - 존재하는 사용자에게만, 상대가 보낸 대기중/수락된 신청이 없을 때만 삽입
+        - 같은 방향의 거절된 신청이 있으면 그 행을 다시 대기중으로 되돌림 (대기중/수락된 신청은 그대로)
+        따로 존재 여부를 확인하고 넣지 않으므로 같은 신청이 동시에 들어와도 한 번만 만들어짐.
+        만든 신청만큼 양쪽 대기중 신청 카운터도 같은 트랜잭션에서 증가
+        """
+        from vibeapp.models.user import User
+
+        receiver_ids = [receiver_id for receiver_id in dict.fromkeys(receiver_ids) if receiver_id != requester_id]
+        if not receiver_ids:
+            return []
+
+        reverse = aliased(cls)
+        now = func.now()
+        targets = select(literal(requester_id), User.id, literal("pending"), now, now).where(
+            User.id.in_(receiver_ids),
+            ~exists().where(
+                reverse.requester_id == User.id,
+                reverse.receiver_id == requester_id,
+                reverse.status.in_(("pending", "accepted")),
+            ),
+        )
+        statement = (
+            sqlite_insert(cls)
+            .from_select(["requester_id", "receiver_id", "status", "created_at", "updated_at"], targets)
+            .on_conflict_do_update(
+                index_elements=["requester_id", "receiver_id"],
+                set_={"status": "pending", "created_at": now, "updated_at": now},
+                where=cls.status == "rejected",
+            )
+            .returning(cls)
+        )
+        #거절 상태로 이미 읽어 둔 신청 객체도 돌려받은 값으로 갱신
+        created = db.session.scalars(statement, execution_options={"populate_existing": True}).all()
+        if created:
+            User.adjust_counters(requester_id, pending_sent_count=len(created))
+            User.adjust_counters([friend_request.receiver_id for friend_request in created], pending_received_count=1)
+        return created
+
+    @classmethod
+    def request_block_reasons(cls, requester_id, receiver_ids):
+        """receiver_ids 중 친구 신청을 막는 기존 신청이 있는 사용자별 사유 코드 (REQUEST_ERRORS 키)"""
+        rows = cls.query.filter(
+            or_(
+                and_(cls.requester_id == requester_id, cls.receiver_id.in_(receiver_ids)),
+                and_(cls.receiver_id == requester_id, cls.requester_id.in_(receiver_ids)),
+            ),
+            cls.status.in_(("pending", "accepted")),
+        ).all()
+        reasons = {}
+        for row in rows:
+            if row.status == "accepted":
+                reason = "already_friends"
+            elif row.requester_id == requester_id:
+                reason = "already_sent"
+            else:
+                reason = "pending_from_them"
+            other_id = row.receiver_id if row.requester_id == requester_id else row.requester_id
+            #양쪽 방향 행이 모두 있으면 친구 관계를 우선
+            if reasons.get(other_id) != "already_friends":
+                reasons[other_id] = reason
+        return reasons
+
+    def _close_pending(self):
+        """대기중이던 신청이 수락/거절/취소될 때 양쪽 대기중 신청 카운터 감소"""
+        from vibeapp.models.user import User
+
+        if self.status == "pending":
+            User.adjust_counters(self.requester_id, pending_sent_count=-1)
+            User.adjust_counters(self.receiver_id, pending_received_count=-1)
+
+    def accept(self):
+        """신청 수락, 같은 트랜잭션에서 friend_edge와 카운터도 갱신 (커밋은 호출한 쪽에서)"""
+        from vibeapp.models.user import User
+
+        self._close_pending()
+        self.status = "accepted"
+        self.updated_at = db.func.now()
+        FriendEdge.link(self.requester_id, self.receiver_id)
+        User.adjust_counters(self.requester_id, friends_count=1)
+        User.adjust_counters(self.receiver_id, friends_count=1)
+
+    def reject(self):
+        """신청 거절 (커밋은 호출한 쪽에서)"""
+        self._close_pending()
+        self.status = "rejected"
+        self.updated_at = db.func.now()
+
+    def cancel(self):
+        """보낸 신청 취소, 신청 행 삭제 (커밋은 호출한 쪽에서)"""
+        self._close_pending()
+        db.session.delete(self)
+
+    @classmethod
+    def remove_friendship(cls, user1_id, user2_id):
+        """친구 삭제, 수락된 신청과 friend_edge를 함께 지움 (커밋은 호출한 쪽에서)
+
+        Returns:
+            bool: 삭제한 친구 관계가 있었는지 여부
+        """
+        from vibeapp.models.user import User
+
+        deleted = db.session.execute(
+            delete(cls).where(cls.between(user1_id, user2_id), cls.status == "accepted")
+        ).rowcount
+        FriendEdge.unlink(user1_id, user2_id)
+        if deleted:
+            User.adjust_counters(user1_id, friends_count=-1)
+            User.adjust_counters(user2_id, friends_count=-1)
+        return deleted > 0
@@ -0,0 +1,79 @@
+from sqlalchemy import and_, delete, or_, select, union_all
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from vibeapp.extensions import db
+from vibeapp.models.friend_edge_change import FriendEdgeChange
+
+class FriendEdge(db.Model):
+    """수락된 친구 관계를 양방향으로 저장하는 비정규화 테이블
+
+    친구 관계 하나당 (a, b), (b, a) 두 행을 저장하므로 친구 목록/친구 여부 확인이
+    user_id 기준 기본 키 범위 조회 한 번으로 끝남. 원본은 Friend(status="accepted")이고
+    수락/친구 삭제와 같은 트랜잭션에서 함께 갱신되고, 변경은 FriendEdgeChange에도 기록됨
+    (어긋나면 `flask rebuild-friend-edges`)
+    """
+    __tablename__ = "friend_edge"
+    __table_args__ = (
+        #친구 목록은 친구가 된 순서(최신순)로 커서 페이지네이션함
+        db.Index("ix_friend_edge_user_created", "user_id", "created_at", "friend_id"),
+        #기본 키 순서로 행을 저장해 user_id 범위 조회가 인덱스 → 테이블 재조회 없이 끝나도록 함
+        {"sqlite_with_rowid": False},
+    )
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    friend_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+    @classmethod
+    def link(cls, user1_id, user2_id):
+        """두 사용자의 양방향 간선 추가 (커밋은 호출한 쪽에서)"""
+        db.session.execute(
+            sqlite_insert(cls).on_conflict_do_nothing(index_elements=["user_id", "friend_id"]),
+            [{"user_id": user1_id, "friend_id": user2_id}, {"user_id": user2_id, "friend_id": user1_id}],
+        )
+        FriendEdgeChange.record(user1_id, user2_id, linked=True)
+
+    @classmethod
+    def unlink(cls, user1_id, user2_id):
+        """두 사용자의 양방향 간선 삭제 (커밋은 호출한 쪽에서)"""
+        db.session.execute(
+            delete(cls).where(or_(
+                and_(cls.user_id == user1_id, cls.friend_id == user2_id),
+                and_(cls.user_id == user2_id, cls.friend_id == user1_id),
+            ))
+        )
+        FriendEdgeChange.record(user1_id, user2_id, linked=False)
+
+    @classmethod
+    def exists(cls, user_id, friend_id):
+        return db.session.get(cls, (user_id, friend_id)) is not None
+
+    @classmethod
+    def friend_ids(cls, user_id):
+        return db.session.scalars(select(cls.friend_id).where(cls.user_id == user_id)).all()
+
+    @classmethod
+    def is_missing(cls):
+        """간선 테이블은 비어 있는데 수락된 친구 관계는 있는지 (friend_edge 도입 전 DB를 처음 띄운 경우)"""
+        from vibeapp.models.friend import Friend
+
+        if db.session.scalar(select(cls.user_id).limit(1)) is not None:
+            return False
+        return db.session.scalar(select(Friend.id).where(Friend.status == "accepted").limit(1)) is not None
+
+    @classmethod
+    def rebuild(cls):
+        """Friend 테이블의 수락된 관계로 간선 테이블 전체를 다시 만듦, 저장된 간선 수 반환"""
+        from vibeapp.models.friend import Friend
+
+        accepted = Friend.status == "accepted"
+        both_directions = union_all(
+            select(Friend.requester_id, Friend.receiver_id, Friend.updated_at).where(accepted),
+            select(Friend.receiver_id, Friend.requester_id, Friend.updated_at).where(accepted),
+        )
+        db.session.execute(delete(cls))
+        #같은 두 사용자 사이에 양쪽 방향 신청이 모두 수락돼 있으면 간선이 겹치므로 무시
+        db.session.execute(
+            sqlite_insert(cls).prefix_with("OR IGNORE").from_select(["user_id", "friend_id", "created_at"], both_directions)
+        )
+        return db.session.scalar(select(db.func.count()).select_from(cls))
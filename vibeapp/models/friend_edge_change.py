@@ -0,0 +1,22 @@
+from vibeapp.extensions import db
+
+class FriendEdgeChange(db.Model):
+    """friend_edge 변경 로그 (친구 그래프 스냅샷의 증분 갱신용)
+
+    FriendEdge.link/unlink와 같은 트랜잭션에서 한 행씩 쌓이고, 각 워커의 FriendGraph가
+    스냅샷 이후의 행만 읽어 메모리에 반영함. 스냅샷을 다시 만들 때 오래된 행은 지워짐
+    """
+    __tablename__ = "friend_edge_change"
+    #ID를 재사용하지 않아야 워커가 "마지막으로 반영한 ID 이후"만 읽어도 빠지는 변경이 없음
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, nullable=False)
+    friend_id = db.Column(db.Integer, nullable=False)
+    linked = db.Column(db.Boolean, nullable=False)  # True: 친구 추가, False: 친구 삭제
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+    @classmethod
+    def record(cls, user1_id, user2_id, linked):
+        """두 사용자 사이의 간선 변경 기록 (양방향을 한 행으로, 커밋은 호출한 쪽에서)"""
+        db.session.execute(db.insert(cls).values(user_id=user1_id, friend_id=user2_id, linked=linked))
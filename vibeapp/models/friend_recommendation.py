@@ -0,0 +1,22 @@
+from vibeapp.extensions import db
+
+class FriendRecommendation(db.Model):
+    """알 수도 있는 사람 추천 후보와 점수 (RecommendationService가 미리 계산해 저장)
+
+    친구의 친구 중 아직 친구가 아닌 사용자만 저장하며, 점수는
+    공통 친구 수와 함께 연결한 플랫폼 수의 가중합
+    """
+    __tablename__ = "friend_recommendation"
+    __table_args__ = (
+        db.Index("ix_friend_recommendation_rank", "user_id", "score", "candidate_id"),  # 사용자별 점수순 페이지 조회
+        {"sqlite_with_rowid": False},
+    )
+
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)  # 추천을 받는 사용자
+    candidate_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)  # 추천 대상
+    mutual_count = db.Column(db.Integer, nullable=False, default=0)  # 공통 친구 수
+    shared_platforms = db.Column(db.Integer, nullable=False, default=0)  # 둘 다 연결한 플랫폼 수
+    score = db.Column(db.Float, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=db.func.now(), onupdate=db.func.now())
+
+    candidate = db.relationship("User", foreign_keys=[candidate_id])
@@ -0,0 +1,29 @@
+"""목록 응답별 연관 객체 로딩 옵션 (N+1 쿼리 방지)
+
+목록 한 페이지를 읽을 때 응답에 쓰는 연관 객체를 함께 읽어 행 수와 관계없이 쿼리 수가 일정하도록 함.
+다대일(신청자, 받는 사람, 추천 후보)은 joinedload로 같은 쿼리에서, 일대다(플랫폼 연결)는
+selectinload로 IN 쿼리 한 번에 읽음. 응답에 쓰는 연관 객체가 바뀌면 여기 프로필도 같이 고치고
+`python -m devtools.check_query_counts`로 확인할 것
+
+    select(User).options(*USER_CARD)
+"""
+from sqlalchemy.orm import joinedload, selectinload
+
+from vibeapp.models.friend import Friend
+from vibeapp.models.friend_recommendation import FriendRecommendation
+from vibeapp.models.user import User
+
+
+#사용자 카드 (이름 + 연결한 플랫폼): 친구 목록, 공통 친구, 사용자 검색, User.to_dict
+USER_CARD = (selectinload(User.platform_connections),)
+
+#받은 신청 목록 (신청자 이름)
+RECEIVED_REQUEST = (joinedload(Friend.requester, innerjoin=True),)
+
+#보낸 신청 목록 (받는 사람 이름)
+SENT_REQUEST = (joinedload(Friend.receiver, innerjoin=True),)
+
+#추천 목록 (후보 사용자 카드)
+RECOMMENDATION_CARD = (
+    joinedload(FriendRecommendation.candidate, innerjoin=True).selectinload(User.platform_connections),
+)
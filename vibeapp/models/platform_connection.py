@@ -4,11 +4,16 @@ class PlatformConnection(db.Model):
     __tablename__ = "platform_connection"
     __table_args__ = (
     db.UniqueConstraint('platform', 'platform_user_id', name='uq_platform_user'),
+    db.Index('ix_platform_connection_user_id', 'user_id'),  # User.platform_connections 조회
     )
 
     id = db.Column(db.Integer, primary_key=True)
     platform = db.Column(db.String(50), nullable=False)
     platform_user_id = db.Column(db.String(255), nullable=False)  # 외부 플랫폼에서의 유저 고유 ID
+    last_synced_at = db.Column(db.DateTime, nullable=True)  # 마지막 플레이리스트 동기화 시각 (UTC)
+    sync_generation = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # 플레이리스트 동기화 세대 번호
+    sync_cursor = db.Column(db.String(255), nullable=True)  # 진행중인 동기화의 다음 페이지 위치 (offset 또는 페이지 토큰, 완료 시 None)
+    sync_in_progress = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false())  # 중단된 동기화가 있으면 같은 세대로 이어서 진행
 
     user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     token_id = db.Column(db.Integer, db.ForeignKey("platform_token.id"), nullable=False)
@@ -8,5 +8,7 @@ class PlatformToken(db.Model):
     refresh_token = db.Column(db.String(255), nullable=True)
     expire_at = db.Column(db.DateTime, nullable=True)
     extra_data = db.Column(db.JSON, nullable=True)
+    refresh_lease_owner = db.Column(db.String(255), nullable=True)  # 토큰을 갱신중인 프로세스/스레드
+    refresh_lease_until = db.Column(db.DateTime, nullable=True)  # 갱신 리스 만료 시각 (UTC), 지나면 다른 프로세스가 가져감
 
     platform_connection = db.relationship("PlatformConnection", back_populates="token", uselist=False)
@@ -4,6 +4,7 @@ class Playlist(db.Model):
     __tablename__ = "playlist"
     __table_args__ = (
     db.UniqueConstraint('platform', 'platform_user_id', 'spotify_id', name='uq_platform_user_playlist'),
+    db.Index('ix_playlist_owner_name', 'platform', 'platform_user_id', 'name'),  # 내 플레이리스트 이름순 목록
     )
 
     id = db.Column(db.Integer, primary_key=True)
@@ -14,6 +15,17 @@ class Playlist(db.Model):
     platform = db.Column(db.String(50), nullable=False)
     platform_user_id = db.Column(db.String(255), nullable=False)  # 이걸 직접 가짐
     spotify_id = db.Column(db.String(255), nullable=False)
+    sync_generation = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # 마지막으로 확인된 동기화 세대
+    tracks_snapshot_id = db.Column(db.String(255))  # 트랙 목록을 마지막으로 가져온 시점의 snapshot_id
     
     platform_connection_id = db.Column(db.Integer, db.ForeignKey("platform_connection.id"), nullable=False)
     platform_connection = db.relationship("PlatformConnection", back_populates="playlists")
+    tracks = db.relationship("PlaylistTrack", back_populates="playlist", order_by="PlaylistTrack.position", cascade="all, delete-orphan")
+
+    @classmethod
+    def get_for_owner(cls, platform, platform_user_id):
+        """플랫폼 계정의 플레이리스트를 이름순으로 반환 (ix_playlist_owner_name 순서대로 읽어 정렬 없음)"""
+        return cls.query.filter_by(
+            platform=platform,
+            platform_user_id=platform_user_id,
+        ).order_by(cls.name.asc()).all()
@@ -0,0 +1,15 @@
+from vibeapp.extensions import db
+
+class PlaylistTrack(db.Model):
+    """플레이리스트와 트랙의 연결 (플레이리스트 안에서의 순서 포함)"""
+    __tablename__ = "playlist_track"
+    __table_args__ = (
+        db.Index('ix_playlist_track_track_id', 'track_id'),
+    )
+
+    playlist_id = db.Column(db.Integer, db.ForeignKey("playlist.id", ondelete="CASCADE"), primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)  # 플레이리스트 안에서의 순서 (0부터)
+    track_id = db.Column(db.Integer, db.ForeignKey("track.id"), nullable=False)
+
+    playlist = db.relationship("Playlist", back_populates="tracks")
+    track = db.relationship("Track")
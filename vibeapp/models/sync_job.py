@@ -0,0 +1,65 @@
+from vibeapp.extensions import db
+
+class SyncJob(db.Model):
+    """플레이리스트 백그라운드 동기화 작업 (재시작 후에도 유지되도록 DB에 저장)"""
+    __tablename__ = "sync_job"
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+    __table_args__ = (
+        # 연결당 대기중/실행중인 작업은 하나만 허용 (중복 동기화 방지)
+        db.Index(
+            "uq_sync_job_active_connection", "platform_connection_id",
+            unique=True,
+            sqlite_where=db.text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    platform_connection_id = db.Column(db.Integer, db.ForeignKey("platform_connection.id"), nullable=False)
+
+    status = db.Column(db.String(20), nullable=False, default=QUEUED)  # "queued", "running", "done", "failed"
+    force = db.Column(db.Boolean, nullable=False, default=False)  # 신선도와 관계없이 동기화할지 여부
+    result = db.Column(db.JSON, nullable=True)  # 동기화 결과 통계
+    error = db.Column(db.Text, nullable=True)
+
+    created_at = db.Column(db.DateTime, default=db.func.now())
+    queued_at = db.Column(db.DateTime, nullable=True, default=db.func.now())  # 마지막으로 대기 상태가 된 시각 (멈춘 작업을 다시 넣으면 갱신)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    platform_connection = db.relationship("PlatformConnection")
+
+    @property
+    def is_active(self):
+        return self.status in self.ACTIVE_STATUSES
+
+    @classmethod
+    def get_active_for_connection(cls, connection_id):
+        """연결의 대기중/실행중인 작업 반환"""
+        return cls.query.filter(
+            cls.platform_connection_id == connection_id,
+            cls.status.in_(cls.ACTIVE_STATUSES)
+        ).first()
+
+    @classmethod
+    def get_latest_for_connection(cls, connection_id):
+        """연결의 가장 최근 작업 반환"""
+        return cls.query.filter_by(
+            platform_connection_id=connection_id
+        ).order_by(cls.id.desc()).first()
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
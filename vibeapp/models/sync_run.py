@@ -0,0 +1,20 @@
+from vibeapp.extensions import db
+
+class SyncRun(db.Model):
+    """`flask sync-all` 실행 기록 (중단된 실행을 이어서 진행하기 위한 체크포인트)"""
+    __tablename__ = "sync_run"
+
+    id = db.Column(db.Integer, primary_key=True)
+    last_connection_id = db.Column(db.Integer, nullable=False, default=0)  # 처리를 마친 마지막 연결 ID
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    synced = db.Column(db.Integer, nullable=False, default=0)
+    skipped = db.Column(db.Integer, nullable=False, default=0)
+    failed = db.Column(db.Integer, nullable=False, default=0)
+
+    started_at = db.Column(db.DateTime, default=db.func.now())
+    finished_at = db.Column(db.DateTime, nullable=True)  # None이면 진행중이거나 중단된 실행
+
+    @classmethod
+    def get_unfinished(cls):
+        """가장 최근의 끝나지 않은 실행 반환"""
+        return cls.query.filter(cls.finished_at.is_(None)).order_by(cls.id.desc()).first()
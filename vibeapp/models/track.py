@@ -0,0 +1,60 @@
+from sqlalchemy import select, update
+
+from vibeapp.extensions import db
+from vibeapp.utils.track_utils import make_match_key
+
+class Track(db.Model):
+    """플랫폼 트랙 (플랫폼별 외부 ID 기준으로 전역에서 한 번만 저장)"""
+    __tablename__ = "track"
+    __table_args__ = (
+        db.UniqueConstraint('platform', 'external_id', name='uq_platform_track'),
+        db.Index('ix_track_platform_isrc', 'platform', 'isrc'),
+        db.Index('ix_track_platform_match_key', 'platform', 'match_key'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    platform = db.Column(db.String(50), nullable=False)
+    external_id = db.Column(db.String(255), nullable=False)  # 플랫폼에서의 트랙 ID
+    isrc = db.Column(db.String(20), nullable=True)  # 국제 표준 녹음 코드 (플랫폼 간 매칭 키)
+    name = db.Column(db.String(500), nullable=False)
+    artists = db.Column(db.String(500), nullable=True)  # 아티스트 이름들 (", "로 연결)
+    album = db.Column(db.String(500), nullable=True)
+    duration_ms = db.Column(db.Integer, nullable=True)
+    match_key = db.Column(db.String(500), nullable=True)  # 정규화된 "아티스트|제목" (utils.track_utils.make_match_key)
+
+    @classmethod
+    def fill_match_keys(cls, recompute=False, chunk_size=5000):
+        """match_key가 비어 있는 트랙(recompute면 전체)의 키를 다시 계산해 저장, 바뀐 트랙 수 반환 (커밋은 호출한 쪽에서)
+
+        정규화(unidecode 등)는 SQL로 할 수 없으므로 ID 순서로 chunk_size개씩 읽어 파이썬에서 계산함
+        """
+        changed = 0
+        last_id = 0
+        while True:
+            statement = select(cls.id, cls.artists, cls.name, cls.match_key).where(cls.id > last_id)
+            if not recompute:
+                statement = statement.where(cls.match_key.is_(None))
+            rows = db.session.execute(statement.order_by(cls.id).limit(chunk_size)).all()
+            if not rows:
+                return changed
+            last_id = rows[-1].id
+            updates = []
+            for row in rows:
+                match_key = make_match_key(row.artists, row.name)
+                if match_key != row.match_key:
+                    updates.append({"id": row.id, "match_key": match_key})
+            if updates:
+                db.session.execute(update(cls), updates)
+                changed += len(updates)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "platform": self.platform,
+            "external_id": self.external_id,
+            "isrc": self.isrc,
+            "name": self.name,
+            "artists": self.artists,
+            "album": self.album,
+            "duration_ms": self.duration_ms,
+        }
@@ -0,0 +1,23 @@
+from vibeapp.extensions import db
+
+class TrackMatch(db.Model):
+    """트랙의 다른 플랫폼 매칭 결과 (한 번 찾은 결과는 여기서 바로 조회)"""
+    __tablename__ = "track_match"
+    __table_args__ = (
+        db.UniqueConstraint('source_track_id', 'target_platform', name='uq_track_match'),
+    )
+
+    ISRC = "isrc"
+    KEY = "key"
+    SEARCH = "search"
+    NONE = "none"  # 검색까지 했지만 찾지 못함
+
+    id = db.Column(db.Integer, primary_key=True)
+    source_track_id = db.Column(db.Integer, db.ForeignKey("track.id"), nullable=False)
+    target_platform = db.Column(db.String(50), nullable=False)
+    target_track_id = db.Column(db.Integer, db.ForeignKey("track.id"), nullable=True)
+    method = db.Column(db.String(20), nullable=False)  # "isrc", "key", "search", "none"
+    matched_at = db.Column(db.DateTime, default=db.func.now())
+
+    source_track = db.relationship("Track", foreign_keys=[source_track_id])
+    target_track = db.relationship("Track", foreign_keys=[target_track_id])
@@ -1,10 +1,10 @@
-from sqlalchemy.orm import aliased
-from sqlalchemy import or_, and_
+from sqlalchemy import func, or_, select, update
 
 from flask_login import UserMixin
 
 from vibeapp.extensions import db, login_manager
 from vibeapp.models.friend import Friend
+from vibeapp.models.friend_edge import FriendEdge
 
 
 class User(db.Model, UserMixin):
@@ -15,6 +15,11 @@ class User(db.Model, UserMixin):
     username = db.Column(db.String(50), unique=True, nullable=True)
     is_admin = db.Column(db.Boolean, default=False)
 
+    #친구 관련 카운터 (Friend 변경과 같은 트랜잭션에서 갱신, 어긋나면 `flask repair-social-counters`)
+    friends_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    pending_received_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # 받은 대기중 신청 수
+    pending_sent_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # 보낸 대기중 신청 수
+
     platform_connections = db.relationship("PlatformConnection", back_populates="user", cascade="all, delete-orphan")
     
     # ⭐ 친구 관련 편의 메서드들 추가
@@ -23,19 +28,17 @@ class User(db.Model, UserMixin):
         return Friend.get_friends_for_user(self.id)
 
     def get_pending_friend_requests_count(self):
-        """받은 친구 신청 중 대기중인 것의 개수"""
-        pending_requests = Friend.query.filter_by(
-            receiver_id=self.id,
-            status="pending"
-        ).all()
-        return len(pending_requests)
+        """받은 친구 신청 중 대기중인 것의 개수 (카운터 컬럼이라 추가 쿼리 없음)"""
+        return self.pending_received_count
 
     def get_pending_received_requests(self):
-        """받은 친구 신청 중 대기중인 것들"""
+        """받은 친구 신청 중 대기중인 것들 (신청자 함께 로딩)"""
+        from vibeapp.models.loader_profiles import RECEIVED_REQUEST
+
         return Friend.query.filter_by(
             receiver_id=self.id,
             status="pending"
-        ).all()
+        ).options(*RECEIVED_REQUEST).all()
 
     def is_friend_with(self, other_user_id):
         """다른 사용자와 친구인지 확인"""
@@ -50,44 +53,76 @@ class User(db.Model, UserMixin):
         return Friend.get_pending_request(self.id, other_user_id) is not None
 
     def send_friend_request(self, other_user_id):
-        """친구 신청 보내기"""
-        # 이미 친구인지 확인
-        if self.is_friend_with(other_user_id):
-            raise ValueError("이미 친구입니다.")
-        
-        # 이미 신청했는지 확인
-        if self.has_sent_request_to(other_user_id):
-            raise ValueError("이미 친구 신청을 보냈습니다.")
-        
-        # 상대방이 이미 신청을 보냈는지 확인
-        if self.has_pending_request_from(other_user_id):
-            raise ValueError("상대방이 이미 친구 신청을 보냈습니다.")
-        
-        # 친구 신청 생성
-        friend_request = Friend(
-            requester_id=self.id,
-            receiver_id=other_user_id
-        )
-        db.session.add(friend_request)
+        """친구 신청 보내기 (보낼 수 없으면 FriendRequestError)"""
+        #이미 친구/신청한 상태인지는 Friend.create_request의 upsert 한 문장이 함께 확인함
+        friend_request = Friend.create_request(self.id, other_user_id)
         db.session.commit()
         return friend_request
 
     # 친구 목록을 쿼리하는 관계
     @property
     def friends(self):
-        FriendAlias = aliased(Friend)
-        return User.query.join(FriendAlias, or_(
-            and_(
-                FriendAlias.requester_id == self.id,
-                FriendAlias.receiver_id == User.id,
-                FriendAlias.status == "accepted"
-            ),
-            and_(
-                FriendAlias.receiver_id == self.id,
-                FriendAlias.requester_id == User.id,
-                FriendAlias.status == "accepted"
-            )
-        ))
+        return User.query.join(FriendEdge, FriendEdge.friend_id == User.id).filter(FriendEdge.user_id == self.id)
+
+    @classmethod
+    def adjust_counters(cls, user_id, **deltas):
+        """카운터 컬럼을 SQL 안에서 증감 (예: friends_count=1), 커밋은 호출한 쪽에서
+
+        값을 읽어 파이썬에서 더하지 않고 UPDATE ... SET col = col + ?로 처리해 동시 요청에도 어긋나지 않음.
+        user_id에 ID 리스트를 넘기면 모두 같은 값만큼 한 문장으로 증감
+        """
+        values = {getattr(cls, name): getattr(cls, name) + delta for name, delta in deltas.items() if delta}
+        if not values:
+            return
+        condition = cls.id.in_(user_id) if isinstance(user_id, (list, tuple, set)) else cls.id == user_id
+        db.session.execute(update(cls).where(condition).values(values))
+
+    @classmethod
+    def actual_counters(cls):
+        """카운터 컬럼별 실제 값을 구하는 상관 서브쿼리 (친구 수는 friend_edge 기준)"""
+        return {
+            "friends_count": select(func.count()).select_from(FriendEdge)
+                .where(FriendEdge.user_id == cls.id).scalar_subquery(),
+            "pending_received_count": select(func.count()).select_from(Friend)
+                .where(Friend.receiver_id == cls.id, Friend.status == "pending").scalar_subquery(),
+            "pending_sent_count": select(func.count()).select_from(Friend)
+                .where(Friend.requester_id == cls.id, Friend.status == "pending").scalar_subquery(),
+        }
+
+    @classmethod
+    def find_counter_drift(cls):
+        """저장된 카운터가 실제 값과 다른 사용자 목록
+
+        Returns:
+            list: (사용자 ID, 사용자명, {카운터 이름: (저장된 값, 실제 값)}) 튜플 리스트
+        """
+        actual = cls.actual_counters()
+        names = list(actual)
+        rows = db.session.execute(
+            select(cls.id, cls.username, *(getattr(cls, name) for name in names), *actual.values())
+            .where(or_(*(getattr(cls, name) != actual[name] for name in names)))
+            .order_by(cls.id)
+        ).all()
+        drift = []
+        for row in rows:
+            stored, real = row[2:2 + len(names)], row[2 + len(names):]
+            drift.append((row[0], row[1], {
+                name: (stored_value, real_value)
+                for name, stored_value, real_value in zip(names, stored, real)
+                if stored_value != real_value
+            }))
+        return drift
+
+    @classmethod
+    def repair_counters(cls):
+        """모든 사용자의 카운터를 실제 값으로 한 번에 다시 계산, 바뀐 사용자 수 반환 (커밋은 호출한 쪽에서)"""
+        actual = cls.actual_counters()
+        return db.session.execute(
+            update(cls)
+            .where(or_(*(getattr(cls, name) != expression for name, expression in actual.items())))
+            .values({getattr(cls, name): expression for name, expression in actual.items()})
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
     @staticmethod
     def find_by_username(username):
@@ -96,13 +131,21 @@ class User(db.Model, UserMixin):
     
     @staticmethod  
     def search_by_username(query, limit=10):
-        """사용자명으로 사용자 검색 (부분 일치)"""
-        return User.query.filter(
-            User.username.ilike(f'%{query}%')
-        ).limit(limit).all()
+        """사용자명/표시 이름으로 사용자 검색 (정확히 > 앞부분 > 부분 일치 순, UserSearch 인덱스 사용)"""
+        from vibeapp.models.user_search import UserSearch
+
+        return User.get_in_order(UserSearch.search_ids(query, limit))
+
+    @staticmethod
+    def get_in_order(user_ids, options=()):
+        """ID 목록의 사용자들을 쿼리 한 번으로 읽어 같은 순서로 반환 (없는 ID는 빠짐)"""
+        if not user_ids:
+            return []
+        users = {user.id: user for user in User.query.filter(User.id.in_(user_ids)).options(*options)}
+        return [users[user_id] for user_id in user_ids if user_id in users]
         
     def to_dict(self, include_private=False):
-        """사용자 정보를 딕셔너리로 반환"""
+        """사용자 정보를 딕셔너리로 반환 (목록에서 쓸 때는 USER_CARD 프로필로 platform_connections를 미리 로딩)"""
         data = {
             'id': self.id,
             'username': self.username,
@@ -113,8 +156,8 @@ class User(db.Model, UserMixin):
         if include_private:
             data.update({
                 'is_admin': self.is_admin,
-                'friends_count': len(self.get_friends()),
-                'pending_requests_count': self.get_pending_friend_requests_count()
+                'friends_count': self.friends_count,
+                'pending_requests_count': self.pending_received_count
             })
             
         return data
@@ -125,4 +168,8 @@ class User(db.Model, UserMixin):
     #세션에 저장된 사용자 ID를 이용해 User 객체를 로딩
     @login_manager.user_loader
     def load_user(user_id):
-        return User.query.get(int(user_id)) 
\ No newline at end of file
+        return User.query.get(int(user_id)) 
+
+#사용자 검색의 정확히/앞부분 일치 단계용 식 인덱스 (UserSearch.search_ids)
+db.Index("ix_user_username_lower", func.lower(User.username))
+db.Index("ix_user_display_name_lower", func.lower(User.display_name))
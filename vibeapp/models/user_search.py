@@ -0,0 +1,143 @@
+from vibeapp.extensions import db
+
+
+class UserSearch:
+    """사용자명/표시 이름 검색 인덱스 (SQLite FTS5 trigram 가상 테이블 user_search)
+
+    user 테이블을 content로 쓰는 외부 콘텐츠 테이블이라 텍스트를 따로 저장하지 않고 trigram
+    인덱스만 가짐. user의 INSERT/DELETE/UPDATE OF username, display_name 트리거가 같은
+    트랜잭션에서 인덱스를 갱신하므로 ORM을 거치지 않은 쓰기도 반영됨 (어긋나면 `flask rebuild-user-search`)
+
+    검색은 정확히 일치 > 앞부분 일치 > 부분 일치 순. 정확히/앞부분 일치는 lower(username),
+    lower(display_name) 식 인덱스 범위 조회로, 부분 일치만 trigram으로 찾음. trigram은 세 글자
+    미만을 찾지 못하므로 짧은 검색어의 부분 일치는 user를 LIKE로 훑어 limit개까지만 찾음
+    """
+    TABLE = "user_search"
+    MIN_SUBSTRING_LENGTH = 3
+
+    DDL = [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS user_search USING fts5(
+            username, display_name, content='user', content_rowid='id', tokenize='trigram'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS user_search_insert AFTER INSERT ON "user" BEGIN
+            INSERT INTO user_search(rowid, username, display_name) VALUES (new.id, new.username, new.display_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS user_search_delete AFTER DELETE ON "user" BEGIN
+            INSERT INTO user_search(user_search, rowid, username, display_name)
+            VALUES ('delete', old.id, old.username, old.display_name);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS user_search_update AFTER UPDATE OF username, display_name ON "user" BEGIN
+            INSERT INTO user_search(user_search, rowid, username, display_name)
+            VALUES ('delete', old.id, old.username, old.display_name);
+            INSERT INTO user_search(rowid, username, display_name) VALUES (new.id, new.username, new.display_name);
+        END
+        """,
+    ]
+
+    @classmethod
+    def create(cls, engine):
+        """가상 테이블과 동기화 트리거를 만듦 (이미 있으면 건너뜀), 새로 만들었으면 기존 사용자로 채움"""
+        with engine.begin() as conn:
+            exists = conn.execute(
+                db.text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": cls.TABLE}
+            ).first() is not None
+            for statement in cls.DDL:
+                conn.execute(db.text(statement))
+            if not exists:
+                conn.execute(db.text("INSERT INTO user_search(user_search) VALUES ('rebuild')"))
+
+    @classmethod
+    def rebuild(cls):
+        """user 테이블 내용으로 인덱스 전체를 다시 만듦, 색인된 사용자 수 반환 (커밋은 호출한 쪽에서)"""
+        db.session.execute(db.text("INSERT INTO user_search(user_search) VALUES ('rebuild')"))
+        return db.session.scalar(db.text('SELECT count(*) FROM "user"'))
+
+    @classmethod
+    def search_ids(cls, query, limit=10, exclude_id=None):
+        """검색어와 맞는 사용자 ID 목록 (사용자명이 있는 사용자만, 관련도 순)
+
+        단계마다 limit개까지만 읽어 한 문장(UNION ALL)으로 실행하므로 일치하는 사용자가 많아도
+        읽는 행 수가 일정함. 같은 단계 안에서는 일치한 이름이 짧은 순, 길이가 같으면 사용자명 일치가 먼저
+        """
+        query = (query or "").strip()
+        if not query or limit <= 0:
+            return []
+
+        params = {"query": query, "limit": limit, "exclude_id": exclude_id or 0}
+        #0: 정확히 일치, 1: 앞부분 일치 (사용자명/표시 이름 각각 인덱스 순서로 limit개)
+        tiers = [
+            """
+            SELECT * FROM (
+                SELECT id, 0 AS tier, CASE WHEN lower(username) = lower(:query) THEN 0 ELSE 1 END AS field,
+                       lower(:query) AS matched
+                FROM "user"
+                WHERE (lower(username) = lower(:query) OR lower(display_name) = lower(:query))
+                  AND username IS NOT NULL AND id != :exclude_id
+                LIMIT :limit
+            )
+            """,
+            """
+            SELECT * FROM (
+                SELECT id, 1 AS tier, 0 AS field, lower(username) AS matched FROM "user"
+                WHERE lower(username) >= lower(:query) AND lower(username) < lower(:query) || char(1114111)
+                  AND id != :exclude_id
+                ORDER BY lower(username) LIMIT :limit
+            )
+            """,
+            """
+            SELECT * FROM (
+                SELECT id, 1 AS tier, 1 AS field, lower(display_name) AS matched FROM "user"
+                WHERE lower(display_name) >= lower(:query) AND lower(display_name) < lower(:query) || char(1114111)
+                  AND username IS NOT NULL AND id != :exclude_id
+                ORDER BY lower(display_name) LIMIT :limit
+            )
+            """,
+        ]
+        #2: 부분 일치 - 앞 단계 결과와 겹치는 행이 있어도 limit개면 모자라지 않음
+        #(앞 단계가 limit개를 못 채웠다면 앞 단계 결과가 전부이므로 겹치는 행은 그 이하)
+        if len(query) < cls.MIN_SUBSTRING_LENGTH:
+            #trigram이 못 찾는 짧은 검색어는 user를 LIKE로 훑되 limit개를 찾으면 멈춤
+            #(한두 글자는 대부분 금방 채워지고, 끝까지 훑는 건 일치하는 사용자가 limit명 미만일 때뿐)
+            params["pattern"] = "%" + cls._escape_like(query) + "%"
+            tiers.append(
+                """
+                SELECT * FROM (
+                    SELECT id, 2 AS tier, CASE WHEN username LIKE :pattern ESCAPE '\\' THEN 0 ELSE 1 END AS field,
+                           lower(CASE WHEN username LIKE :pattern ESCAPE '\\' THEN username ELSE display_name END) AS matched
+                    FROM "user"
+                    WHERE (username LIKE :pattern ESCAPE '\\' OR display_name LIKE :pattern ESCAPE '\\')
+                      AND username IS NOT NULL AND id != :exclude_id
+                    LIMIT :limit
+                )
+                """
+            )
+        else:
+            params["phrase"] = '"' + query.replace('"', '""') + '"'
+            tiers.append(
+                """
+                SELECT * FROM (
+                    SELECT "user".id, 2 AS tier, 0 AS field, lower("user".username) AS matched
+                    FROM user_search JOIN "user" ON "user".id = user_search.rowid
+                    WHERE user_search MATCH :phrase AND "user".username IS NOT NULL AND "user".id != :exclude_id
+                    LIMIT :limit
+                )
+                """
+            )
+
+        rows = db.session.execute(db.text(" UNION ALL ".join(tiers)), params).all()
+        ranked = {}
+        for row in sorted(rows, key=lambda row: (row.tier, len(row.matched), row.field, row.matched)):
+            ranked.setdefault(row.id, row.tier)
+        return list(ranked)[:limit]
+
+    @staticmethod
+    def _escape_like(text):
+        """LIKE 패턴 안에서 %, _를 글자 그대로 찾도록 이스케이프 (ESCAPE '\\')"""
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
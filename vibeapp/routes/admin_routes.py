@@ -1,7 +1,11 @@
-from flask import Blueprint, render_template, redirect, url_for
+from flask import Blueprint, jsonify, render_template, redirect, url_for
 
 from vibeapp.models.user import User
 from vibeapp.decorators.auth import admin_required
+from vibeapp.services.http_client import http_client
+from vibeapp.services.rate_limiter import rate_limiter
+from vibeapp.services.response_cache import response_cache
+from vibeapp.services.token_manager import token_manager
 
 admin_bp = Blueprint(
     "admin",
@@ -23,4 +27,15 @@ def dashboard():
 @admin_required
 def show_database():
     users = User.query.all()
-    return render_template("admin/admin_database.html", users=users)
\ No newline at end of file
+    return render_template("admin/admin_database.html", users=users)
+
+@admin_bp.route("/stats")
+@admin_required
+def stats():
+    """모니터링용 내부 통계 (외부 HTTP 커넥션 풀, 레이트 리미터, 응답 캐시 등)"""
+    return jsonify({
+        "http_client": http_client.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "response_cache": response_cache.stats(),
+        "token_manager": token_manager.stats(),
+    }), 200
\ No newline at end of file
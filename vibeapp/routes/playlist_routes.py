@@ -1,31 +1,96 @@
-from flask import Blueprint, render_template, session
+from flask import Blueprint, jsonify, render_template, request, session
 from flask_login import login_required
 
+from vibeapp.config import Config
 from vibeapp.models.platform_connection import PlatformConnection
 from vibeapp.models.playlist import Playlist
+from vibeapp.models.sync_job import SyncJob
+from vibeapp.services.auth_service import AuthService
+from vibeapp.services.match_service import MatchService
 from vibeapp.services.playlist_service import PlaylistService
+from vibeapp.services.sync_queue import sync_queue
 
 
 playlist_bp = Blueprint("playlist", __name__,)
 
-#플레이리스트 라우터
-@playlist_bp.route("/my-playlists")
-@login_required
-def my_playlists():
+
+def _get_active_connection():
+    """세션의 활성 플랫폼 연결 반환"""
     user_data = session.get("user")
     active_platform = user_data.get("active_platform")
     platform_info = user_data["platforms"].get(active_platform)
     
     connection_id = platform_info["connection_id"]
-    connection = PlatformConnection.query.get(connection_id)
+    return PlatformConnection.query.get(connection_id)
+
+
+#플레이리스트 라우터
+@playlist_bp.route("/my-playlists")
+@login_required
+def my_playlists():
+    connection = _get_active_connection()
+    
+    #?refresh=1 이면 신선도와 관계없이 다시 동기화
+    force = request.args.get("refresh") == "1"
     
-    playlist_service = PlaylistService()
-    playlist_service.get_and_save_playlists(connection)
+    #저장된 플레이리스트를 바로 보여주고, 오래됐으면 백그라운드에서 동기화
+    #(PLAYLIST_SYNC_ON_VIEW가 꺼져 있으면 `flask sync-all`이 동기화를 담당)
+    sync_job = None
+    if force or (Config.PLAYLIST_SYNC_ON_VIEW and not PlaylistService.is_fresh(connection)):
+        sync_job = sync_queue.enqueue(connection, force=force)
     
     #DB에서 가져오기 (정렬 포함)
-    playlists = Playlist.query.filter_by(
-        platform=connection.platform,
-        platform_user_id=connection.platform_user_id,
-    ).order_by(Playlist.name.asc()).all()
+    playlists = Playlist.get_for_owner(connection.platform, connection.platform_user_id)
+    
+    return render_template("user/my_playlists.html", playlists=playlists, platform=connection.platform, sync_job=sync_job)
+
+
+@playlist_bp.route("/api/my-playlists/sync-status", methods=["GET"])
+@login_required
+def sync_status():
+    """활성 연결의 최근 동기화 작업 상태 API (페이지에서 완료 여부 폴링용)"""
+    connection = _get_active_connection()
+    
+    job = SyncJob.get_latest_for_connection(connection.id)
+    
+    return jsonify({
+        "job": job.to_dict() if job else None,
+        "last_synced_at": connection.last_synced_at.isoformat() if connection.last_synced_at else None,
+    }), 200
+
+
+@playlist_bp.route("/api/playlists/<int:playlist_id>/match/<platform>", methods=["GET"])
+@login_required
+def match_playlist(playlist_id, platform):
+    """내 플레이리스트의 트랙들을 다른 플랫폼 트랙으로 한 번에 매칭하는 API"""
+    user_data = session.get("user")
+    connection_ids = [info["connection_id"] for info in user_data.get("platforms", {}).values()]
+    
+    playlist = Playlist.query.filter(
+        Playlist.id == playlist_id,
+        Playlist.platform_connection_id.in_(connection_ids)
+    ).first()
+    if not playlist:
+        return jsonify({"error": "플레이리스트를 찾을 수 없습니다."}), 404
+    
+    #대상 플랫폼에 연결돼 있으면 검색 API까지 사용, 아니면 저장된 인덱스로만 매칭
+    access_token = None
+    target_info = user_data.get("platforms", {}).get(platform)
+    if target_info:
+        target_connection = PlatformConnection.query.get(target_info["connection_id"])
+        if target_connection:
+            access_token = AuthService().refresh_token(target_connection)
+    
+    results = MatchService().match_playlist(playlist, platform, access_token=access_token)
     
-    return render_template("user/my_playlists.html", playlists=playlists, platform=active_platform)
\ No newline at end of file
+    return jsonify({
+        "playlist_id": playlist.id,
+        "target_platform": platform,
+        "tracks": [{
+            "position": result["position"],
+            "track": result["track"].to_dict(),
+            "match": result["match"].to_dict() if result["match"] else None,
+            "method": result["method"],
+        } for result in results],
+        "matched_count": sum(1 for result in results if result["match"]),
+    }), 200
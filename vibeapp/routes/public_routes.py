@@ -1,4 +1,3 @@
-import requests
 from flask import Blueprint, jsonify, redirect, render_template, request, session, url_for
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
@@ -13,6 +12,8 @@ from vibeapp.models.platform_token import PlatformToken
 from vibeapp.models.playlist import Playlist
 from vibeapp.models.friend import Friend
 from vibeapp.exceptions import UnsupportedPlatformError, TokenRefreshError
+from vibeapp.services.platform_adapter import get_adapter, is_supported
+from vibeapp.services.token_manager import token_manager
 from vibeapp.utils.auth_utils import get_current_user_safely, require_user_safely
 
 
@@ -124,46 +125,26 @@ def logout():
 @public_bp.route("/callback/<platform>")
 def callback_platform(platform):
     """OAuth 콜백 처리"""
-    # 1.플랫폼 설정 확인
-    platform_config = Config.PLATFORM_OAUTH.get(platform)
-    if not platform_config:
+    # 1.플랫폼 확인
+    if not is_supported(platform) or platform not in Config.PLATFORM_OAUTH:
         raise UnsupportedPlatformError(f"{platform} 콜백은 아직 지원되지 않습니다.", 400)
+    adapter = get_adapter(platform)
 
     code = request.args.get("code")
     if not code:
         raise TokenRefreshError("Authorization code가 없습니다.", 400)
 
     # 2. 토큰 요청
-    token_payload = {
-        "grant_type": "authorization_code",
-        "code": code,
-        "redirect_uri": platform_config["REDIRECT_URI"],
-        "client_id": platform_config["CLIENT_ID"],
-        "client_secret": platform_config["CLIENT_SECRET"],
-    }
-    token_res = requests.post(platform_config["TOKEN_URL"], data=token_payload)
-    if token_res.status_code != 200:
-        raise TokenRefreshError(f"토큰 요청 실패", 400)
-
-    token_data = token_res.json()
+    token_data = adapter.exchange_code(code)
     access_token = token_data.get("access_token")
     refresh_token = token_data.get("refresh_token")
     expires_in = token_data.get("expires_in", 3600)
     expire_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
 
-    # 3. 사용자 정보 요청
-    user_info_res = requests.get(
-        platform_config["USER_INFO_URL"],
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-    if user_info_res.status_code != 200:
-        print("📡 user_info_res.status:", user_info_res.status_code)
-        print("📡 user_info_res.text:", user_info_res.text)
-        raise TokenRefreshError(f"사용자 정보 요청 실패", 400)
-
-    user_info = user_info_res.json()
+    # 3. 사용자 정보 요청 (플랫폼별 응답은 어댑터가 {"id", "display_name"}으로 변환)
+    user_info = adapter.get_user_info(access_token)
     platform_user_id = user_info.get("id")
-    display_name = user_info.get("display_name", "익명의 사용자")
+    display_name = user_info.get("display_name") or "익명의 사용자"
 
     # 4. 기존 연결 확인
     connection = PlatformConnection.query.filter_by(
@@ -180,6 +161,7 @@ def callback_platform(platform):
         token.refresh_token = refresh_token or token.refresh_token
         token.expire_at = expire_at
         db.session.commit()
+        token_manager.invalidate(connection.id)
 
     else:
         # 5. 새 유저 + 연결 생성
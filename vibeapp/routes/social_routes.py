@@ -1,13 +1,16 @@
 from flask import Blueprint, redirect, render_template, request, jsonify, session, url_for
 from flask_login import login_required, current_user
-from sqlalchemy import and_, or_
 
+from vibeapp.config import Config
 from vibeapp.extensions import db
 from vibeapp.models.user import User
 from vibeapp.models.friend import Friend
 from vibeapp.exceptions import FriendRequestError
+from vibeapp.utils.pagination import clamp_limit
 
 from vibeapp.services.user_services import UserService, FriendService
+from vibeapp.services.recommendation_service import RecommendationService
+from vibeapp.services.friend_graph import friend_graph
 
 social_bp = Blueprint("social", __name__)
 
@@ -22,27 +25,27 @@ def main():
     else:
         current_user_obj = current_user
     
-    # 받은 친구 신청 (대기중만)
-    pending_requests = Friend.query.filter_by(
-        receiver_id=current_user_obj.id,
-        status="pending"
-    ).all()
-    
-    # 내 친구 목록
-    friends = Friend.get_friends_for_user(current_user_obj.id)
-    
-    # 보낸 친구 신청
-    sent_requests = Friend.query.filter_by(requester_id=current_user_obj.id).all()
-    
-    # 대기중인 받은 신청 개수
-    pending_requests_count = len(pending_requests)
+    #목록마다 따로 커서 페이지네이션 (?friends_cursor=..., ?received_cursor=..., ?sent_cursor=...)
+    try:
+        friends, friends_next = Friend.get_friends_page(
+            current_user_obj.id, request.args.get("friends_cursor"), Config.SOCIAL_PAGE_SIZE
+        )
+        pending_requests, received_next = Friend.get_received_requests_page(
+            current_user_obj.id, request.args.get("received_cursor"), Config.SOCIAL_PAGE_SIZE
+        )
+        sent_requests, sent_next = Friend.get_sent_requests_page(
+            current_user_obj.id, request.args.get("sent_cursor"), Config.SOCIAL_PAGE_SIZE
+        )
+    except ValueError:
+        return redirect(url_for("social.main"))
     
     return render_template("social/social.html", 
                          user=current_user_obj,
                          pending_requests=pending_requests,
                          friends=friends,
                          sent_requests=sent_requests,
-                         pending_requests_count=pending_requests_count)
+                         pending_requests_count=current_user_obj.pending_received_count,
+                         next_cursors={"friends": friends_next, "received": received_next, "sent": sent_next})
     
     
 @social_bp.route("/send-friend-request", methods=["POST"])
@@ -68,38 +71,11 @@ def send_friend_request():
         if not target_user:
             return jsonify({"error": "존재하지 않는 사용자입니다."}), 404
         
-        # 자기 자신에게 신청하는지 확인
-        if target_user.id == current_user_obj.id:
-            return jsonify({"error": "자기 자신에게는 친구 신청을 보낼 수 없습니다."}), 400
-        
-        # 이미 친구 관계가 있는지 확인
-        existing_friendship = Friend.query.filter(
-            or_(
-                and_(Friend.requester_id == current_user_obj.id, Friend.receiver_id == target_user.id),
-                and_(Friend.requester_id == target_user.id, Friend.receiver_id == current_user_obj.id)
-            )
-        ).first()
-        
-        if existing_friendship:
-            if existing_friendship.status == "accepted":
-                return jsonify({"error": "이미 친구입니다."}), 400
-            elif existing_friendship.status == "pending":
-                if existing_friendship.requester_id == current_user_obj.id:
-                    return jsonify({"error": "이미 친구 신청을 보냈습니다."}), 400
-                else:
-                    return jsonify({"error": "상대방이 이미 친구 신청을 보냈습니다. 받은 신청을 확인해주세요."}), 400
-            elif existing_friendship.status == "rejected":
-                # 거절된 신청이 있으면 삭제하고 새로 생성
-                db.session.delete(existing_friendship)
-                db.session.commit()
-        
-        # 친구 신청 생성
-        friend_request = Friend(
-            requester_id=current_user_obj.id,
-            receiver_id=target_user.id,
-            status="pending"
-        )
-        db.session.add(friend_request)
+        #자기 자신/이미 친구/이미 신청한 상태 확인과 거절된 신청 재사용은 upsert 한 문장으로 처리
+        try:
+            Friend.create_request(current_user_obj.id, target_user.id)
+        except FriendRequestError as e:
+            return jsonify({"error": str(e)}), 400
         db.session.commit()
         
         return jsonify({
@@ -142,12 +118,43 @@ def send_friend_request_by_id():
                 "success": True,
                 "message": f"{target_user.display_name or target_user.username}님에게 친구 신청을 보냈습니다."
             }), 200
-        except ValueError as e:
+        except FriendRequestError as e:
             return jsonify({"error": str(e)}), 400
         
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": "친구 신청 중 오류가 발생했습니다."}), 500
+
+
+@social_bp.route("/send-friend-requests", methods=["POST"])
+@login_required
+def send_friend_requests():
+    """여러 사용자명에게 한 번에 친구 신청 (연락처 가져오기용), 사용자명별 결과 반환"""
+    data = request.get_json(silent=True) or {}
+    usernames = data.get("usernames")
+    if not isinstance(usernames, list) or not all(isinstance(username, str) for username in usernames):
+        return jsonify({"error": "usernames는 사용자명 목록이어야 합니다."}), 400
+    if len(usernames) > Config.FRIEND_INVITE_MAX_USERNAMES:
+        return jsonify({"error": f"한 번에 최대 {Config.FRIEND_INVITE_MAX_USERNAMES}명까지 신청할 수 있습니다."}), 400
+    
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    try:
+        results = FriendService.send_requests(current_user_obj.id, usernames)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "친구 신청 중 오류가 발생했습니다."}), 500
+    
+    return jsonify({
+        "success": True,
+        "results": results,
+        "sent": sum(1 for result in results if result["status"] == "sent")
+    }), 200
    
     
 @social_bp.route("/respond-friend-request/<int:request_id>/<action>", methods=["POST"])
@@ -175,13 +182,13 @@ def respond_friend_request(request_id, action):
     
     try:
         if action == "accept":
-            friend_request.status = "accepted"
+            friend_request.accept()
+            RecommendationService.on_friendship_changed(friend_request.requester_id, friend_request.receiver_id)
             message = f"{friend_request.requester.display_name or friend_request.requester.username}님과 친구가 되었습니다!"
         else:
-            friend_request.status = "rejected"
+            friend_request.reject()
             message = "친구 신청을 거절했습니다."
         
-        friend_request.updated_at = db.func.now()
         db.session.commit()
         return jsonify({"success": True, "message": message}), 200
         
@@ -211,7 +218,7 @@ def cancel_web_friend_request(request_id):
         return jsonify({"error": "유효하지 않은 친구 신청입니다."}), 404
     
     try:
-        db.session.delete(friend_request)
+        friend_request.cancel()
         db.session.commit()
         return jsonify({"success": True, "message": "친구 신청을 취소했습니다."}), 200
         
@@ -220,6 +227,29 @@ def cancel_web_friend_request(request_id):
         return jsonify({"error": "취소 중 오류가 발생했습니다."}), 500
 
 
+@social_bp.route("/remove-friend/<int:user_id>", methods=["POST"])
+@login_required
+def remove_friend(user_id):
+    """친구 삭제"""
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    try:
+        if not Friend.remove_friendship(current_user_obj.id, user_id):
+            db.session.rollback()
+            return jsonify({"error": "친구 관계가 아닙니다."}), 404
+        RecommendationService.on_friendship_changed(current_user_obj.id, user_id)
+        db.session.commit()
+        return jsonify({"success": True, "message": "친구를 삭제했습니다."}), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": "삭제 중 오류가 발생했습니다."}), 500
+
+
 # 호환성을 위한 리다이렉트 라우트트
 @social_bp.route("/friend-requests")
 @login_required
@@ -245,7 +275,7 @@ def sent_requests():
 @social_bp.route("/api/search-users", methods=["GET"])
 @login_required
 def search_users():
-    """사용자 검색 API(부분 일치)"""
+    """사용자 검색 API (사용자명/표시 이름, 정확히 > 앞부분 > 부분 일치 순)"""
     query = request.args.get("q", "").strip()
     
     
@@ -258,38 +288,172 @@ def search_users():
     
     users = UserService.search_users(query, current_user_obj.id)
     
-    users_data = [
-        UserService.get_user_relationship_info(user, current_user_obj.id)
-        for user in users
-    ]
+    users_data = UserService.get_users_relationship_info(users, current_user_obj.id)
     
     return jsonify({"users": users_data}), 200
 
 
+def _page_args():
+    """목록 API의 cursor/limit 쿼리 파라미터 (limit은 SOCIAL_MAX_PAGE_SIZE로 제한)"""
+    return request.args.get("cursor"), clamp_limit(
+        request.args.get("limit", type=int), Config.SOCIAL_PAGE_SIZE, Config.SOCIAL_MAX_PAGE_SIZE
+    )
+
+
 @social_bp.route("/api/friends", methods=["GET"])
 @login_required
 def get_friends_api():
-    """친구 목록"""
+    """친구 목록 API (cursor/limit 페이지네이션)"""
     user_data = session.get("user")
     if user_data:
         current_user_obj = User.query.get(user_data["id"])
     else:
         current_user_obj = current_user
-        
-    return jsonify(FriendService.get_friends_list(current_user_obj.id)), 200
+    
+    try:
+        return jsonify(FriendService.get_friends_list(current_user_obj.id, *_page_args())), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     
     
 @social_bp.route("/api/friend-requests", methods=["GET"])
 @login_required
 def get_friend_requests_api():
-    """받은 친구 신청 목록 API"""
+    """받은 친구 신청 목록 API (cursor/limit 페이지네이션)"""
     user_data = session.get("user")
     if user_data:
         current_user_obj = User.query.get(user_data["id"])
     else:
         current_user_obj = current_user
-        
-    return jsonify(FriendService.get_pending_requests(current_user_obj.id)), 200
+    
+    try:
+        return jsonify(FriendService.get_pending_requests(current_user_obj.id, *_page_args())), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@social_bp.route("/api/sent-requests", methods=["GET"])
+@login_required
+def get_sent_requests_api():
+    """보낸 대기중 친구 신청 목록 API (cursor/limit 페이지네이션)"""
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    try:
+        return jsonify(FriendService.get_sent_requests(current_user_obj.id, *_page_args())), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+
+@social_bp.route("/api/users/<int:user_id>/mutual-friends", methods=["GET"])
+@login_required
+def get_mutual_friends_api(user_id):
+    """공통 친구 목록 API (offset/limit 페이지네이션, 친구인 경우에만)"""
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    if not Friend.are_friends(current_user_obj.id, user_id):
+        return jsonify({"error": "친구인 사용자의 공통 친구만 볼 수 있습니다."}), 403
+    
+    limit = min(max(request.args.get("limit", Config.MUTUAL_FRIENDS_SAMPLE_SIZE, type=int), 1), Config.MUTUAL_FRIENDS_MAX_PAGE_SIZE)
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    count, users = Friend.get_mutual_friends(current_user_obj.id, user_id, limit, offset)
+    
+    return jsonify({
+        "friends": [{
+            "id": user.id,
+            "username": user.username,
+            "display_name": user.display_name,
+            "platform_connections": [conn.platform for conn in user.platform_connections]
+        } for user in users],
+        "count": count,
+        "offset": offset,
+        "limit": limit
+    }), 200
+
+
+@social_bp.route("/api/recommendations", methods=["GET"])
+@login_required
+def get_recommendations_api():
+    """알 수도 있는 사람 추천 API (미리 계산된 점수순, offset/limit 페이지네이션)"""
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    limit = min(max(request.args.get("limit", Config.RECOMMENDATION_PAGE_SIZE, type=int), 1), Config.RECOMMENDATION_MAX_PAGE_SIZE)
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    recommendations = RecommendationService.get_recommendations(current_user_obj.id, limit, offset)
+    
+    return jsonify({
+        "recommendations": [{
+            "id": rec.candidate.id,
+            "username": rec.candidate.username,
+            "display_name": rec.candidate.display_name,
+            "platform_connections": [conn.platform for conn in rec.candidate.platform_connections],
+            "mutual_friends_count": rec.mutual_count,
+            "shared_platforms_count": rec.shared_platforms,
+            "score": rec.score
+        } for rec in recommendations],
+        "offset": offset,
+        "limit": limit
+    }), 200
+
+
+@social_bp.route("/api/users/<int:user_id>/connection", methods=["GET"])
+@login_required
+def get_connection_api(user_id):
+    """나와 다른 사용자를 잇는 최단 친구 경로 API (몇 다리 건너 아는 사이인지)"""
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    if not User.query.get(user_id):
+        return jsonify({"error": "존재하지 않는 사용자입니다."}), 404
+    
+    path = friend_graph.shortest_path(current_user_obj.id, user_id)
+    if path is None:
+        return jsonify({"degrees": None, "path": []}), 200
+    
+    users = {user.id: user for user in User.query.filter(User.id.in_(path))}
+    return jsonify({
+        "degrees": len(path) - 1,
+        "path": [{
+            "id": users[path_user_id].id,
+            "username": users[path_user_id].username,
+            "display_name": users[path_user_id].display_name
+        } for path_user_id in path if path_user_id in users]
+    }), 200
+
+
+@social_bp.route("/api/network", methods=["GET"])
+@login_required
+def get_network_api():
+    """내 친구 네트워크 크기 API (1 ~ hops 단계 떨어진 사용자 수)"""
+    user_data = session.get("user")
+    if user_data:
+        current_user_obj = User.query.get(user_data["id"])
+    else:
+        current_user_obj = current_user
+    
+    hops = min(max(request.args.get("hops", 2, type=int), 1), Config.FRIEND_GRAPH_MAX_HOPS)
+    layers, truncated = friend_graph.neighborhood(current_user_obj.id, hops)
+    
+    return jsonify({
+        "hops": hops,
+        "counts": [len(layer) for layer in layers],
+        "total": sum(len(layer) for layer in layers),
+        "truncated": truncated
+    }), 200
 
 
 @social_bp.route("/user/<username>")
@@ -328,13 +492,12 @@ def user_profile(username):
         relationship_status = "recieved_request"
         friend_request = Friend.get_pending_request(profile_user.id, current_user_obj.id)
         
-    #친구들의 공통 친구 찾기 (친구인 경우에만)
-    mutual_friends = []
+    #친구들의 공통 친구 찾기 (친구인 경우에만, 전체 수 + 앞쪽 일부)
+    mutual_friends_count, mutual_friends = 0, []
     if relationship_status == "friend":
-        current_user_friends = set(friend.id for friend in current_user_obj.get_friends())
-        profile_user_friends = set(friend.id for friend in profile_user.get_friends())
-        mutual_friend_ids = current_user_friends & profile_user_friends
-        mutual_friends = [User.query.get(fid) for fid in mutual_friend_ids]
+        mutual_friends_count, mutual_friends = Friend.get_mutual_friends(
+            current_user_obj.id, profile_user.id, Config.MUTUAL_FRIENDS_SAMPLE_SIZE
+        )
         
     
     return render_template("social/user_profile.html",
@@ -342,4 +505,5 @@ def user_profile(username):
                            profile_user=profile_user,
                            relationship_status=relationship_status,
                            friend_request=friend_request,
-                           mutual_friends=mutual_friends)
\ No newline at end of file
+                           mutual_friends=mutual_friends,
+                           mutual_friends_count=mutual_friends_count)
\ No newline at end of file
@@ -0,0 +1,398 @@
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from itertools import accumulate
+from operator import itemgetter
+
+from sqlalchemy import delete, func, select
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.friend_edge import FriendEdge
+from vibeapp.models.friend_edge_change import FriendEdgeChange
+
+
+SNAPSHOT_MAGIC = b"VIBEGRF1"
+#매직, 최대 사용자 ID, 간선 수, 스냅샷에 반영된 마지막 변경 로그 ID, 생성 시각(Unix 초)
+SNAPSHOT_HEADER = struct.Struct("<8sqqqq")
+READ_CHUNK = 100_000
+
+
+class GraphSnapshot:
+    """mmap으로 연 친구 그래프 스냅샷 파일 (CSR, 읽기 전용)
+
+    헤더 뒤에 offsets(int64, 최대 사용자 ID + 2개)와 neighbors(int32, 간선 수만큼)가 이어짐.
+    사용자 ID를 그대로 인덱스로 써서 neighbors[offsets[u]:offsets[u + 1]]이 u의 친구 ID(오름차순)
+    """
+
+    def __init__(self, path):
+        self.file_id = _file_id(path)
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        magic, self.max_user_id, self.edges, self.last_change_id, self.built_at = SNAPSHOT_HEADER.unpack_from(view)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"친구 그래프 스냅샷 형식이 아닙니다: {path}")
+        start = SNAPSHOT_HEADER.size
+        end = start + 8 * (self.max_user_id + 2)
+        self.offsets = view[start:end].cast("q")
+        self.neighbors = view[end:end + 4 * self.edges].cast("i")
+        self.size = len(view)
+
+    def friends(self, user_id):
+        if 0 < user_id <= self.max_user_id:
+            return self.neighbors[self.offsets[user_id]:self.offsets[user_id + 1]]
+        return ()
+
+    def has_edge(self, user_id, friend_id):
+        friends = self.friends(user_id)
+        index = bisect_left(friends, friend_id)
+        return index < len(friends) and friends[index] == friend_id
+
+
+class _Overlay(dict):
+    """GraphView.apply에서 쓰는 사용자별 간선 집합 사본
+
+    다른 스레드가 읽는 중인 이전 GraphView의 집합은 건드리지 않도록 처음 고칠 때만 복사함
+    """
+
+    def __init__(self, overlay):
+        super().__init__(overlay)
+        self._copied = set()
+
+    def for_user(self, user_id):
+        if user_id not in self._copied:
+            self._copied.add(user_id)
+            self[user_id] = set(self.get(user_id, ()))
+        return self[user_id]
+
+
+class GraphView:
+    """스냅샷 + 스냅샷 이후 변경 로그를 반영한 그래프 (읽기 전용, 갱신 시 새 객체로 교체)
+
+    added/removed는 스냅샷과 다른 간선만 사용자별로 담음. 변경 로그는 같은 변경을 두 번
+    반영해도 결과가 같도록 스냅샷 기준으로 적용하므로, 스냅샷을 만들며 이미 반영된 변경을
+    다시 읽어도 됨
+    """
+
+    def __init__(self, snapshot, added=None, removed=None, last_change_id=None, pending_changes=0):
+        self.snapshot = snapshot
+        self.added = added or {}
+        self.removed = removed or {}
+        self.last_change_id = snapshot.last_change_id if last_change_id is None else last_change_id
+        self.pending_changes = pending_changes
+
+    def apply(self, changes):
+        """(id, user_id, friend_id, linked) 변경 로그 행들을 반영한 새 GraphView 반환"""
+        added, removed = _Overlay(self.added), _Overlay(self.removed)
+        for _, user1_id, user2_id, linked in changes:
+            for user_id, friend_id in ((user1_id, user2_id), (user2_id, user1_id)):
+                in_snapshot = self.snapshot.has_edge(user_id, friend_id)
+                if linked:
+                    removed.for_user(user_id).discard(friend_id)
+                    if not in_snapshot:
+                        added.for_user(user_id).add(friend_id)
+                else:
+                    added.for_user(user_id).discard(friend_id)
+                    if in_snapshot:
+                        removed.for_user(user_id).add(friend_id)
+        return GraphView(
+            self.snapshot,
+            {user_id: friends for user_id, friends in added.items() if friends},
+            {user_id: friends for user_id, friends in removed.items() if friends},
+            changes[-1][0],
+            self.pending_changes + len(changes),
+        )
+
+    def friends(self, user_id):
+        friends = self.snapshot.friends(user_id)
+        added = self.added.get(user_id)
+        removed = self.removed.get(user_id)
+        if not added and not removed:
+            return friends
+        if removed:
+            friends = [friend_id for friend_id in friends if friend_id not in removed]
+        return [*friends, *(added or ())]
+
+    def shortest_path(self, source_id, target_id, max_depth, max_visited):
+        """양방향 BFS로 source → target 최단 경로(사용자 ID 리스트) 반환, 없으면 None
+
+        두 방향 중 방문 예정 노드가 적은 쪽을 한 단계씩 넓히고, 새로 방문한 노드가 반대쪽에서
+        이미 방문한 노드면 그 지점에서 경로를 이음. max_depth 단계 안에 못 찾거나 방문한 노드가
+        max_visited를 넘으면 None
+        """
+        if source_id == target_id:
+            return [source_id]
+        forward, backward = {source_id: None}, {target_id: None}
+        forward_frontier, backward_frontier = [source_id], [target_id]
+        for _ in range(max_depth):
+            if not forward_frontier or not backward_frontier:
+                return None
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier, meeting = self._expand(forward_frontier, forward, backward)
+            else:
+                backward_frontier, meeting = self._expand(backward_frontier, backward, forward)
+            if meeting is not None:
+                return _join_path(meeting, forward, backward)
+            if len(forward) + len(backward) > max_visited:
+                return None
+        return None
+
+    def _expand(self, frontier, parents, other_parents):
+        """frontier를 한 단계 넓힘, (다음 frontier, 반대쪽과 만난 노드 또는 None) 반환"""
+        next_frontier = []
+        for node in frontier:
+            for friend_id in self.friends(node):
+                if friend_id in parents:
+                    continue
+                parents[friend_id] = node
+                if friend_id in other_parents:
+                    return next_frontier, friend_id
+                next_frontier.append(friend_id)
+        return next_frontier, None
+
+    def neighborhood(self, user_id, hops, max_visited):
+        """user_id에서 1 ~ hops 단계 떨어진 사용자 ID를 단계별 리스트로 반환
+
+        Returns:
+            tuple: (단계별 사용자 ID 리스트의 리스트, max_visited에 걸려 중간에 멈췄는지 여부)
+        """
+        visited = {user_id}
+        layers = []
+        frontier = [user_id]
+        for _ in range(hops):
+            next_frontier = []
+            for node in frontier:
+                for friend_id in self.friends(node):
+                    if friend_id not in visited:
+                        visited.add(friend_id)
+                        next_frontier.append(friend_id)
+                if len(visited) > max_visited:
+                    layers.append(next_frontier)
+                    return layers, True
+            if not next_frontier:
+                break
+            layers.append(next_frontier)
+            frontier = next_frontier
+        return layers, False
+
+
+class FriendGraph:
+    """친구 관계 그래프 탐색 (연결 경로/몇 다리 건너 아는 사이인지, k단계 이웃)
+
+    - friend_edge 전체를 CSR 배열로 만든 스냅샷 파일(instance/FRIEND_GRAPH_SNAPSHOT_NAME)을
+      mmap으로 열어 모든 워커 프로세스가 같은 페이지 캐시를 공유
+    - 스냅샷 이후의 친구 추가/삭제는 FriendEdgeChange 로그에서 읽어 워커 메모리에 반영
+      (FRIEND_GRAPH_REFRESH_SECONDS마다 확인, 다른 프로세스가 파일을 바꾸면 다시 엶)
+    - 스냅샷은 `flask rebuild-friend-graph`로 주기적으로 다시 만들고, 파일이 없거나 쌓인
+      변경이 FRIEND_GRAPH_MAX_PENDING_CHANGES를 넘으면 워커가 직접 다시 만듦
+    - 다시 만드는 건 스냅샷 옆 잠금 파일(.lock)의 flock을 잡은 프로세스 하나뿐. 잠금을 못 잡은
+      워커는 이전 스냅샷 + 변경 로그로 계속 응답하다가 새 파일이 생기면 다시 엶
+    """
+
+    def __init__(self, app=None):
+        self.snapshot_path = None
+        self._lock = threading.Lock()
+        self._view = None
+        self._checked_at = 0.0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.snapshot_path = os.path.join(app.instance_path, Config.FRIEND_GRAPH_SNAPSHOT_NAME)
+        os.makedirs(app.instance_path, exist_ok=True)
+        app.extensions["friend_graph"] = self
+
+    def shortest_path(self, source_id, target_id, max_depth=None):
+        """두 사용자를 잇는 최단 친구 경로 (양 끝 포함 사용자 ID 리스트), 없으면 None"""
+        return self._current().shortest_path(
+            source_id, target_id, max_depth or Config.FRIEND_GRAPH_MAX_DEPTH, Config.FRIEND_GRAPH_MAX_VISITED
+        )
+
+    def degrees_of_separation(self, source_id, target_id, max_depth=None):
+        """몇 다리 건너 아는 사이인지 (친구면 1), 연결되지 않으면 None"""
+        path = self.shortest_path(source_id, target_id, max_depth)
+        return None if path is None else len(path) - 1
+
+    def neighborhood(self, user_id, hops):
+        """1 ~ hops 단계 이웃을 단계별 리스트로 반환, (리스트, 중간에 멈췄는지 여부)"""
+        return self._current().neighborhood(user_id, hops, Config.FRIEND_GRAPH_MAX_VISITED)
+
+    def stats(self):
+        view = self._current()
+        return {
+            "max_user_id": view.snapshot.max_user_id,
+            "edges": view.snapshot.edges,
+            "snapshot_bytes": view.snapshot.size,
+            "snapshot_age_seconds": round(time.time() - view.snapshot.built_at, 1),
+            "pending_changes": view.pending_changes,
+        }
+
+    def rebuild_snapshot(self):
+        """스냅샷 파일을 다시 만들고, 이전 스냅샷까지 반영된 변경 로그를 지움 (커밋은 호출한 쪽에서)
+
+        지우는 것은 직전 스냅샷 기준이라, 아직 이전 스냅샷을 열고 있는 워커도 그다음 변경부터
+        이어서 읽을 수 있음
+
+        Returns:
+            dict: 최대 사용자 ID, 간선 수, 파일 크기, 지운 변경 로그 수, 소요 시간(초)
+        """
+        started = time.perf_counter()
+        with self._rebuild_lock(blocking=True):
+            previous_change_id = _snapshot_change_id(self.snapshot_path)
+            max_user_id, edges, size = self._write_snapshot()
+        pruned = 0
+        if previous_change_id is not None:
+            pruned = db.session.execute(
+                delete(FriendEdgeChange).where(FriendEdgeChange.id <= previous_change_id)
+            ).rowcount
+        with self._lock:
+            self._view = None
+        return {
+            "max_user_id": max_user_id,
+            "edges": edges,
+            "snapshot_bytes": size,
+            "pruned_changes": pruned,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+
+    def _current(self):
+        """갱신 간격이 지났으면 스냅샷 파일/변경 로그를 확인해 최신 GraphView 반환"""
+        view = self._view
+        if view is not None and time.monotonic() - self._checked_at < Config.FRIEND_GRAPH_REFRESH_SECONDS:
+            return view
+        with self._lock:
+            if self._view is None or time.monotonic() - self._checked_at >= Config.FRIEND_GRAPH_REFRESH_SECONDS:
+                self._view = self._refresh(self._view)
+                self._checked_at = time.monotonic()
+            return self._view
+
+    def _refresh(self, view):
+        if _file_id(self.snapshot_path) is None:
+            #보여 줄 스냅샷이 없으므로 다른 프로세스가 만드는 중이면 끝날 때까지 기다림
+            with self._rebuild_lock(blocking=True):
+                if _file_id(self.snapshot_path) is None:
+                    self._write_snapshot()
+        if view is None or view.snapshot.file_id != _file_id(self.snapshot_path):
+            view = GraphView(GraphSnapshot(self.snapshot_path))
+
+        changes = db.session.execute(
+            select(FriendEdgeChange.id, FriendEdgeChange.user_id, FriendEdgeChange.friend_id, FriendEdgeChange.linked)
+            .where(FriendEdgeChange.id > view.last_change_id)
+            .order_by(FriendEdgeChange.id)
+        ).all()
+        if not changes:
+            return view
+        if view.pending_changes + len(changes) > Config.FRIEND_GRAPH_MAX_PENDING_CHANGES:
+            with self._rebuild_lock(blocking=False) as locked:
+                #잠금을 잡기 전에 다른 프로세스가 이미 새 파일로 바꿨으면 다시 만들지 않고 그 파일을 엶
+                if locked and view.snapshot.file_id == _file_id(self.snapshot_path):
+                    self._write_snapshot()
+            if locked:
+                return self._refresh(None)
+            #다른 프로세스가 만드는 중이면 기다리지 않고 이전 스냅샷 + 변경 로그로 응답
+        return view.apply(changes)
+
+    @contextmanager
+    def _rebuild_lock(self, blocking):
+        """스냅샷을 다시 만드는 프로세스가 하나뿐이도록 잠금 파일에 flock을 잡음
+
+        blocking=False면 이미 다른 프로세스가 잡고 있을 때 기다리지 않음. 잡았는지 여부를 넘겨줌
+        """
+        with open(f"{self.snapshot_path}.lock", "a") as f:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _write_snapshot(self):
+        """friend_edge 전체를 읽어 스냅샷 파일을 새로 씀 (임시 파일에 쓴 뒤 교체)
+
+        변경 로그 ID를 간선보다 먼저 읽으므로 그 사이에 생긴 변경은 다음 갱신 때 한 번 더
+        반영되지만, GraphView.apply는 같은 변경을 다시 적용해도 결과가 같음
+
+        Returns:
+            tuple: (최대 사용자 ID, 간선 수, 파일 크기)
+        """
+        last_change_id = db.session.scalar(select(func.max(FriendEdgeChange.id))) or 0
+
+        #수백만 행을 읽으므로 SQLAlchemy 결과 객체를 거치지 않고 같은 연결의 DBAPI 커서에서
+        #조각씩 바로 배열로 옮김 (Core 결과로 읽을 때보다 2배 이상 빠름)
+        degree = Counter()
+        neighbors = array("i")
+        statement = select(FriendEdge.user_id, FriendEdge.friend_id).order_by(FriendEdge.user_id, FriendEdge.friend_id)
+        cursor = db.session.connection().connection.cursor()
+        try:
+            cursor.execute(str(statement.compile(dialect=db.engine.dialect)))
+            while rows := cursor.fetchmany(READ_CHUNK):
+                degree.update(map(itemgetter(0), rows))
+                neighbors.extend(map(itemgetter(1), rows))
+        finally:
+            cursor.close()
+
+        max_user_id = max(degree, default=0)
+        counts = array("q", bytes(8 * (max_user_id + 2)))
+        for user_id, count in degree.items():
+            counts[user_id + 1] = count
+        offsets = array("q", accumulate(counts))
+
+        temp_path = f"{self.snapshot_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, max_user_id, len(neighbors), last_change_id, int(time.time())))
+            offsets.tofile(f)
+            neighbors.tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        return max_user_id, len(neighbors), os.path.getsize(self.snapshot_path)
+
+
+def _file_id(path):
+    """파일이 교체됐는지 확인하기 위한 (inode, 수정 시각, 크기), 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _snapshot_change_id(path):
+    """스냅샷 파일 헤더의 마지막 변경 로그 ID, 파일이 없거나 형식이 다르면 None"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(SNAPSHOT_HEADER.size)
+    except FileNotFoundError:
+        return None
+    if len(header) < SNAPSHOT_HEADER.size:
+        return None
+    magic, _, _, last_change_id, _ = SNAPSHOT_HEADER.unpack(header)
+    return last_change_id if magic == SNAPSHOT_MAGIC else None
+
+
+def _join_path(meeting, forward, backward):
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = forward[node]
+    path.reverse()
+    node = backward[meeting]
+    while node is not None:
+        path.append(node)
+        node = backward[node]
+    return path
+
+
+friend_graph = FriendGraph()
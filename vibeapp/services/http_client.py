@@ -0,0 +1,160 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from vibeapp.config import Config
+
+
+class HttpClient:
+    """모든 외부 플랫폼 호출이 공유하는 HTTP 클라이언트
+
+    - 호스트별 커넥션 풀 재사용 (keep-alive, TLS 핸드셰이크 최소화)
+    - connect/read 타임아웃 기본 적용
+    - 일시적 오류(연결 실패, 429, 5xx)는 지터가 있는 지수 백오프로 재시도
+    - 429/503의 Retry-After 헤더 준수
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self):
+        self.connect_timeout = Config.HTTP_CONNECT_TIMEOUT
+        self.read_timeout = Config.HTTP_READ_TIMEOUT
+        self.max_retries = Config.HTTP_MAX_RETRIES
+        self.backoff_base = Config.HTTP_BACKOFF_BASE
+        self.backoff_max = Config.HTTP_BACKOFF_MAX
+        self.retry_after_max = Config.HTTP_RETRY_AFTER_MAX
+
+        self.adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+            max_retries=0,  # 재시도는 이 클래스에서 직접 처리
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, throttle=None, **kwargs):
+        """재시도 정책을 적용해 요청 전송
+
+        재시도 후에도 실패한 상태 코드 응답은 그대로 반환하고,
+        네트워크 오류는 requests 예외를 그대로 올림
+
+        Args:
+            throttle: rate_limiter.throttle() 핸들. 주어지면 매 시도 전에 토큰을 가져오고
+                429 응답의 대기 시간을 모든 워커와 공유함. Retry-After가 핸들의 최대 대기
+                시간보다 길면 기다리지 않고 응답을 반환 (사용자 요청이 오래 막히지 않도록)
+        """
+        method = method.upper()
+        host = urlsplit(url).netloc
+        kwargs.setdefault("timeout", (self.connect_timeout, self.read_timeout))
+
+        # POST 등 비멱등 요청은 서버가 처리하지 않은 것이 확실한 경우에만 재시도
+        idempotent = method in self.IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            if throttle is not None:
+                throttle.acquire()
+            try:
+                res = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                retryable = isinstance(e, requests.ConnectTimeout) or (
+                    idempotent and isinstance(e, (requests.ConnectionError, requests.Timeout))
+                )
+                if not retryable or attempt >= self.max_retries:
+                    self._record(host, "errors")
+                    raise
+                self._record(host, "network_retries")
+                delay = self._backoff(attempt)
+            else:
+                self._record(host, "requests")
+                retryable = res.status_code in self.RETRY_STATUSES and (
+                    idempotent or res.status_code in (429, 503)
+                )
+                if not retryable or attempt >= self.max_retries:
+                    return res
+
+                retry_after = self._parse_retry_after(res)
+                if retry_after is not None and retry_after > self.retry_after_max:
+                    # 너무 오래 기다려야 하면 호출한 쪽에서 처리하도록 반환
+                    return res
+                if throttle is not None and retry_after is not None and retry_after > throttle.max_wait:
+                    # 이 요청은 바로 실패하되, 다른 요청(백그라운드 작업)이 기다리도록 차단은 공유
+                    if res.status_code == 429:
+                        throttle.penalize(retry_after)
+                    return res
+                self._record(host, f"retries_{res.status_code}")
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                if throttle is not None and res.status_code == 429:
+                    throttle.penalize(delay)
+                res.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _backoff(self, attempt):
+        """지수 백오프 + full jitter"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @staticmethod
+    def _parse_retry_after(res):
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환"""
+        value = res.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _record(self, host, key):
+        with self._stats_lock:
+            host_stats = self._stats.setdefault(host, {})
+            host_stats[key] = host_stats.get(key, 0) + 1
+
+    def stats(self):
+        """모니터링용 호스트별 요청/재시도 통계와 커넥션 풀 상태 반환"""
+        with self._stats_lock:
+            hosts = {host: dict(values) for host, values in self._stats.items()}
+
+        pools = {}
+        for key in list(self.adapter.poolmanager.pools.keys()):
+            pool = self.adapter.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            pools[f"{key.key_scheme}://{key.key_host}:{key.key_port}"] = {
+                "num_connections": pool.num_connections,
+                "num_requests": pool.num_requests,
+                "idle_connections": sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0,
+                "maxsize": pool.pool.maxsize if pool.pool else 0,
+            }
+
+        return {"hosts": hosts, "pools": pools}
+
+
+http_client = HttpClient()
@@ -0,0 +1,196 @@
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.playlist_track import PlaylistTrack
+from vibeapp.models.track import Track
+from vibeapp.models.track_match import TrackMatch
+from vibeapp.services.platform_adapter import get_adapter
+from vibeapp.exceptions import PlaylistFetchError
+from vibeapp.utils.db_utils import chunked
+from vibeapp.utils.track_utils import make_match_key
+
+
+class MatchService:
+    """트랙을 다른 플랫폼의 트랙으로 매칭하는 서비스
+
+    매칭 순서:
+        1. track_match 테이블에 저장된 이전 결과
+        2. ISRC 인덱스 (같은 ISRC를 가진 대상 플랫폼 트랙)
+        3. 정규화된 "아티스트|제목" 키 인덱스
+        4. 대상 플랫폼 검색 API (access_token이 있을 때만)
+    찾은 결과(검색까지 해서 못 찾은 경우 포함)는 track_match 테이블에 저장. 검색 API 호출이
+    실패한 트랙(429, 5xx, 타임아웃 등)은 못 찾은 것으로 저장하지 않고 다음 매칭 때 다시 검색
+    """
+
+    def __init__(self, search_adapters=None):
+        #플랫폼별 검색에 사용할 어댑터 (없으면 레지스트리에서 가져옴)
+        self.search_adapters = search_adapters or {}
+
+    def match_track(self, track, target_platform, access_token=None):
+        """트랙 하나를 대상 플랫폼 트랙으로 매칭, 못 찾으면 None"""
+        return self.match_tracks([track], target_platform, access_token)[track.id]
+
+    def match_playlist(self, playlist, target_platform, access_token=None):
+        """플레이리스트의 모든 트랙을 한 번에 매칭
+
+        Returns:
+            list[dict]: 순서대로 {"position", "track", "match", "method"}
+        """
+        rows = db.session.execute(
+            select(PlaylistTrack.position, Track)
+            .join(Track, Track.id == PlaylistTrack.track_id)
+            .where(PlaylistTrack.playlist_id == playlist.id)
+            .order_by(PlaylistTrack.position)
+        ).all()
+
+        tracks = [track for _, track in rows]
+        matches, methods = self._match(tracks, target_platform, access_token)
+
+        return [
+            {
+                "position": position,
+                "track": track,
+                "match": matches.get(track.id),
+                "method": methods.get(track.id),
+            }
+            for position, track in rows
+        ]
+
+    def match_tracks(self, tracks, target_platform, access_token=None):
+        """여러 트랙을 한 번에 매칭
+
+        Returns:
+            dict: {원본 Track.id: 대상 플랫폼 Track 또는 None}
+        """
+        matches, _ = self._match(tracks, target_platform, access_token)
+        return {track.id: matches.get(track.id) for track in tracks}
+
+    def _match(self, tracks, target_platform, access_token):
+        """매칭 결과와 매칭 방법을 {원본 Track.id: ...} 두 dict로 반환"""
+        target_platform = target_platform.lower()
+        matches = {}
+        methods = {}
+
+        pending = {}
+        for track in tracks:
+            if track.platform == target_platform:
+                matches[track.id] = track
+                methods[track.id] = "same"
+            else:
+                pending.setdefault(track.id, track)
+        if not pending:
+            return matches, methods
+
+        chunk_size = Config.PLAYLIST_SYNC_CHUNK_SIZE
+
+        # 1. 이전에 저장된 매칭 결과
+        for chunk in chunked(list(pending), chunk_size):
+            memoized = db.session.execute(
+                select(TrackMatch.source_track_id, TrackMatch.method, Track)
+                .outerjoin(Track, Track.id == TrackMatch.target_track_id)
+                .where(
+                    TrackMatch.target_platform == target_platform,
+                    TrackMatch.source_track_id.in_(chunk),
+                )
+            ).all()
+            for source_track_id, method, target in memoized:
+                matches[source_track_id] = target
+                methods[source_track_id] = method
+                pending.pop(source_track_id, None)
+
+        new_matches = {}
+
+        # 2. ISRC 인덱스
+        isrcs = {track.isrc for track in pending.values() if track.isrc}
+        by_isrc = {}
+        for chunk in chunked(list(isrcs), chunk_size):
+            for target in Track.query.filter(Track.platform == target_platform, Track.isrc.in_(chunk)):
+                by_isrc.setdefault(target.isrc, target)
+        for track_id, track in list(pending.items()):
+            target = by_isrc.get(track.isrc) if track.isrc else None
+            if target:
+                new_matches[track_id] = (target, TrackMatch.ISRC)
+                pending.pop(track_id)
+
+        # 3. 정규화된 아티스트+제목 키 인덱스
+        keys = {}
+        for track_id, track in pending.items():
+            key = track.match_key or make_match_key(track.artists, track.name)
+            if key:
+                keys[track_id] = key
+        by_key = {}
+        for chunk in chunked(list(set(keys.values())), chunk_size):
+            for target in Track.query.filter(Track.platform == target_platform, Track.match_key.in_(chunk)):
+                by_key.setdefault(target.match_key, target)
+        for track_id, key in keys.items():
+            target = by_key.get(key)
+            if target:
+                new_matches[track_id] = (target, TrackMatch.KEY)
+                pending.pop(track_id)
+
+        # 4. 대상 플랫폼 검색 API (토큰이 없으면 검색하지 않고, 못 찾은 결과도 저장하지 않음)
+        if pending and access_token:
+            search_adapter = self.search_adapters.get(target_platform) or get_adapter(target_platform)
+            for searched, (track_id, track) in enumerate(pending.items()):
+                try:
+                    target = self._search(search_adapter, access_token, track)
+                except PlaylistFetchError as e:
+                    #한도 초과/장애면 다음 트랙도 실패할 가능성이 높으므로 남은 트랙은 이번 요청에서 검색하지 않음
+                    #(결과는 None으로 돌려주되 저장하지 않음)
+                    current_app.logger.warning("%s 트랙 검색 실패, 남은 %d개 검색 중단: %s", target_platform, len(pending) - searched, e)
+                    break
+                new_matches[track_id] = (target, None)
+
+        for track_id, (target, method) in new_matches.items():
+            if method is None:
+                method = TrackMatch.SEARCH if target else TrackMatch.NONE
+            matches[track_id] = target
+            methods[track_id] = method
+
+        self._save_matches(target_platform, new_matches, methods)
+        return matches, methods
+
+    def _search(self, search_adapter, access_token, track):
+        """검색 API로 ISRC, 그다음 제목+아티스트 순으로 찾아서 Track으로 저장
+
+        검색에 성공했는데 결과가 없으면 None, API 호출이 실패하면 PlaylistFetchError를 그대로 올림
+        """
+        found = None
+        if track.isrc:
+            found = search_adapter.search_track(access_token, isrc=track.isrc)
+        if found is None:
+            primary_artist = (track.artists or "").split(",")[0].strip()
+            found = search_adapter.search_track(access_token, title=track.name, artist=primary_artist)
+
+        if found is None:
+            return None
+
+        track_ids = search_adapter.save_tracks([found])
+        return db.session.get(Track, track_ids[found["id"]])
+
+    @staticmethod
+    def _save_matches(target_platform, new_matches, methods):
+        """새 매칭 결과 저장 (다른 요청이 먼저 저장했으면 무시)"""
+        if not new_matches:
+            return
+
+        rows = [
+            {
+                "source_track_id": track_id,
+                "target_platform": target_platform,
+                "target_track_id": target.id if target else None,
+                "method": methods[track_id],
+            }
+            for track_id, (target, _) in new_matches.items()
+        ]
+        for chunk in chunked(rows, Config.PLAYLIST_SYNC_CHUNK_SIZE):
+            db.session.execute(
+                sqlite_insert(TrackMatch).on_conflict_do_nothing(
+                    index_elements=["source_track_id", "target_platform"]
+                ),
+                chunk,
+            )
+        db.session.commit()
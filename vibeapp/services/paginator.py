@@ -0,0 +1,130 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+
+class Page:
+    """플랫폼 API 응답 한 페이지 (플랫폼별 응답 형식은 어댑터가 변환)"""
+
+    __slots__ = ("items", "total", "next_token", "not_modified")
+
+    def __init__(self, items, total=None, next_token=None, not_modified=False):
+        self.items = items
+        self.total = total  # 전체 항목 수 (알 수 없으면 None)
+        self.next_token = next_token  # 다음 페이지가 있으면 토큰/URL, 없으면 None
+        self.not_modified = not_modified  # 304 응답이라 저장된 본문을 사용했는지 여부
+
+
+def iter_offset_pages(fetch, limit, start_offset=0, concurrency=1, thread_name_prefix="page"):
+    """limit/offset 방식 페이지를 offset 순서대로 yield 하는 제너레이터
+
+    첫 페이지에서 total을 확인한 뒤 다음 페이지들은 최대 concurrency개까지
+    미리 요청해 두고 순서대로 내보냄. 미리 받아두는 페이지 수가 제한되므로
+    메모리 사용량은 전체 크기가 아닌 페이지 크기에 비례함
+
+    Args:
+        fetch: offset을 받아 Page를 반환하는 함수 (워커 스레드에서 호출될 수 있음)
+
+    Yields:
+        tuple: (offset, Page)
+    """
+    first_page = fetch(start_offset)
+    yield start_offset, first_page
+    if not first_page.next_token:
+        return
+
+    total = first_page.total or 0
+    next_offset = start_offset + limit
+
+    if concurrency <= 1 or total <= next_offset:
+        #total을 알 수 없거나 순차 모드면 next가 없을 때까지 순서대로 조회
+        offset = next_offset
+        while True:
+            page = fetch(offset)
+            yield offset, page
+            if not page.next_token:
+                return
+            offset += limit
+
+    offsets = iter(range(next_offset, total, limit))
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix) as executor:
+        def submit(page_offset):
+            return page_offset, executor.submit(fetch, page_offset)
+
+        pending = deque(submit(page_offset) for page_offset in islice(offsets, concurrency))
+        try:
+            while pending:
+                page_offset, future = pending.popleft()
+                page = future.result()
+
+                following = next(offsets, None)
+                if following is not None:
+                    pending.append(submit(following))
+
+                yield page_offset, page
+        finally:
+            #소비 중단/오류 시 아직 시작하지 않은 요청은 취소
+            for _, future in pending:
+                future.cancel()
+
+
+def iter_token_pages(fetch, start_token=None, prefetch=True, thread_name_prefix="page"):
+    """다음 페이지 토큰(pageToken/cursor) 방식 페이지를 순서대로 yield 하는 제너레이터
+
+    토큰 방식은 앞 페이지를 받아야 다음 페이지를 요청할 수 있으므로 페이지끼리
+    병렬로 받을 수는 없음. 대신 prefetch면 한 페이지를 받자마자 다음 페이지 요청을
+    보내 두어 호출한 쪽이 현재 페이지를 저장하는 동안 다음 페이지를 받음
+
+    Args:
+        fetch: 페이지 토큰(첫 페이지는 None)을 받아 Page를 반환하는 함수
+
+    Yields:
+        tuple: (이 페이지를 요청한 토큰, Page)
+    """
+    if not prefetch:
+        token = start_token
+        while True:
+            page = fetch(token)
+            yield token, page
+            if not page.next_token:
+                return
+            token = page.next_token
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix=thread_name_prefix) as executor:
+        token = start_token
+        future = executor.submit(fetch, token)
+        try:
+            while future is not None:
+                page = future.result()
+                current_token, token = token, page.next_token
+                future = executor.submit(fetch, token) if token else None
+                yield current_token, page
+        finally:
+            if future is not None:
+                future.cancel()
+
+
+def map_concurrent(func, items, concurrency, thread_name_prefix="worker"):
+    """items에 func를 병렬로 적용하고 결과를 입력 순서대로 yield 하는 제너레이터
+
+    완료됐지만 아직 내보내지 않은 결과는 최대 concurrency * 2개까지만 유지함
+    (플레이리스트별 트랙 목록처럼 결과가 큰 작업을 여러 개 동시에 받을 때 사용)
+    """
+    items = iter(items)
+    if concurrency <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix) as executor:
+        pending = deque(executor.submit(func, item) for item in islice(items, concurrency * 2))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                following = next(items, None)
+                if following is not None:
+                    pending.append(executor.submit(func, following))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,483 @@
+import importlib
+import threading
+
+import requests
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.playlist import Playlist
+from vibeapp.models.playlist_track import PlaylistTrack
+from vibeapp.models.track import Track
+from vibeapp.services.http_client import http_client
+from vibeapp.services.paginator import iter_offset_pages, iter_token_pages
+from vibeapp.services.rate_limiter import INTERACTIVE, rate_limiter
+from vibeapp.services.response_cache import response_cache
+from vibeapp.services.token_manager import token_manager
+from vibeapp.utils.db_utils import chunked
+from vibeapp.utils.track_utils import make_match_key
+from vibeapp.exceptions import PlaylistFetchError, RateLimitError, TokenRefreshError, UnsupportedPlatformError
+
+
+#플랫폼 이름 -> 어댑터 클래스 경로 (사용할 때 import)
+ADAPTERS = {
+    "spotify": "vibeapp.services.spotify_service:SpotifyService",
+    "youtube": "vibeapp.services.youtube_service:YoutubeService",
+}
+
+_adapters = {}
+_adapters_lock = threading.Lock()
+
+
+def get_adapter(platform, priority=INTERACTIVE):
+    """플랫폼 어댑터 반환 (플랫폼/우선순위별로 하나만 만들어 재사용)
+
+    Raises:
+        UnsupportedPlatformError: 등록되지 않은 플랫폼
+    """
+    platform = (platform or "").lower()
+    path = ADAPTERS.get(platform)
+    if path is None:
+        raise UnsupportedPlatformError(f"{platform}은(는) 지원되지 않는 플랫폼입니다.")
+
+    with _adapters_lock:
+        adapter = _adapters.get((platform, priority))
+        if adapter is None:
+            module_name, class_name = path.split(":")
+            adapter_class = getattr(importlib.import_module(module_name), class_name)
+            adapter = _adapters[(platform, priority)] = adapter_class(priority=priority)
+        return adapter
+
+
+def is_supported(platform):
+    return (platform or "").lower() in ADAPTERS
+
+
+class PlatformAdapter:
+    """플랫폼 어댑터 기본 클래스
+
+    플랫폼별 어댑터는 API 호출과 응답 변환(fetch_*/normalize_*)만 구현하고
+    페이지 순회, 레이트 리밋, 응답 캐시, 토큰 갱신, DB 저장은 이 클래스가 공통으로 처리함
+
+    변환된 형식:
+        플레이리스트: {"id", "name", "snapshot_id", "public"}
+        트랙: {"id", "isrc", "name", "artists", "album", "duration_ms"}
+        사용자: {"id", "display_name"}
+    """
+
+    PLATFORM = None
+    PAGINATION = "offset"  # "offset" (limit/offset, 페이지 병렬 조회) 또는 "token" (다음 페이지 토큰)
+    PLAYLIST_PAGE_SIZE = 50
+    PLAYLIST_TRACK_PAGE_SIZE = 50
+
+    def __init__(self, priority=INTERACTIVE):
+        #모든 플랫폼 호출은 워커 간 공유 레이트 리미터를 거침 (백그라운드 작업은 BACKGROUND)
+        self.priority = priority
+        self.throttle = rate_limiter.throttle(self.PLATFORM, priority)
+
+    @property
+    def oauth_config(self):
+        return Config.PLATFORM_OAUTH[self.PLATFORM]
+
+    @property
+    def fetch_concurrency(self):
+        """페이지 동시 요청 수"""
+        return Config.PLATFORM_FETCH_CONCURRENCY.get(self.PLATFORM, Config.PLATFORM_FETCH_CONCURRENCY["default"])
+
+    # ===== 플랫폼별 구현 =====
+
+    def fetch_playlist_page(self, access_token, cursor, cache_scope=None):
+        """내 플레이리스트 한 페이지를 Page(items는 원본 응답 항목)로 반환 (cursor는 offset 또는 페이지 토큰)"""
+        raise NotImplementedError
+
+    def fetch_playlist_tracks_page(self, access_token, playlist_id, cursor, cache_scope=None):
+        """플레이리스트 트랙 한 페이지를 Page(items는 원본 응답 항목)로 반환"""
+        raise NotImplementedError
+
+    def normalize_playlist(self, item):
+        raise NotImplementedError
+
+    def normalize_track(self, item):
+        """플레이리스트 트랙 항목을 트랙 dict로 변환, 저장하지 않을 항목이면 None"""
+        raise NotImplementedError
+
+    def normalize_user(self, data):
+        raise NotImplementedError
+
+    def search_track(self, access_token, isrc=None, title=None, artist=None):
+        """검색 API로 트랙 하나 찾기, 변환된 트랙 dict 또는 None"""
+        raise UnsupportedPlatformError(f"{self.PLATFORM} 트랙 검색은 지원되지 않습니다.")
+
+    # ===== 인증 =====
+
+    def refresh_token(self, connection):
+        """유효한 액세스 토큰 반환 (캐시/단일 갱신은 token_manager가 처리)"""
+        return token_manager.get_access_token(connection, self)
+
+    def request_token_refresh(self, refresh_token):
+        """토큰 엔드포인트에 refresh_token으로 새 액세스 토큰 요청 (DB 저장은 호출한 쪽에서)
+
+        Returns:
+            dict: 토큰 응답 (access_token, expires_in, 새로 발급된 경우 refresh_token)
+        """
+        return self._request_token({"grant_type": "refresh_token", "refresh_token": refresh_token})
+
+    def exchange_code(self, code):
+        """OAuth 콜백의 authorization code를 토큰으로 교환, 토큰 응답 dict 반환"""
+        return self._request_token({
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": self.oauth_config["REDIRECT_URI"],
+        })
+
+    def get_user_info(self, access_token):
+        """로그인한 사용자 정보를 {"id", "display_name"}으로 반환"""
+        try:
+            res = http_client.get(
+                self.oauth_config["USER_INFO_URL"],
+                headers={"Authorization": f"Bearer {access_token}"},
+                throttle=self.throttle,
+            )
+        except (requests.RequestException, RateLimitError) as e:
+            raise TokenRefreshError(f"사용자 정보 요청 실패: {e}")
+        if res.status_code != 200:
+            raise TokenRefreshError(f"사용자 정보 요청 실패: {res.status_code}")
+        return self.normalize_user(res.json())
+
+    def _request_token(self, payload):
+        payload = {
+            **payload,
+            "client_id": self.oauth_config["CLIENT_ID"],
+            "client_secret": self.oauth_config["CLIENT_SECRET"],
+        }
+        try:
+            res = http_client.post(self.oauth_config["TOKEN_URL"], data=payload, throttle=self.throttle)
+        except (requests.RequestException, RateLimitError) as e:
+            raise TokenRefreshError(f"Token request failed: {e}")
+        if res.status_code != 200:
+            raise TokenRefreshError(f"Token request failed: {res.status_code}")
+        return res.json()
+
+    # ===== 페이지 조회 =====
+
+    def iter_playlist_pages(self, access_token, start_cursor=None, concurrency=None, cache_scope=None):
+        """내 플레이리스트를 페이지 단위로 순서대로 yield 하는 제너레이터
+
+        Args:
+            start_cursor: 이어서 가져올 위치 (중단된 동기화 재개용, 처음부터면 None)
+            concurrency: offset 방식의 페이지 동시 요청 수 (기본값 fetch_concurrency)
+            cache_scope: 주어지면 응답 캐시로 조건부 요청 (보통 platform_user_id)
+
+        Yields:
+            tuple: (다음 페이지 cursor(마지막이면 None), 변환된 플레이리스트 리스트, 304 응답이었는지 여부)
+        """
+        def fetch(cursor):
+            return self.fetch_playlist_page(access_token, cursor, cache_scope)
+
+        for cursor, page in self._iter_pages(fetch, self.PLAYLIST_PAGE_SIZE, start_cursor, concurrency):
+            yield cursor, [self.normalize_playlist(item) for item in page.items], page.not_modified
+
+    def get_playlists(self, access_token, concurrency=None):
+        """플레이리스트 전체를 한 리스트로 가져오기"""
+        return [
+            playlist
+            for _, playlists, _ in self.iter_playlist_pages(access_token, concurrency=concurrency)
+            for playlist in playlists
+        ]
+
+    def get_playlist_tracks(self, access_token, playlist_id, concurrency=None, cache_scope=None):
+        """플레이리스트의 트랙 전체를 순서대로 가져오기 (저장하지 않을 항목은 제외)"""
+        def fetch(cursor):
+            return self.fetch_playlist_tracks_page(access_token, playlist_id, cursor, cache_scope)
+
+        tracks = []
+        for _, page in self._iter_pages(fetch, self.PLAYLIST_TRACK_PAGE_SIZE, None, concurrency):
+            for item in page.items:
+                track = self.normalize_track(item)
+                if track is not None:
+                    tracks.append(track)
+        return tracks
+
+    def _iter_pages(self, fetch, limit, start_cursor, concurrency):
+        """PAGINATION 방식에 맞게 페이지를 순회하며 (다음 cursor, Page) yield"""
+        if concurrency is None:
+            concurrency = self.fetch_concurrency
+        prefix = f"{self.PLATFORM}-page"
+
+        if self.PAGINATION == "token":
+            for _, page in iter_token_pages(fetch, start_cursor, prefetch=concurrency > 1, thread_name_prefix=prefix):
+                yield page.next_token, page
+            return
+
+        start_offset = int(start_cursor or 0)
+        for offset, page in iter_offset_pages(fetch, limit, start_offset, concurrency, thread_name_prefix=prefix):
+            yield (str(offset + len(page.items)) if page.next_token else None), page
+
+    def _get_json(self, url, access_token, params=None, cache_scope=None):
+        """API 응답 하나를 JSON으로 가져오기, cache_scope가 있으면 ETag 조건부 요청
+
+        Returns:
+            tuple: (응답 dict, 304 응답이라 저장된 본문을 사용했는지 여부)
+        """
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        #429/5xx 재시도와 Retry-After 대기는 http_client가 처리
+        try:
+            if cache_scope is None:
+                res = http_client.get(url, headers=headers, params=params, throttle=self.throttle)
+            else:
+                res = response_cache.get(url, cache_scope, headers=headers, params=params, throttle=self.throttle)
+        except (requests.RequestException, RateLimitError) as e:
+            raise PlaylistFetchError(f"플레이리스트 가져오기 실패: {e}")
+
+        if res.status_code != 200:
+            raise PlaylistFetchError(f"플레이리스트 가져오기 실패: {res.status_code} - {res.text}")
+
+        if cache_scope is None:
+            return res.json(), False
+        #304면 지난번에 파싱해 둔 본문을 그대로 씀 (없을 때만 저장된 본문을 풀어 파싱)
+        return response_cache.json(res), res.not_modified
+
+    # ===== DB 저장 =====
+
+    def save_playlists(self, connection, playlists):
+        """플레이리스트 전체 목록을 DB에 저장하고 목록에 없는 플레이리스트는 삭제
+
+        Returns:
+            dict: {"created": int, "updated": int, "deleted": int, "unchanged": int}
+        """
+        generation = (connection.sync_generation or 0) + 1
+        connection.sync_generation = generation
+
+        stats = self.save_playlist_page(connection, playlists, generation)
+        stats["deleted"] = self.prune_playlists(connection, generation)
+
+        db.session.commit()
+        return stats
+
+    def save_playlist_page(self, connection, playlists, generation):
+        """플레이리스트 한 페이지를 DB에 반영 (snapshot_id 기준 증분 저장, 커밋은 호출한 쪽에서)
+
+        - 페이지에 포함된 기존 플레이리스트를 한 번의 쿼리로 읽어와 외부 ID 기준으로 비교
+        - snapshot_id나 메타데이터가 바뀐 플레이리스트만 갱신, 새 플레이리스트는 추가
+        - 페이지에 포함된 모든 플레이리스트에 이번 동기화 세대(generation)를 기록
+          (동기화가 끝난 뒤 prune_playlists가 이전 세대 플레이리스트를 삭제)
+        - 추가/갱신은 PLAYLIST_SYNC_CHUNK_SIZE 단위의 일괄(bulk) 쿼리로 실행
+
+        Returns:
+            dict: {"created": int, "updated": int, "unchanged": int}
+        """
+        stats = {"created": 0, "updated": 0, "unchanged": 0}
+
+        playlists_by_id = {}
+        for playlist in playlists:
+            playlists_by_id.setdefault(playlist["id"], playlist)
+        if not playlists_by_id:
+            return stats
+
+        chunk_size = Config.PLAYLIST_SYNC_CHUNK_SIZE
+        existing_by_id = {}
+        for chunk in chunked(list(playlists_by_id), chunk_size):
+            existing_rows = db.session.execute(
+                select(
+                    Playlist.id, Playlist.spotify_id, Playlist.name,
+                    Playlist.snapshot_id, Playlist.is_public,
+                ).where(
+                    Playlist.platform == connection.platform,
+                    Playlist.platform_user_id == connection.platform_user_id,
+                    Playlist.spotify_id.in_(chunk),
+                )
+            ).all()
+            existing_by_id.update((row.spotify_id, row) for row in existing_rows)
+
+        to_insert = []
+        to_update = []
+        unchanged_ids = []
+        for external_id, playlist in playlists_by_id.items():
+            name = playlist["name"]
+            snapshot_id = playlist.get("snapshot_id")
+            is_public = playlist.get("public", True)
+
+            existing = existing_by_id.get(external_id)
+
+            if existing:
+                if (existing.snapshot_id == snapshot_id
+                        and existing.name == name
+                        and existing.is_public == is_public):
+                    unchanged_ids.append(existing.id)
+                    continue
+
+                to_update.append({
+                    "id": existing.id,
+                    "name": name,
+                    "snapshot_id": snapshot_id,
+                    "is_public": is_public,
+                    "sync_generation": generation,
+                })
+            else:
+                to_insert.append({
+                    "external_id": external_id,
+                    "spotify_id": external_id,  # 플랫폼의 플레이리스트 ID (이름은 Spotify 전용이던 시절 그대로)
+                    "name": name,
+                    "snapshot_id": snapshot_id,
+                    "is_public": is_public,
+                    "platform": connection.platform,
+                    "platform_user_id": connection.platform_user_id,
+                    "platform_connection_id": connection.id,
+                    "sync_generation": generation,
+                })
+
+        for chunk in chunked(to_insert, chunk_size):
+            db.session.execute(insert(Playlist), chunk)
+        for chunk in chunked(to_update, chunk_size):
+            db.session.execute(update(Playlist), chunk)
+        #바뀌지 않은 플레이리스트는 세대 표시만 한 번의 쿼리로 갱신
+        for chunk in chunked(unchanged_ids, chunk_size):
+            db.session.execute(
+                update(Playlist).where(Playlist.id.in_(chunk)).values(sync_generation=generation)
+            )
+
+        stats["created"] = len(to_insert)
+        stats["updated"] = len(to_update)
+        stats["unchanged"] = len(unchanged_ids)
+        return stats
+
+    def touch_playlist_page(self, connection, playlists, generation):
+        """304로 지난번과 같다고 확인된 페이지는 비교/갱신 없이 세대 표시만 기록
+
+        DB에 없는 플레이리스트가 있으면(이전 저장 실패 등) False를 반환하므로
+        호출한 쪽에서 save_playlist_page로 다시 저장해야 함 (세대 표시는 중복돼도 무방)
+
+        Returns:
+            bool: 페이지의 플레이리스트가 모두 DB에 있어 세대 표시를 마쳤는지 여부
+        """
+        external_ids = list({playlist["id"] for playlist in playlists})
+        if not external_ids:
+            return True
+
+        touched = 0
+        for chunk in chunked(external_ids, Config.PLAYLIST_SYNC_CHUNK_SIZE):
+            touched += db.session.execute(
+                update(Playlist).where(
+                    Playlist.platform == connection.platform,
+                    Playlist.platform_user_id == connection.platform_user_id,
+                    Playlist.spotify_id.in_(chunk),
+                ).values(sync_generation=generation)
+            ).rowcount
+        return touched == len(external_ids)
+
+    def prune_playlists(self, connection, generation):
+        """이번 동기화 세대에서 보지 못한(플랫폼에서 삭제된) 플레이리스트 삭제, 삭제 개수 반환"""
+        stale_playlists = select(Playlist.id).where(
+            Playlist.platform == connection.platform,
+            Playlist.platform_user_id == connection.platform_user_id,
+            Playlist.sync_generation != generation,
+        )
+        db.session.execute(
+            delete(PlaylistTrack).where(PlaylistTrack.playlist_id.in_(stale_playlists))
+        )
+        return db.session.execute(
+            delete(Playlist).where(Playlist.id.in_(stale_playlists))
+        ).rowcount
+
+    def save_playlist_tracks(self, playlist_id, snapshot_id, tracks):
+        """플레이리스트의 트랙 목록을 DB에 반영 (커밋은 호출한 쪽에서), 저장한 트랙 수 반환
+
+        - 트랙은 플랫폼 트랙 ID, 없으면 ISRC 기준으로 전역에서 한 번만 저장
+        - 플레이리스트-트랙 연결은 기존 것을 지우고 일괄(bulk) 추가
+        """
+        track_ids = self.save_tracks(tracks)
+
+        db.session.execute(delete(PlaylistTrack).where(PlaylistTrack.playlist_id == playlist_id))
+        rows = [
+            {"playlist_id": playlist_id, "position": position, "track_id": track_ids[track["id"]]}
+            for position, track in enumerate(tracks)
+        ]
+        for chunk in chunked(rows, Config.PLAYLIST_SYNC_CHUNK_SIZE):
+            db.session.execute(insert(PlaylistTrack), chunk)
+
+        db.session.execute(
+            update(Playlist).where(Playlist.id == playlist_id).values(tracks_snapshot_id=snapshot_id)
+        )
+        return len(rows)
+
+    def save_tracks(self, tracks):
+        """트랙 dict 목록을 Track.id로 변환 (없는 트랙은 일괄 추가, 커밋은 호출한 쪽에서)
+
+        Returns:
+            dict: {플랫폼 트랙 ID: Track.id}
+        """
+        chunk_size = Config.PLAYLIST_SYNC_CHUNK_SIZE
+        tracks_by_id = {}
+        for track in tracks:
+            tracks_by_id.setdefault(track["id"], track)
+
+        resolved = {}
+        for chunk in chunked(list(tracks_by_id), chunk_size):
+            resolved.update(db.session.execute(
+                select(Track.external_id, Track.id).where(
+                    Track.platform == self.PLATFORM,
+                    Track.external_id.in_(chunk),
+                )
+            ).all())
+
+        missing = [track for external_id, track in tracks_by_id.items() if external_id not in resolved]
+        if not missing:
+            return resolved
+
+        #같은 녹음이 다른 ID로 재발매(relink)된 경우 ISRC로 기존 트랙을 재사용
+        isrcs = list({track.get("isrc") for track in missing} - {None})
+        existing_by_isrc = {}
+        for chunk in chunked(isrcs, chunk_size):
+            existing_by_isrc.update(db.session.execute(
+                select(Track.isrc, Track.id).where(
+                    Track.platform == self.PLATFORM,
+                    Track.isrc.in_(chunk),
+                )
+            ).all())
+
+        to_insert = []
+        aliases = {}  # 이번 배치 안에서 ISRC가 같은 트랙 ID -> 대표 트랙 ID
+        new_by_isrc = {}
+        for track in missing:
+            isrc = track.get("isrc")
+            if isrc and isrc in existing_by_isrc:
+                resolved[track["id"]] = existing_by_isrc[isrc]
+                continue
+            if isrc and isrc in new_by_isrc:
+                aliases[track["id"]] = new_by_isrc[isrc]
+                continue
+            if isrc:
+                new_by_isrc[isrc] = track["id"]
+
+            name = track.get("name") or ""
+            artists = track.get("artists") or ""
+            to_insert.append({
+                "platform": self.PLATFORM,
+                "external_id": track["id"],
+                "isrc": isrc,
+                "name": name,
+                "artists": artists,
+                "album": track.get("album"),
+                "duration_ms": track.get("duration_ms"),
+                "match_key": make_match_key(artists, name),
+            })
+
+        #다른 워커가 동시에 같은 트랙을 추가했을 수 있으므로 충돌은 무시하고 다시 조회
+        for chunk in chunked(to_insert, chunk_size):
+            db.session.execute(
+                sqlite_insert(Track).on_conflict_do_nothing(index_elements=["platform", "external_id"]),
+                chunk,
+            )
+        for chunk in chunked([row["external_id"] for row in to_insert], chunk_size):
+            resolved.update(db.session.execute(
+                select(Track.external_id, Track.id).where(
+                    Track.platform == self.PLATFORM,
+                    Track.external_id.in_(chunk),
+                )
+            ).all())
+
+        for external_id, target_id in aliases.items():
+            resolved[external_id] = resolved[target_id]
+        return resolved
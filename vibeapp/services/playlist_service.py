@@ -1,28 +1,168 @@
-from vibeapp.services.spotify_service import SpotifyService
+from datetime import datetime, timezone, timedelta
+from flask import current_app
+from sqlalchemy import or_, select
+
+from vibeapp.config import Config
+from vibeapp.exceptions import PlaylistFetchError
+from vibeapp.extensions import db
+from vibeapp.models.playlist import Playlist
 from vibeapp.services.auth_service import AuthService
-from vibeapp.exceptions import UnsupportedPlatformError
+from vibeapp.services.paginator import map_concurrent
+from vibeapp.services.platform_adapter import get_adapter
+from vibeapp.services.rate_limiter import INTERACTIVE
+from vibeapp.services.response_cache import response_cache
 
 class PlaylistService:
     """플랫폼별 플레이리스트를 관리하는 서비스"""
     
-    def __init__(self, spotify_service=None, auth_service=None):
-        self.spotify = spotify_service or SpotifyService()
-        self.auth = auth_service or AuthService(self.spotify) #같은 spotify_service
-        
-        
-    def get_and_save_playlists(self, connection):
-        """플레이리스트 가져와서 저장"""
-        platform = connection.platform.lower()
-        
-        if platform == "spotify":
-            #토큰 갱신
-            access_token = self.auth.refresh_token(connection)
-            #플레이리스트 가져오기
-            playlists_data = self.spotify.get_playlists(access_token)
-            #DB 저장
-            self.spotify.save_playlists(connection, playlists_data)
-            
-            return playlists_data
-        
-        else:
-            raise UnsupportedPlatformError(f"{platform} 플레이리스트는 지원되지 않습니다.")
\ No newline at end of file
+    def __init__(self, priority=INTERACTIVE):
+        #백그라운드 작업은 BACKGROUND로 만들어 사용자 요청이 레이트 리밋에서 먼저 처리되도록 함
+        self.priority = priority
+        self.auth = AuthService(priority)
+        
+        
+    @staticmethod
+    def is_fresh(connection):
+        """마지막 동기화가 신선도 유지 시간(PLAYLIST_SYNC_TTL) 안인지 확인"""
+        last_synced_at = connection.last_synced_at
+        if last_synced_at is None:
+            return False
+        
+        if last_synced_at.tzinfo is None:
+            last_synced_at = last_synced_at.replace(tzinfo=timezone.utc)
+        
+        return datetime.now(timezone.utc) - last_synced_at < timedelta(seconds=Config.PLAYLIST_SYNC_TTL)
+        
+        
+    def get_and_save_playlists(self, connection, force=False):
+        """플레이리스트 가져와서 저장
+
+        페이지를 받는 대로 바로 DB에 저장하고 페이지마다 커밋하며 진행 위치
+        (PlatformConnection.sync_cursor)를 기록함. 중간에 실패하면 이미 저장한
+        페이지는 유지되고, 다음 동기화는 기록된 위치부터 이어서 진행함. 이어서 진행한
+        동기화는 목록 전체를 봤다고 보장할 수 없으므로 삭제(prune)는 하지 않고,
+        동기화 시각도 기록하지 않아 다음 동기화가 첫 페이지부터 다시 확인함
+
+        Args:
+            connection: 동기화할 PlatformConnection
+            force: True면 신선도와 관계없이 항상 플랫폼에서 다시 가져옴
+
+        Returns:
+            dict | None: 저장 결과 통계, 신선도 유지 시간 안이라 생략한 경우 None
+
+        Raises:
+            UnsupportedPlatformError: 어댑터가 없는 플랫폼
+        """
+        adapter = get_adapter(connection.platform, self.priority)
+        
+        #최근에 동기화했다면 플랫폼 호출 생략
+        if not force and self.is_fresh(connection):
+            return None
+        
+        #토큰 갱신
+        access_token = self.auth.refresh_token(connection)
+        
+        #중단된 동기화가 있으면 같은 세대로 이어서, 없으면 새 세대로 시작
+        if not connection.sync_in_progress:
+            connection.sync_generation = (connection.sync_generation or 0) + 1
+            connection.sync_in_progress = True
+            connection.sync_cursor = None
+            db.session.commit()
+        generation = connection.sync_generation
+        resumed = connection.sync_cursor is not None
+        
+        stats = {"created": 0, "updated": 0, "deleted": 0, "unchanged": 0, "not_modified_pages": 0}
+        
+        #플레이리스트를 페이지 단위로 가져와서 바로 저장 (ETag가 같은 페이지는 비교/갱신 생략)
+        pages = adapter.iter_playlist_pages(
+            access_token, start_cursor=connection.sync_cursor, cache_scope=connection.platform_user_id,
+        )
+        try:
+            for next_cursor, playlists, not_modified in pages:
+                if not_modified and adapter.touch_playlist_page(connection, playlists, generation):
+                    stats["unchanged"] += len(playlists)
+                    stats["not_modified_pages"] += 1
+                else:
+                    page_stats = adapter.save_playlist_page(connection, playlists, generation)
+                    for key, value in page_stats.items():
+                        stats[key] += value
+                
+                connection.sync_cursor = next_cursor
+                db.session.commit()
+        except Exception:
+            #받은 응답을 저장하지 못했을 수 있으므로 다음 동기화는 304에 기대지 않고 전부 다시 받음
+            db.session.rollback()
+            response_cache.forget(connection.platform_user_id)
+            raise
+        
+        #이번 동기화에서 보지 못한 플레이리스트 삭제 (동기화 시각도 같은 트랜잭션에서 기록)
+        #중간부터 이어받은 경우 중단된 사이 앞쪽 항목이 추가/삭제되면 페이지 경계를 넘어간
+        #플레이리스트를 보지 못했을 수 있어 삭제하지 않음 (다음 동기화가 처음부터 받으며 정리)
+        if not resumed:
+            stats["deleted"] = adapter.prune_playlists(connection, generation)
+            connection.last_synced_at = datetime.now(timezone.utc)
+        connection.sync_in_progress = False
+        connection.sync_cursor = None
+        db.session.commit()
+        
+        #snapshot_id가 바뀐 플레이리스트의 트랙 동기화
+        if Config.PLAYLIST_SYNC_TRACKS:
+            stats.update(self.sync_playlist_tracks(connection, access_token, adapter))
+        
+        return stats
+        
+        
+    def sync_playlist_tracks(self, connection, access_token, adapter=None):
+        """트랙 목록을 가져온 뒤 snapshot_id가 바뀐(또는 처음인) 플레이리스트의 트랙만 동기화
+
+        여러 플레이리스트의 트랙을 동시에 가져오고(플레이리스트 안의 페이지는 순서대로),
+        저장은 플레이리스트 단위로 커밋함. 삭제되거나 구독 취소된 플레이리스트(404/403 등)처럼
+        트랙을 가져오지 못한 플레이리스트는 tracks_snapshot_id를 그대로 두고(다음 동기화 때 재시도)
+        나머지 플레이리스트는 계속 진행함
+
+        Returns:
+            dict: {"track_playlists": 트랙을 갱신한 플레이리스트 수, "tracks": 저장한 트랙 수,
+                   "track_failures": 트랙을 가져오지 못한 플레이리스트 수}
+        """
+        adapter = adapter or get_adapter(connection.platform, self.priority)
+        stale_playlists = db.session.execute(
+            select(Playlist.id, Playlist.spotify_id, Playlist.snapshot_id).where(
+                Playlist.platform == connection.platform,
+                Playlist.platform_user_id == connection.platform_user_id,
+                or_(
+                    Playlist.tracks_snapshot_id.is_(None),
+                    Playlist.tracks_snapshot_id != Playlist.snapshot_id,
+                    Playlist.snapshot_id.is_(None),
+                ),
+            )
+        ).all()
+        
+        stats = {"track_playlists": 0, "tracks": 0, "track_failures": 0}
+        if not stale_playlists:
+            return stats
+        
+        cache_scope = connection.platform_user_id  # 워커 스레드에서 ORM 객체를 읽지 않도록 미리 꺼내둠
+        
+        def fetch(playlist):
+            #플레이리스트 단위로 병렬 처리하므로 페이지는 순차 조회
+            #한 플레이리스트의 실패가 제너레이터 밖으로 나가면 나머지도 멈추므로 결과로 돌려줌
+            try:
+                return playlist, adapter.get_playlist_tracks(
+                    access_token, playlist.spotify_id, concurrency=1, cache_scope=cache_scope,
+                ), None
+            except PlaylistFetchError as e:
+                return playlist, None, e
+        
+        results = map_concurrent(
+            fetch, stale_playlists, adapter.fetch_concurrency, thread_name_prefix=f"{adapter.PLATFORM}-tracks",
+        )
+        for playlist, tracks, error in results:
+            if error is not None:
+                stats["track_failures"] += 1
+                current_app.logger.warning("플레이리스트 %s 트랙 동기화 실패: %s", playlist.spotify_id, error)
+                continue
+            stats["tracks"] += adapter.save_playlist_tracks(playlist.id, playlist.snapshot_id, tracks)
+            stats["track_playlists"] += 1
+            db.session.commit()
+        
+        return stats
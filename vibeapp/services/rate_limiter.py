@@ -0,0 +1,173 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from vibeapp.config import Config
+from vibeapp.exceptions import RateLimitError
+
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+
+class RateLimiter:
+    """여러 워커 프로세스가 공유하는 플랫폼 API 토큰 버킷 레이트 리미터
+
+    - 버킷 상태는 SQLite 파일(instance/RATE_LIMIT_DB_NAME)에 저장되어 모든 프로세스가 공유
+    - 토큰 차감은 단일 UPDATE 문으로 원자적으로 처리
+    - 백그라운드 작업은 버킷 용량의 RATE_LIMIT_INTERACTIVE_RESERVE 비율만큼을
+      남겨두고만 가져갈 수 있어 사용자 요청이 항상 먼저 처리됨
+    - 429 응답을 받으면 penalize()로 모든 프로세스가 Retry-After 동안 대기
+    - 사용자 요청은 RATE_LIMIT_INTERACTIVE_MAX_WAIT, 백그라운드 작업은 RATE_LIMIT_BACKGROUND_MAX_WAIT까지만 대기
+    """
+
+    def __init__(self, app=None):
+        self.db_path = None
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.db_path = os.path.join(app.instance_path, Config.RATE_LIMIT_DB_NAME)
+        os.makedirs(app.instance_path, exist_ok=True)
+        app.extensions["rate_limiter"] = self
+
+    def throttle(self, bucket, priority=INTERACTIVE):
+        """http_client에 넘길 수 있는 버킷/우선순위 고정 핸들 반환"""
+        return Throttle(self, bucket, priority)
+
+    def acquire(self, bucket, priority=INTERACTIVE):
+        """버킷에서 토큰 하나를 가져옴 (필요하면 대기), 대기한 시간(초) 반환
+
+        Raises:
+            RateLimitError: 우선순위별 최대 대기 시간(max_wait) 안에 토큰을 얻지 못한 경우
+        """
+        rate, capacity = self._limits(bucket)
+        reserve = 0 if priority == INTERACTIVE else capacity * Config.RATE_LIMIT_INTERACTIVE_RESERVE
+        conn = self._connect(bucket, capacity)
+
+        started = time.monotonic()
+        deadline = started + self.max_wait(priority)
+        while True:
+            now = time.time()
+            acquired = conn.execute(
+                """
+                UPDATE rate_limit_bucket
+                SET tokens = MIN(:capacity, tokens + MAX(0, :now - updated_at) * :rate) - 1,
+                    updated_at = MAX(updated_at, :now)
+                WHERE name = :name
+                  AND blocked_until <= :now
+                  AND MIN(:capacity, tokens + MAX(0, :now - updated_at) * :rate) >= 1 + :reserve
+                """,
+                {"name": bucket, "now": now, "rate": rate, "capacity": capacity, "reserve": reserve},
+            ).rowcount
+            if acquired:
+                waited = time.monotonic() - started
+                self._record(bucket, priority, waited)
+                return waited
+
+            tokens, updated_at, blocked_until = conn.execute(
+                "SELECT tokens, updated_at, blocked_until FROM rate_limit_bucket WHERE name = ?",
+                (bucket,),
+            ).fetchone()
+            available = min(capacity, tokens + max(0.0, now - updated_at) * rate)
+            wait = max(blocked_until - now, (1 + reserve - available) / rate, 0.01)
+
+            if time.monotonic() + wait > deadline:
+                self._record(bucket, priority, time.monotonic() - started, timed_out=True)
+                raise RateLimitError(f"{bucket} API 호출 한도를 기다리다 시간이 초과되었습니다.")
+            time.sleep(min(wait, 1.0))
+
+    @staticmethod
+    def max_wait(priority):
+        """우선순위별 토큰을 기다리는 최대 시간(초)"""
+        if priority == INTERACTIVE:
+            return Config.RATE_LIMIT_INTERACTIVE_MAX_WAIT
+        return Config.RATE_LIMIT_BACKGROUND_MAX_WAIT
+
+    def penalize(self, bucket, seconds):
+        """429 응답 등으로 모든 프로세스가 seconds 동안 버킷을 사용하지 않도록 막음"""
+        rate, capacity = self._limits(bucket)
+        conn = self._connect(bucket, capacity)
+        conn.execute(
+            "UPDATE rate_limit_bucket SET blocked_until = MAX(blocked_until, ?) WHERE name = ?",
+            (time.time() + seconds, bucket),
+        )
+        with self._stats_lock:
+            bucket_stats = self._stats.setdefault(bucket, {})
+            bucket_stats["penalties"] = bucket_stats.get("penalties", 0) + 1
+
+    def stats(self):
+        """모니터링용 버킷별 대기 시간/스로틀링 통계 (이 프로세스 기준)"""
+        with self._stats_lock:
+            return {bucket: dict(values) for bucket, values in self._stats.items()}
+
+    @staticmethod
+    def _limits(bucket):
+        limits = Config.PLATFORM_RATE_LIMITS.get(bucket, Config.PLATFORM_RATE_LIMITS["default"])
+        return float(limits["rate"]), float(limits["capacity"])
+
+    def _connect(self, bucket, capacity):
+        """스레드별 SQLite 연결 (autocommit) 반환, 처음이면 테이블과 버킷 생성"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            db_path = self.db_path or os.path.join(tempfile.gettempdir(), Config.RATE_LIMIT_DB_NAME)
+            conn = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_limit_bucket (
+                    name TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    blocked_until REAL NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._local.conn = conn
+            self._local.buckets = set()
+
+        if bucket not in self._local.buckets:
+            conn.execute(
+                "INSERT OR IGNORE INTO rate_limit_bucket (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (bucket, capacity, time.time()),
+            )
+            self._local.buckets.add(bucket)
+        return conn
+
+    def _record(self, bucket, priority, waited, timed_out=False):
+        with self._stats_lock:
+            bucket_stats = self._stats.setdefault(bucket, {})
+            bucket_stats[f"{priority}_acquired"] = bucket_stats.get(f"{priority}_acquired", 0) + (0 if timed_out else 1)
+            if timed_out:
+                bucket_stats["timeouts"] = bucket_stats.get("timeouts", 0) + 1
+            if waited >= 0.01:
+                bucket_stats[f"{priority}_throttled"] = bucket_stats.get(f"{priority}_throttled", 0) + 1
+                bucket_stats[f"{priority}_wait_seconds"] = round(bucket_stats.get(f"{priority}_wait_seconds", 0.0) + waited, 3)
+                bucket_stats["max_wait_seconds"] = round(max(bucket_stats.get("max_wait_seconds", 0.0), waited), 3)
+
+
+class Throttle:
+    """특정 버킷/우선순위로 고정된 레이트 리미터 핸들"""
+
+    def __init__(self, limiter, bucket, priority):
+        self.limiter = limiter
+        self.bucket = bucket
+        self.priority = priority
+
+    @property
+    def max_wait(self):
+        return self.limiter.max_wait(self.priority)
+
+    def acquire(self):
+        return self.limiter.acquire(self.bucket, self.priority)
+
+    def penalize(self, seconds):
+        self.limiter.penalize(self.bucket, seconds)
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,250 @@
+import time
+from array import array
+from collections import Counter
+from itertools import repeat
+from operator import add, mul
+
+from sqlalchemy import and_, delete, distinct, exists, func, insert, literal, or_, select, tuple_, union
+from sqlalchemy.orm import aliased
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.friend_edge import FriendEdge
+from vibeapp.models.friend_recommendation import FriendRecommendation
+from vibeapp.models.loader_profiles import RECOMMENDATION_CARD
+from vibeapp.models.platform_connection import PlatformConnection
+
+
+class RecommendationService:
+    """알 수도 있는 사람(친구의 친구) 추천
+
+    - 후보와 점수는 friend_recommendation 테이블에 미리 계산해 두고 API는 그 테이블만 읽음
+    - 친구 수락/삭제 시에는 점수가 바뀌는 쌍(두 사람과 상대방 친구들 사이)만 다시 계산
+    - `flask rebuild-recommendations`가 친구 그래프 전체를 메모리의 희소 인접 배열(CSR)로
+      읽어 전체를 다시 계산함 (증분 갱신에서 빠진 플랫폼 연결 변화 반영, 사용자별 후보 수 제한)
+    """
+
+    @staticmethod
+    def score(mutual_count, shared_platforms):
+        return mutual_count * Config.RECOMMENDATION_MUTUAL_WEIGHT + shared_platforms * Config.RECOMMENDATION_PLATFORM_WEIGHT
+
+    @staticmethod
+    def get_recommendations(user_id, limit, offset=0):
+        """점수순 추천 한 페이지 반환 (FriendRecommendation 리스트, candidate와 플랫폼 연결 로딩)"""
+        return (
+            FriendRecommendation.query
+            .filter(FriendRecommendation.user_id == user_id)
+            .options(*RECOMMENDATION_CARD)
+            .order_by(FriendRecommendation.score.desc(), FriendRecommendation.candidate_id.desc())
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+
+    @staticmethod
+    def on_friendship_changed(user1_id, user2_id):
+        """친구 수락/삭제 후 점수가 바뀌는 후보만 다시 계산 (friend_edge 갱신 뒤, 같은 트랜잭션에서 호출)
+
+        두 사람의 관계가 바뀌면 user1과 user2의 친구들 사이, user2와 user1의 친구들 사이의
+        공통 친구 수와 두 사람 사이의 추천 여부만 달라짐
+        """
+        RecommendationService._refresh_pairs(user1_id, user2_id)
+        RecommendationService._refresh_pairs(user2_id, user1_id)
+
+    @staticmethod
+    def _refresh_pairs(user_id, other_id):
+        """user_id와 (other_id의 친구들 + other_id) 사이의 추천 행을 지우고 정확한 값으로 다시 넣음
+
+        다시 넣은 행의 주인(user_id와 후보들)은 전체 재계산과 같이 점수순 상위
+        RECOMMENDATION_MAX_PER_USER개만 남김. 잘려 나간 후보는 다음 전체 재계산 때 다시 채워짐
+        """
+        rec = FriendRecommendation
+        candidates = union(
+            select(FriendEdge.friend_id.label("candidate_id")).where(FriendEdge.user_id == other_id),
+            select(literal(other_id).label("candidate_id")),
+        ).subquery()
+        candidate_ids = select(candidates.c.candidate_id)
+
+        db.session.execute(delete(rec).where(or_(
+            and_(rec.user_id == user_id, rec.candidate_id.in_(candidate_ids)),
+            and_(rec.candidate_id == user_id, rec.user_id.in_(candidate_ids)),
+        )))
+
+        candidate_id = candidates.c.candidate_id
+        already_friends = exists().where(FriendEdge.user_id == user_id, FriendEdge.friend_id == candidate_id)
+        pairs = select(
+            candidate_id,
+            RecommendationService._mutual_count(user_id, candidate_id).label("mutual_count"),
+            RecommendationService._shared_platforms(user_id, candidate_id).label("shared_platforms"),
+        ).where(candidate_id != user_id, ~already_friends).subquery()
+
+        score = RecommendationService.score(pairs.c.mutual_count, pairs.c.shared_platforms)
+        columns = ["user_id", "candidate_id", "mutual_count", "shared_platforms", "score"]
+        for owner, candidate in ((literal(user_id), pairs.c.candidate_id), (pairs.c.candidate_id, literal(user_id))):
+            #공통 친구 수는 대칭이므로 같은 계산 결과로 양쪽 방향을 모두 넣음
+            db.session.execute(insert(rec).from_select(
+                columns,
+                select(owner, candidate, pairs.c.mutual_count, pairs.c.shared_platforms, score)
+                .where(pairs.c.mutual_count > 0),
+            ))
+
+        RecommendationService._trim(union(select(literal(user_id)), candidate_ids))
+
+    @staticmethod
+    def _trim(owner_ids, max_per_user=None):
+        """owner_ids(SELECT) 사용자들의 추천을 점수순 상위 max_per_user개만 남기고 지움
+
+        순위는 get_recommendations와 같은 순서(점수, 후보 ID 내림차순)
+        """
+        rec = FriendRecommendation
+        max_per_user = max_per_user or Config.RECOMMENDATION_MAX_PER_USER
+        ranked = select(
+            rec.user_id,
+            rec.candidate_id,
+            func.row_number().over(
+                partition_by=rec.user_id, order_by=(rec.score.desc(), rec.candidate_id.desc())
+            ).label("rank"),
+        ).where(rec.user_id.in_(owner_ids)).subquery()
+        db.session.execute(delete(rec).where(tuple_(rec.user_id, rec.candidate_id).in_(
+            select(ranked.c.user_id, ranked.c.candidate_id).where(ranked.c.rank > max_per_user)
+        )))
+
+    @staticmethod
+    def _mutual_count(user_id, candidate_id):
+        mine = aliased(FriendEdge)
+        theirs = aliased(FriendEdge)
+        return (
+            select(func.count())
+            .select_from(mine)
+            .join(theirs, and_(theirs.friend_id == mine.friend_id, theirs.user_id == candidate_id))
+            .where(mine.user_id == user_id)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _shared_platforms(user_id, candidate_id):
+        mine = aliased(PlatformConnection)
+        theirs = aliased(PlatformConnection)
+        return (
+            select(func.count(distinct(mine.platform)))
+            .select_from(mine)
+            .join(theirs, and_(theirs.platform == mine.platform, theirs.user_id == candidate_id))
+            .where(mine.user_id == user_id)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def rebuild(max_per_user=None, chunk_size=None):
+        """친구 그래프 전체로 추천 테이블을 다시 만듦 (커밋은 호출한 쪽에서)
+
+        friend_edge를 기본 키 순서로 읽어 CSR 배열(사용자별 시작 위치 + 친구 ID 배열)로 만들고,
+        사용자마다 친구들의 친구 목록을 Counter로 세어 공통 친구 수를 구함
+
+        Returns:
+            dict: 사용자 수, 간선 수, 저장한 추천 수, 단계별 소요 시간(초)
+        """
+        max_per_user = max_per_user or Config.RECOMMENDATION_MAX_PER_USER
+        chunk_size = chunk_size or Config.RECOMMENDATION_REBUILD_CHUNK_SIZE
+        timings = {}
+
+        started = time.perf_counter()
+        user_ids, offsets, neighbors = RecommendationService._load_adjacency()
+        platform_masks = RecommendationService._load_platform_masks()
+        timings["load"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        db.session.execute(delete(FriendRecommendation))
+        index_of = {user_id: index for index, user_id in enumerate(user_ids)}
+        bonus_tables = {}
+        #수백만 행을 넣으므로 SQLAlchemy의 파라미터 처리를 거치지 않고 튜플 그대로 executemany
+        connection = db.session.connection()
+        insert_sql = (
+            "INSERT INTO friend_recommendation (user_id, candidate_id, mutual_count, shared_platforms, score, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"
+        )
+        rows = []
+        saved = 0
+        for index, user_id in enumerate(user_ids):
+            friends = neighbors[offsets[index]:offsets[index + 1]]
+            counts = Counter()
+            for friend_id in friends:
+                friend_index = index_of[friend_id]
+                counts.update(neighbors[offsets[friend_index]:offsets[friend_index + 1]])
+            counts.pop(user_id, None)
+            for friend_id in friends:
+                counts.pop(friend_id, None)
+            if not counts:
+                continue
+
+            #후보가 사용자당 수천 명이 될 수 있어 점수 계산과 정렬을 파이썬 반복문 대신 map/sorted로 처리
+            mask = platform_masks.get(user_id, 0)
+            if mask not in bonus_tables:
+                bonus_tables[mask] = RecommendationService._platform_bonus_table(mask, platform_masks)
+            candidate_ids = list(counts)
+            mutuals = list(counts.values())
+            scores = list(map(add, map(mul, mutuals, repeat(Config.RECOMMENDATION_MUTUAL_WEIGHT)),
+                              map(bonus_tables[mask].get, candidate_ids, repeat(0))))
+            ranked = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)[:max_per_user]
+            rows.extend(
+                (user_id, candidate_ids[i], mutuals[i], (mask & platform_masks.get(candidate_ids[i], 0)).bit_count(), scores[i])
+                for i in ranked
+            )
+            if len(rows) >= chunk_size:
+                connection.exec_driver_sql(insert_sql, rows)
+                saved += len(rows)
+                rows = []
+        if rows:
+            connection.exec_driver_sql(insert_sql, rows)
+            saved += len(rows)
+        timings["compute_and_save"] = time.perf_counter() - started
+
+        return {
+            "users": len(user_ids),
+            "edges": len(neighbors),
+            "recommendations": saved,
+            "seconds": {step: round(seconds, 2) for step, seconds in timings.items()},
+        }
+
+    @staticmethod
+    def _platform_bonus_table(mask, platform_masks):
+        """플랫폼 마스크가 mask인 사용자 기준, 후보 ID -> 공통 플랫폼 점수 (0점인 후보는 생략)"""
+        return {
+            candidate_id: (mask & candidate_mask).bit_count() * Config.RECOMMENDATION_PLATFORM_WEIGHT
+            for candidate_id, candidate_mask in platform_masks.items()
+            if mask & candidate_mask
+        }
+
+    @staticmethod
+    def _load_adjacency():
+        """friend_edge를 CSR 형태로 읽음
+
+        Returns:
+            tuple: (사용자 ID 리스트, 시작 위치 배열(길이 = 사용자 수 + 1), 친구 ID 배열)
+        """
+        user_ids = []
+        offsets = array("q", [0])
+        neighbors = array("q")
+        current = None
+        result = db.session.execute(
+            select(FriendEdge.user_id, FriendEdge.friend_id).order_by(FriendEdge.user_id, FriendEdge.friend_id)
+        )
+        for user_id, friend_id in result:
+            if user_id != current:
+                if current is not None:
+                    offsets.append(len(neighbors))
+                user_ids.append(user_id)
+                current = user_id
+            neighbors.append(friend_id)
+        if current is not None:
+            offsets.append(len(neighbors))
+        return user_ids, offsets, neighbors
+
+    @staticmethod
+    def _load_platform_masks():
+        """사용자별 연결한 플랫폼을 비트마스크로 반환 (공통 플랫폼 수 = AND 후 비트 수)"""
+        bits = {}
+        masks = {}
+        for user_id, platform in db.session.execute(select(PlatformConnection.user_id, PlatformConnection.platform)):
+            bit = bits.setdefault(platform, 1 << len(bits))
+            masks[user_id] = masks.get(user_id, 0) | bit
+        return masks
@@ -0,0 +1,235 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+import requests
+
+from vibeapp.config import Config
+from vibeapp.services.http_client import http_client
+
+
+class ResponseCache:
+    """ETag 기반 조건부 요청(If-None-Match)용 플랫폼 API 응답 캐시
+
+    - 응답 본문과 ETag를 SQLite 파일(instance/HTTP_CACHE_DB_NAME)에 압축해 저장, 모든 프로세스가 공유
+    - 키는 URL + 쿼리 파라미터 + 사용자(scope). Authorization 헤더는 키에 넣지 않아 토큰이 바뀌어도 재사용
+    - 304 응답이면 not_modified = True를 먼저 표시하고, 저장해둔 본문은 응답을 읽을 때 압축을 풂
+    - json()은 최근 파싱한 본문을 프로세스 메모리에 (키, ETag)별로 두어 304면 압축 해제/파싱을 건너뜀
+    - 전체 크기가 HTTP_CACHE_MAX_BYTES를 넘으면 가장 오래 사용하지 않은 항목부터 삭제(LRU)
+    """
+
+    EVICT_CHECK_EVERY = 50  # 저장 몇 번마다 전체 크기를 확인할지
+
+    def __init__(self, app=None):
+        self.db_path = None
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {}
+        self._puts = 0
+        self._parsed_lock = threading.Lock()
+        self._parsed = OrderedDict()  # 키 -> (ETag, 파싱된 본문), 최근 사용 순
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.db_path = os.path.join(app.instance_path, Config.HTTP_CACHE_DB_NAME)
+        os.makedirs(app.instance_path, exist_ok=True)
+        app.extensions["response_cache"] = self
+
+    def get(self, url, scope=None, params=None, headers=None, throttle=None):
+        """캐시를 거치는 GET 요청
+
+        저장된 ETag가 있으면 If-None-Match로 조건부 요청을 보내고, 304 응답이면
+        저장된 본문을 담은 200 응답으로 바꿔 반환함 (res.not_modified = True).
+        본문은 content/json()으로 처음 읽을 때 압축을 풂
+
+        Args:
+            scope: 캐시 키를 구분할 사용자 식별자 (예: platform_user_id)
+        """
+        if not Config.HTTP_CACHE_ENABLED:
+            res = http_client.get(url, params=params, headers=headers, throttle=throttle)
+            res.not_modified = False
+            return res
+
+        key = self._key(url, params, scope)
+        entry = self._lookup(key)
+
+        headers = dict(headers or {})
+        if entry is not None:
+            headers["If-None-Match"] = entry[0]
+
+        res = http_client.get(url, params=params, headers=headers, throttle=throttle)
+        res.not_modified = False
+
+        if res.status_code == 304 and entry is not None:
+            self._record("not_modified")
+            self._touch(key)
+            res = _NotModifiedResponse(res, entry[1])
+            res.cache_entry = (key, entry[0])
+            return res
+
+        self._record("misses" if entry is None else "modified")
+        etag = res.headers.get("ETag")
+        if res.status_code == 200 and etag:
+            self._store(key, scope, etag, res.content)
+            res.cache_entry = (key, etag)
+        return res
+
+    def json(self, res):
+        """get()으로 받은 200 응답의 res.json()
+
+        ETag가 있는 응답은 파싱한 본문을 HTTP_CACHE_PARSED_ENTRIES개까지 기억해 두고, 같은 ETag로
+        304가 오면 저장된 본문의 압축 해제와 파싱 없이 그 값을 돌려줌 (여러 호출이 같은 객체를
+        공유하므로 읽기만 할 것)
+        """
+        cache_entry = getattr(res, "cache_entry", None)
+        if cache_entry is None or Config.HTTP_CACHE_PARSED_ENTRIES <= 0:
+            return res.json()
+
+        key, etag = cache_entry
+        if res.not_modified:
+            with self._parsed_lock:
+                parsed = self._parsed.get(key)
+                if parsed is not None and parsed[0] == etag:
+                    self._parsed.move_to_end(key)
+                    self._record("parsed_hits")
+                    return parsed[1]
+
+        data = res.json()
+        with self._parsed_lock:
+            self._parsed[key] = (etag, data)
+            self._parsed.move_to_end(key)
+            while len(self._parsed) > Config.HTTP_CACHE_PARSED_ENTRIES:
+                self._parsed.popitem(last=False)
+        return data
+
+    def forget(self, scope):
+        """scope(사용자)의 캐시 항목을 모두 삭제
+
+        응답은 받았지만 DB 저장에 실패한 경우 다음 동기화가 304로 저장을 건너뛰지 않도록 호출
+        """
+        if scope is None:
+            return
+        self._connect().execute("DELETE FROM http_response_cache WHERE scope = ?", (str(scope),))
+
+    def stats(self):
+        """모니터링용 캐시 적중 통계 (이 프로세스 기준)"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        lookups = stats.get("misses", 0) + stats.get("modified", 0) + stats.get("not_modified", 0)
+        stats["lookups"] = lookups
+        if lookups:
+            stats["hit_ratio"] = round(stats.get("not_modified", 0) / lookups, 3)  # 304로 본문 전송을 아낀 비율
+            stats["miss_ratio"] = round(stats.get("misses", 0) / lookups, 3)  # 캐시 항목이 없었던 비율
+            stats["modified_ratio"] = round(stats.get("modified", 0) / lookups, 3)  # 조건부 요청했지만 바뀐 비율
+        return stats
+
+    @staticmethod
+    def _key(url, params, scope):
+        query = urlencode(sorted((params or {}).items()))
+        raw = f"{scope or ''}\n{url}?{query}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _lookup(self, key):
+        """(etag, 압축된 본문) 또는 None"""
+        return self._connect().execute(
+            "SELECT etag, body FROM http_response_cache WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _touch(self, key):
+        self._connect().execute(
+            "UPDATE http_response_cache SET last_used_at = ? WHERE key = ?", (time.time(), key)
+        )
+
+    def _store(self, key, scope, etag, content):
+        body = zlib.compress(content)
+        conn = self._connect()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO http_response_cache (key, scope, etag, body, size, last_used_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (key, None if scope is None else str(scope), etag, body, len(body), time.time()),
+        )
+        self._record("stores")
+
+        with self._stats_lock:
+            self._puts += 1
+            check = self._puts % self.EVICT_CHECK_EVERY == 1
+        if check:
+            self._evict(conn)
+
+    def _evict(self, conn):
+        """전체 크기가 한도를 넘으면 최근 사용 순으로 한도의 90%까지만 남기고 삭제"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_response_cache").fetchone()[0]
+        if total <= Config.HTTP_CACHE_MAX_BYTES:
+            return
+
+        evicted = conn.execute(
+            """
+            DELETE FROM http_response_cache WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_used_at DESC, key) AS kept
+                    FROM http_response_cache
+                ) WHERE kept > ?
+            )
+            """,
+            (int(Config.HTTP_CACHE_MAX_BYTES * 0.9),),
+        ).rowcount
+        with self._stats_lock:
+            self._stats["evictions"] = self._stats.get("evictions", 0) + evicted
+
+    def _connect(self):
+        """스레드별 SQLite 연결 (autocommit) 반환, 처음이면 테이블 생성"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            db_path = self.db_path or os.path.join(tempfile.gettempdir(), Config.HTTP_CACHE_DB_NAME)
+            conn = sqlite3.connect(db_path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_response_cache (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT,
+                    etag TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_http_response_cache_scope ON http_response_cache (scope)")
+            self._local.conn = conn
+        return conn
+
+    def _record(self, key):
+        with self._stats_lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+
+class _NotModifiedResponse(requests.Response):
+    """304 응답 대신 반환하는 200 응답 (헤더 등은 304 응답 그대로, 본문은 처음 읽을 때 압축을 풂)"""
+
+    def __init__(self, res, compressed_body):
+        super().__init__()
+        self.__dict__.update(res.__dict__)
+        self.status_code = 200
+        self.not_modified = True
+        self._compressed_body = compressed_body
+        self._content = None
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = zlib.decompress(self._compressed_body)
+        return self._content
+
+
+response_cache = ResponseCache()
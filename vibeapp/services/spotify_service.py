@@ -1,106 +1,81 @@
-import requests
-from datetime import datetime, time, timezone, timedelta
-
 from vibeapp.config import Config
-from vibeapp.extensions import db
-from vibeapp.models.playlist import Playlist
-from vibeapp.exceptions import PlaylistFetchError, TokenRefreshError
+from vibeapp.services.paginator import Page
+from vibeapp.services.platform_adapter import PlatformAdapter
 
-class SpotifyService:
-    """Spotify API와 직접 통신하는 서비스"""
-    
-    def refresh_token(self, connection):
-        """토큰 갱신"""
-        token = connection.token
-        
-        if token.expire_at and token.expire_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc):
-            return token.access_token
-        
-        if not token.refresh_token:
-            raise TokenRefreshError("Refresh token is missing")
-        
-        payload = {
-            "grant_type": "refresh_token",
-            "refresh_token": token.refresh_token,
-            "client_id": Config.PLATFORM_OAUTH["spotify"]["CLIENT_ID"],
-            "client_secret": Config.PLATFORM_OAUTH["spotify"]["CLIENT_SECRET"],
-        }
-        
-        res = requests.post(Config.PLATFORM_OAUTH["spotify"]["TOKEN_URL"], data=payload)
-        if res.status_code != 200:
-            raise TokenRefreshError("Token refresh failed")
-        
-        res_data = res.json()
-        token.access_token = res_data["access_token"]
-        
-        new_refresh_token = res_data.get("refresh_token")
-        if new_refresh_token:
-            token.refresh_token = new_refresh_token
+class SpotifyService(PlatformAdapter):
+    """Spotify API와 직접 통신하는 서비스 (Spotify 플랫폼 어댑터)"""
 
-        expires_in = res_data.get("expires_in", 3600)
-        token.expire_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+    PLATFORM = "spotify"
+    PAGINATION = "offset"
+    PLAYLIST_PAGE_SIZE = 50  # /me/playlists 최대 limit
+    PLAYLIST_TRACK_PAGE_SIZE = 100  # /playlists/{id}/tracks 최대 limit
+    PLAYLIST_TRACK_FIELDS = (
+        "next,total,items(track(id,type,is_local,name,duration_ms,"
+        "external_ids(isrc),album(name),artists(name)))"
+    )
 
-        db.session.commit()
-        return token.access_token
-    
-    def get_playlists(self, access_token):
-        """플레이리스트 가져오기"""
-        url = "https://api.spotify.com/v1/me/playlists"
-        headers = {"Authorization": f"Bearer {access_token}"}
-        playlists = []
-        limit = 50
-        offset = 0
+    def fetch_playlist_page(self, access_token, cursor, cache_scope=None):
+        url = f"{Config.SPOTIFY_API_BASE}/me/playlists"
+        params = {"limit": self.PLAYLIST_PAGE_SIZE, "offset": cursor}
+        return self._page(*self._get_json(url, access_token, params, cache_scope))
 
-        while True:
-            params = {"limit": limit, "offset": offset}
-            res = requests.get(url, headers=headers, params=params)
+    def fetch_playlist_tracks_page(self, access_token, playlist_id, cursor, cache_scope=None):
+        #fields 파라미터로 트랙 저장에 필요한 필드만 요청해 응답 크기를 줄임
+        url = f"{Config.SPOTIFY_API_BASE}/playlists/{playlist_id}/tracks"
+        params = {"fields": self.PLAYLIST_TRACK_FIELDS, "limit": self.PLAYLIST_TRACK_PAGE_SIZE, "offset": cursor}
+        return self._page(*self._get_json(url, access_token, params, cache_scope))
 
-            if res.status_code == 429:
-                retry_after = int(res.headers.get("Retry-After", 5))
-                time.sleep(retry_after)
-                continue
+    @staticmethod
+    def _page(data, not_modified):
+        return Page(data.get("items", []), data.get("total"), data.get("next"), not_modified)
 
-            if res.status_code != 200:
-                raise PlaylistFetchError(f"플레이리스트 가져오기 실패: {res.status_code} - {res.text}")
+    def normalize_playlist(self, item):
+        return {
+            "id": item["id"],
+            "name": item["name"],
+            "snapshot_id": item.get("snapshot_id"),
+            "public": item.get("public", True),
+        }
 
-            data = res.json()
-            playlists.extend(data.get("items", []))
+    def normalize_track(self, item):
+        """로컬 파일, 팟캐스트 에피소드 등 Spotify 트랙이 아닌 항목은 None"""
+        track = item.get("track")
+        if not track or track.get("is_local") or not track.get("id"):
+            return None
+        if track.get("type", "track") != "track":
+            return None
+        return self._normalize_track(track)
 
-            if not data.get("next"):
-                break
-            offset += limit
+    def normalize_user(self, data):
+        return {"id": data.get("id"), "display_name": data.get("display_name")}
 
-        return playlists
-    
-    def save_playlists(self, connection, playlists_data):
-        """플레이리스트 DB 저장"""
-        for item in playlists_data:
-            external_id = item["id"]
-            name = item["name"]
-            snapshot_id = item.get("snapshot_id")
-            is_public = item.get("public", True)
+    def search_track(self, access_token, isrc=None, title=None, artist=None):
+        """Spotify 검색 API로 트랙 하나 찾기 (ISRC 우선, 없으면 제목+아티스트)
 
-            existing = Playlist.query.filter_by(
-                platform=connection.platform,
-                platform_user_id=connection.platform_user_id,
-                spotify_id=external_id
-            ).first()
+        Returns:
+            dict | None: 검색된 트랙 dict
+        """
+        if isrc:
+            query = f"isrc:{isrc}"
+        elif title:
+            query = f"track:{title}" + (f" artist:{artist}" if artist else "")
+        else:
+            return None
 
-            if existing:
-                existing.name = name
-                existing.snapshot_id = snapshot_id
-                existing.is_public = is_public
-            else:
-                new_playlist = Playlist(
-                    external_id=external_id,
-                    spotify_id=external_id,
-                    name=name,
-                    snapshot_id=snapshot_id,
-                    is_public=is_public,
-                    platform=connection.platform,
-                    platform_user_id=connection.platform_user_id,
-                    platform_connection_id=connection.id
-                )
-                db.session.add(new_playlist)
+        url = f"{Config.SPOTIFY_API_BASE}/search"
+        data, _ = self._get_json(url, access_token, {"q": query, "type": "track", "limit": 1})
+        items = (data.get("tracks") or {}).get("items") or []
+        return self._normalize_track(items[0]) if items else None
 
-        db.session.commit()
\ No newline at end of file
+    @staticmethod
+    def _normalize_track(track):
+        #ISRC는 대문자로 정규화
+        isrc = (track.get("external_ids") or {}).get("isrc")
+        return {
+            "id": track["id"],
+            "isrc": isrc.strip().upper() if isrc else None,
+            "name": track.get("name") or "",
+            "artists": ", ".join(artist["name"] for artist in track.get("artists") or [] if artist.get("name")),
+            "album": (track.get("album") or {}).get("name"),
+            "duration_ms": track.get("duration_ms"),
+        }
@@ -0,0 +1,174 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import and_, delete, func, or_, update
+from sqlalchemy.exc import IntegrityError
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.platform_connection import PlatformConnection
+from vibeapp.models.sync_job import SyncJob
+from vibeapp.services.rate_limiter import BACKGROUND
+
+
+class SyncQueue:
+    """플레이리스트 백그라운드 동기화 큐
+
+    - 작업은 sync_job 테이블에 저장되어 서버가 재시작돼도 유지됨
+    - 프로세스 내 스레드 풀(SYNC_QUEUE_WORKERS)이 작업을 실행
+    - 연결당 대기중/실행중인 작업은 하나만 유지 (여러 탭에서 요청해도 동기화는 한 번)
+    - 워커가 죽어 멈춘 작업은 다음 enqueue에서 다시 대기 상태로 돌려 실행
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self._recovered = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions["sync_queue"] = self
+
+    def enqueue(self, connection, force=False):
+        """연결의 동기화 작업을 큐에 넣고 SyncJob 반환 (이미 있으면 기존 작업 반환)"""
+        self._recover_once()
+
+        active = SyncJob.get_active_for_connection(connection.id)
+        if active:
+            #멈춘 작업이면 새 작업 대신 그 작업을 다시 대기 상태로 돌려 이 프로세스에서 실행
+            if self._reclaim_stale(active.id):
+                db.session.refresh(active)
+                self._submit(active.id)
+            return active
+
+        job = SyncJob(platform_connection_id=connection.id, force=force)
+        db.session.add(job)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # 다른 요청(또는 다른 워커)이 먼저 작업을 넣은 경우
+            db.session.rollback()
+            return SyncJob.get_active_for_connection(connection.id)
+
+        self._submit(job.id)
+        return job
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=Config.SYNC_QUEUE_WORKERS,
+                    thread_name_prefix="playlist-sync",
+                )
+            return self._executor
+
+    def _submit(self, job_id):
+        self._get_executor().submit(self._run, job_id)
+
+    def _run(self, job_id):
+        """작업 하나 실행 (워커 스레드)"""
+        #순환 import 방지
+        from vibeapp.services.playlist_service import PlaylistService
+
+        with self.app.app_context():
+            # 대기중인 작업을 원자적으로 선점 (다른 프로세스와 중복 실행 방지)
+            claimed = db.session.execute(
+                update(SyncJob)
+                .where(SyncJob.id == job_id, SyncJob.status == SyncJob.QUEUED)
+                .values(status=SyncJob.RUNNING, started_at=datetime.now(timezone.utc))
+            ).rowcount
+            db.session.commit()
+            if not claimed:
+                return
+
+            job = db.session.get(SyncJob, job_id)
+            try:
+                connection = db.session.get(PlatformConnection, job.platform_connection_id)
+                if connection is None:
+                    raise ValueError("플랫폼 연결이 존재하지 않습니다.")
+
+                #백그라운드 우선순위로 호출해 사용자 요청이 레이트 리밋에서 먼저 처리되도록 함
+                playlist_service = PlaylistService(priority=BACKGROUND)
+                result = playlist_service.get_and_save_playlists(connection, force=job.force)
+                job.status = SyncJob.DONE
+                job.result = result
+            except Exception as e:
+                db.session.rollback()
+                job = db.session.get(SyncJob, job_id)
+                job.status = SyncJob.FAILED
+                job.error = str(e)
+
+            job.finished_at = datetime.now(timezone.utc)
+            db.session.commit()
+
+    @staticmethod
+    def stale_condition(now):
+        """멈춘 것으로 보는 활성 작업 조건
+
+        - 실행중인데 SYNC_JOB_STALE_AFTER 넘게 끝나지 않은 작업 (실행하던 워커가 죽음)
+        - 대기중인데 SYNC_JOB_QUEUED_STALE_AFTER 넘게 시작되지 않은 작업 (넣은 프로세스가 죽음)
+        """
+        return or_(
+            and_(
+                SyncJob.status == SyncJob.RUNNING,
+                SyncJob.started_at < now - timedelta(seconds=Config.SYNC_JOB_STALE_AFTER),
+            ),
+            and_(
+                SyncJob.status == SyncJob.QUEUED,
+                func.coalesce(SyncJob.queued_at, SyncJob.created_at)
+                < now - timedelta(seconds=Config.SYNC_JOB_QUEUED_STALE_AFTER),
+            ),
+        )
+
+    def _reclaim_stale(self, job_id):
+        """멈춘 작업이면 다시 대기 상태로 돌리고 True (동시에 여러 요청이 와도 한 요청만 성공)
+
+        대기중인 작업이 실제로는 살아 있는 프로세스의 큐에서 기다리는 중이었어도 _run의 선점이
+        원자적이라 한 번만 실행됨
+        """
+        now = datetime.now(timezone.utc)
+        reclaimed = db.session.execute(
+            update(SyncJob)
+            .where(SyncJob.id == job_id, self.stale_condition(now))
+            .values(status=SyncJob.QUEUED, started_at=None, queued_at=now)
+        ).rowcount
+        db.session.commit()
+        return bool(reclaimed)
+
+    def _recover_once(self):
+        """이 프로세스에서 처음 사용할 때 이전 실행에서 남은 작업을 다시 큐에 넣음"""
+        with self._lock:
+            if self._recovered:
+                return
+            self._recovered = True
+
+        now = datetime.now(timezone.utc)
+
+        # 오래 실행중으로 남은 작업은 중단된 것으로 보고 다시 대기 상태로
+        stale_before = now - timedelta(seconds=Config.SYNC_JOB_STALE_AFTER)
+        db.session.execute(
+            update(SyncJob)
+            .where(SyncJob.status == SyncJob.RUNNING, SyncJob.started_at < stale_before)
+            .values(status=SyncJob.QUEUED, started_at=None, queued_at=now)
+        )
+
+        # 보관 기간이 지난 완료/실패 작업 정리
+        retention_before = now - timedelta(seconds=Config.SYNC_JOB_RETENTION)
+        db.session.execute(
+            delete(SyncJob)
+            .where(SyncJob.status.in_([SyncJob.DONE, SyncJob.FAILED]), SyncJob.finished_at < retention_before)
+        )
+        db.session.commit()
+
+        queued_ids = [
+            job_id for (job_id,) in db.session.query(SyncJob.id).filter_by(status=SyncJob.QUEUED)
+        ]
+        for job_id in queued_ids:
+            self._submit(job_id)
+
+
+sync_queue = SyncQueue()
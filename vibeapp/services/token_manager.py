@@ -0,0 +1,277 @@
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import or_, select, update
+
+from vibeapp.config import Config
+from vibeapp.extensions import db
+from vibeapp.models.platform_connection import PlatformConnection
+from vibeapp.models.platform_token import PlatformToken
+from vibeapp.exceptions import TokenRefreshError
+
+
+class _CachedToken:
+    __slots__ = ("platform", "access_token", "expires_at", "last_used_at")
+
+    def __init__(self, platform, access_token, expires_at):
+        self.platform = platform
+        self.access_token = access_token
+        self.expires_at = expires_at  # epoch 초 (UTC)
+        self.last_used_at = time.time()
+
+
+class TokenManager:
+    """플랫폼 액세스 토큰 관리
+
+    - 연결별 액세스 토큰을 메모리에 캐시해 유효하면 DB 조회 없이 반환
+    - 같은 연결의 갱신은 프로세스 안에서는 연결별 락, 프로세스 간에는
+      platform_token 행의 리스(refresh_lease_*)로 한 번만 실행
+    - 리스와 새 토큰은 세션과 별도의 연결에서 바로 커밋하므로 호출한 쪽 세션의 트랜잭션은
+      커밋/롤백하지 않음
+    - 최근 사용한 연결의 토큰은 만료 TOKEN_REFRESH_MARGIN초 전에 백그라운드 스레드가
+      미리 갱신하므로 사용자 요청은 토큰 엔드포인트를 기다리지 않음
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._cache = {}
+        self._lock = threading.Lock()
+        self._connection_locks = {}
+        self._refresher = None
+        self._stats = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions["token_manager"] = self
+
+    def get_access_token(self, connection, service):
+        """유효한 액세스 토큰 반환, 만료가 임박했으면 갱신
+
+        Args:
+            connection: PlatformConnection
+            service: 토큰 엔드포인트를 호출할 플랫폼 어댑터 (request_token_refresh 구현)
+        """
+        self._start_refresher()
+
+        cached = self._get_cached(connection.id, Config.TOKEN_EXPIRY_SKEW)
+        if cached:
+            self._record("hits")
+            return cached.access_token
+
+        with self._connection_lock(connection.id):
+            #락을 기다리는 동안 다른 스레드가 갱신했을 수 있음
+            cached = self._get_cached(connection.id, Config.TOKEN_EXPIRY_SKEW)
+            if cached:
+                self._record("hits")
+                return cached.access_token
+
+            self._record("misses")
+            return self._refresh(connection.id, service, Config.TOKEN_EXPIRY_SKEW)
+
+    def invalidate(self, connection_id):
+        """재로그인 등으로 DB의 토큰이 바뀐 연결의 캐시 삭제"""
+        with self._lock:
+            self._cache.pop(connection_id, None)
+
+    def stats(self):
+        """모니터링용 캐시 적중/갱신 통계 (이 프로세스 기준)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["cached_connections"] = len(self._cache)
+        return stats
+
+    def _get_cached(self, connection_id, min_remaining):
+        with self._lock:
+            cached = self._cache.get(connection_id)
+        if cached is None or cached.expires_at - time.time() <= min_remaining:
+            return None
+        cached.last_used_at = time.time()
+        return cached
+
+    def _connection_lock(self, connection_id):
+        with self._lock:
+            return self._connection_locks.setdefault(connection_id, threading.Lock())
+
+    def _refresh(self, connection_id, service, min_remaining):
+        """DB의 토큰이 min_remaining초 넘게 유효하면 그대로, 아니면 리스를 잡고 갱신 (연결 락 안에서 호출)"""
+        row = self._load(connection_id)
+        if row.expires_at - time.time() > min_remaining:
+            return self._cache_token(connection_id, row)
+
+        if not row.refresh_token:
+            raise TokenRefreshError("Refresh token is missing")
+
+        deadline = time.monotonic() + Config.TOKEN_LEASE_SECONDS
+        while not self._acquire_lease(row.token_id):
+            #다른 프로세스가 갱신중: 기존 토큰이 아직 쓸 만하면 기다리지 않고 사용
+            if row.expires_at - time.time() > Config.TOKEN_EXPIRY_SKEW:
+                return row.access_token
+
+            self._record("lease_waits")
+            if time.monotonic() > deadline:
+                raise TokenRefreshError("다른 프로세스의 토큰 갱신을 기다리다 시간이 초과되었습니다.")
+            time.sleep(0.2)
+
+            row = self._load(connection_id)
+            if row.expires_at - time.time() > min_remaining:
+                return self._cache_token(connection_id, row)
+
+        try:
+            #리스를 잡기 직전에 다른 프로세스가 갱신을 마쳤을 수 있음
+            row = self._load(connection_id)
+            if row.expires_at - time.time() > min_remaining:
+                self._release_lease(row.token_id)
+                return self._cache_token(connection_id, row)
+
+            token_data = service.request_token_refresh(row.refresh_token)
+            expire_at = datetime.now(timezone.utc) + timedelta(seconds=token_data.get("expires_in", 3600))
+            values = {
+                "access_token": token_data["access_token"],
+                "expire_at": expire_at,
+                "refresh_lease_owner": None,
+                "refresh_lease_until": None,
+            }
+            if token_data.get("refresh_token"):
+                values["refresh_token"] = token_data["refresh_token"]
+
+            with db.engine.begin() as conn:
+                conn.execute(update(PlatformToken).where(PlatformToken.id == row.token_id).values(**values))
+        except Exception:
+            self._release_lease(row.token_id)
+            self._record("failures")
+            raise
+
+        self._record("refreshes")
+        with self._lock:
+            self._cache[connection_id] = _CachedToken(row.platform, values["access_token"], expire_at.timestamp())
+        return values["access_token"]
+
+    def _load(self, connection_id):
+        """연결의 현재 토큰을 DB에서 직접 읽음 (세션에 캐시된 ORM 객체는 사용하지 않음)
+
+        호출한 쪽 세션의 변경을 autoflush하면 별도 연결의 리스 UPDATE가 SQLite 쓰기 잠금을
+        기다리게 되므로 flush하지 않고 읽음
+        """
+        with db.session.no_autoflush:
+            row = db.session.execute(
+                select(
+                    PlatformConnection.platform,
+                    PlatformToken.id.label("token_id"),
+                    PlatformToken.access_token,
+                    PlatformToken.refresh_token,
+                    PlatformToken.expire_at,
+                )
+                .join(PlatformToken, PlatformToken.id == PlatformConnection.token_id)
+                .where(PlatformConnection.id == connection_id)
+            ).one()
+        return _TokenRow(row)
+
+    def _cache_token(self, connection_id, row):
+        with self._lock:
+            self._cache[connection_id] = _CachedToken(row.platform, row.access_token, row.expires_at)
+        return row.access_token
+
+    @staticmethod
+    def _lease_owner():
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    def _acquire_lease(self, token_id):
+        """갱신 리스를 원자적으로 획득 (비어 있거나 만료된 경우만), 성공 여부 반환"""
+        now = datetime.now(timezone.utc)
+        with db.engine.begin() as conn:
+            acquired = conn.execute(
+                update(PlatformToken)
+                .where(
+                    PlatformToken.id == token_id,
+                    or_(PlatformToken.refresh_lease_until.is_(None), PlatformToken.refresh_lease_until < now),
+                )
+                .values(
+                    refresh_lease_owner=self._lease_owner(),
+                    refresh_lease_until=now + timedelta(seconds=Config.TOKEN_LEASE_SECONDS),
+                )
+            ).rowcount
+        return bool(acquired)
+
+    def _release_lease(self, token_id):
+        with db.engine.begin() as conn:
+            conn.execute(
+                update(PlatformToken)
+                .where(PlatformToken.id == token_id, PlatformToken.refresh_lease_owner == self._lease_owner())
+                .values(refresh_lease_owner=None, refresh_lease_until=None)
+            )
+
+    def _start_refresher(self):
+        with self._lock:
+            if self._refresher is not None or self.app is None:
+                return
+            self._refresher = threading.Thread(target=self._refresh_loop, name="token-refresher", daemon=True)
+        self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            time.sleep(Config.TOKEN_REFRESH_INTERVAL)
+            try:
+                self.refresh_expiring()
+            except Exception as e:
+                self.app.logger.warning("토큰 백그라운드 갱신 실패: %s", e)
+
+    def refresh_expiring(self):
+        """최근 사용한 연결 중 만료가 TOKEN_REFRESH_MARGIN초 안으로 남은 토큰을 미리 갱신"""
+        #순환 import 방지
+        from vibeapp.services.platform_adapter import get_adapter
+        from vibeapp.services.rate_limiter import BACKGROUND
+
+        now = time.time()
+        with self._lock:
+            #한동안 사용하지 않은 연결은 더 이상 미리 갱신하지 않음
+            for connection_id in [
+                connection_id for connection_id, cached in self._cache.items()
+                if now - cached.last_used_at > Config.TOKEN_ACTIVE_WINDOW
+            ]:
+                del self._cache[connection_id]
+            expiring = [
+                (connection_id, cached.platform) for connection_id, cached in self._cache.items()
+                if cached.expires_at - now <= Config.TOKEN_REFRESH_MARGIN
+            ]
+
+        with self.app.app_context():
+            for connection_id, platform in expiring:
+                try:
+                    with self._connection_lock(connection_id):
+                        self._refresh(connection_id, get_adapter(platform, BACKGROUND), Config.TOKEN_REFRESH_MARGIN)
+                    self._record("background_refreshes")
+                except Exception as e:
+                    db.session.rollback()
+                    self.app.logger.warning("연결 %s 토큰 미리 갱신 실패: %s", connection_id, e)
+
+    def _record(self, key):
+        with self._lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+
+class _TokenRow:
+    """DB에서 읽은 토큰 값 (expire_at은 epoch 초로 변환)"""
+
+    __slots__ = ("platform", "token_id", "access_token", "refresh_token", "expires_at")
+
+    def __init__(self, row):
+        self.platform = row.platform
+        self.token_id = row.token_id
+        self.access_token = row.access_token
+        self.refresh_token = row.refresh_token
+        #SQLite는 시간대 없이 저장하므로 UTC로 간주 (방금 대입한 값은 aware일 수 있음)
+        expire_at = row.expire_at
+        if expire_at is None:
+            self.expires_at = 0.0
+        elif expire_at.tzinfo is None:
+            self.expires_at = expire_at.replace(tzinfo=timezone.utc).timestamp()
+        else:
+            self.expires_at = expire_at.timestamp()
+
+
+token_manager = TokenManager()
@@ -1,48 +1,72 @@
+from sqlalchemy import and_, or_
+
 from vibeapp.models.user import User
 from vibeapp.models.friend import Friend
+from vibeapp.models.user_search import UserSearch
+from vibeapp.models.loader_profiles import USER_CARD
 
 class UserService:
     @staticmethod
     def search_users(query, current_user_id, limit=10):
-        """사용자 검색 (부분 일치)"""
-        
-        # 사용자명으로 검색 (부분 일치, 자신 제외)
-        users = User.query.filter(
-            User.username.ilike(f'%{query}%'),
-            User.id != current_user_id,
-            User.username.isnot(None)  # 사용자명이 있는 사용자만
-        ).limit(limit).all()
-        
-        return users
+        """사용자 검색 (사용자명/표시 이름, 정확히 > 앞부분 > 부분 일치 순, 자신 제외)"""
+        user_ids = UserSearch.search_ids(query, limit, exclude_id=current_user_id)
+        return User.get_in_order(user_ids, USER_CARD)
     
     @staticmethod
     def get_user_relationship_info(user, current_user_id):
         """대상 사용자와 현재 사용자 간의 관계 정보 반환"""
-        is_friend = Friend.are_friends(current_user_id, user.id)
-        has_pending_from_me = Friend.get_pending_request(current_user_id, user.id) is not None
-        has_pending_to_me = Friend.get_pending_request(user.id, current_user_id) is not None
-        pending_request_id = None
+        return UserService.get_users_relationship_info([user], current_user_id)[0]
+    
+    @staticmethod
+    def get_users_relationship_info(users, current_user_id):
+        """여러 대상 사용자와 현재 사용자 간의 관계 정보를 한 번에 반환 (입력 순서 유지)
         
-        if has_pending_to_me:
-            pending_req = Friend.get_pending_request(user.id, current_user_id)
-            pending_request_id = pending_req.id if pending_req else None
+        대상 수와 관계없이 수락/대기중 신청을 쿼리 한 번으로 모두 가져옴
+        (platform_connections는 호출한 쪽에서 USER_CARD 프로필로 미리 로딩해 둘 것)
+        """
+        user_ids = [user.id for user in users]
+        requests = Friend.query.filter(
+            or_(
+                and_(Friend.requester_id == current_user_id, Friend.receiver_id.in_(user_ids)),
+                and_(Friend.receiver_id == current_user_id, Friend.requester_id.in_(user_ids))
+            ),
+            Friend.status.in_(["accepted", "pending"])
+        ).all() if user_ids else []
         
-        return {
+        friend_ids = set()
+        sent_to = set()
+        received_from = {}  # 신청한 사용자 ID -> 신청 ID
+        for req in requests:
+            outgoing = req.requester_id == current_user_id
+            other_id = req.receiver_id if outgoing else req.requester_id
+            if req.status == "accepted":
+                friend_ids.add(other_id)
+            elif outgoing:
+                sent_to.add(other_id)
+            else:
+                received_from[other_id] = req.id
+        
+        return [{
             "id": user.id,
             "username": user.username,
             "display_name": user.display_name,
             "platform_connections": [conn.platform for conn in user.platform_connections],
-            "is_friend": is_friend,
-            "has_pending_request_from_me": has_pending_from_me,
-            "has_pending_request_to_me": has_pending_to_me,
-            "pending_request_id": pending_request_id
-        }
+            "is_friend": user.id in friend_ids,
+            "has_pending_request_from_me": user.id in sent_to,
+            "has_pending_request_to_me": user.id in received_from,
+            "pending_request_id": received_from.get(user.id)
+        } for user in users]
         
 class FriendService:
+    """친구/신청 목록 API 응답 (커서 페이지네이션, count는 User의 카운터 컬럼)
+
+    cursor는 이전 응답의 next_cursor이고, 형식이 잘못되면 ValueError
+    """
+
     @staticmethod
-    def get_friends_list(user_id):
-        """사용자의 친구 목록 반환"""
-        friends = Friend.get_friends_for_user(user_id)
+    def get_friends_list(user_id, cursor=None, limit=20):
+        """사용자의 친구 목록 한 페이지 반환"""
+        friends, next_cursor = Friend.get_friends_page(user_id, cursor, limit)
         
         friends_data = [{
             "id": friend.id,
@@ -53,16 +77,14 @@ class FriendService:
         
         return {
             "friends": friends_data,
-            "count": len(friends_data)
+            "count": User.query.get(user_id).friends_count,
+            "next_cursor": next_cursor
         }
         
     @staticmethod
-    def get_pending_requests(user_id):
-        """받은 친구 신청 목록 반환"""
-        pending_requests = Friend.query.filter_by(
-            receiver_id=user_id,
-            status="pending"
-        ).all()
+    def get_pending_requests(user_id, cursor=None, limit=20):
+        """받은 친구 신청 목록 한 페이지 반환"""
+        pending_requests, next_cursor = Friend.get_received_requests_page(user_id, cursor, limit)
         
         requests_data = [{
             "id": req.id,
@@ -76,5 +98,68 @@ class FriendService:
         
         return {
             "requests": requests_data,
-            "count": len(requests_data)
-        }
\ No newline at end of file
+            "count": User.query.get(user_id).pending_received_count,
+            "next_cursor": next_cursor
+        }
+
+    @staticmethod
+    def get_sent_requests(user_id, cursor=None, limit=20):
+        """보낸 대기중 친구 신청 목록 한 페이지 반환"""
+        sent_requests, next_cursor = Friend.get_sent_requests_page(user_id, cursor, limit)
+        
+        requests_data = [{
+            "id": req.id,
+            "receiver": {
+                "id": req.receiver.id,
+                "username": req.receiver.username,
+                "display_name": req.receiver.display_name
+            },
+            "created_at": req.created_at.isoformat() if req.created_at else None
+        } for req in sent_requests]
+        
+        return {
+            "requests": requests_data,
+            "count": User.query.get(user_id).pending_sent_count,
+            "next_cursor": next_cursor
+        }
+
+    @staticmethod
+    def send_requests(user_id, usernames):
+        """여러 사용자명에게 친구 신청 (커밋은 호출한 쪽에서)
+
+        사용자 조회, 신청 upsert, 실패 사유 조회를 각각 한 번씩만 실행하므로 사용자명 수와
+        관계없이 쿼리 수가 일정함
+
+        Returns:
+            list: 사용자명별 {"username", "status", "message"} (status는 "sent" 또는 Friend.REQUEST_ERRORS 키)
+        """
+        usernames = list(dict.fromkeys(username.strip() for username in usernames if username.strip()))
+        if not usernames:
+            return []
+        
+        user_ids = dict(User.query.with_entities(User.username, User.id).filter(User.username.in_(usernames)).all())
+        created = {
+            friend_request.receiver_id
+            for friend_request in Friend.create_requests(user_id, [user_ids[name] for name in usernames if name in user_ids])
+        }
+        blocked_ids = [target_id for target_id in user_ids.values() if target_id not in created and target_id != user_id]
+        reasons = Friend.request_block_reasons(user_id, blocked_ids) if blocked_ids else {}
+        
+        results = []
+        for username in usernames:
+            target_id = user_ids.get(username)
+            if target_id is None:
+                status = "not_found"
+            elif target_id == user_id:
+                status = "self"
+            elif target_id in created:
+                status = "sent"
+            else:
+                #upsert와 사유 조회 사이에 상대가 신청을 취소한 경우 등은 이미 처리된 것으로 봄
+                status = reasons.get(target_id, "already_sent")
+            results.append({
+                "username": username,
+                "status": status,
+                "message": "친구 신청을 보냈습니다." if status == "sent" else Friend.REQUEST_ERRORS[status]
+            })
+        return results
@@ -0,0 +1,97 @@
+from vibeapp.config import Config
+from vibeapp.services.paginator import Page
+from vibeapp.services.platform_adapter import PlatformAdapter
+
+class YoutubeService(PlatformAdapter):
+    """YouTube Data API v3와 통신하는 서비스 (YouTube 플랫폼 어댑터)
+
+    - 목록 API는 pageToken 방식이라 한 목록의 페이지는 순서대로 받고(다음 페이지는 미리 요청),
+      여러 플레이리스트의 항목은 PlaylistService가 동시에 받음
+    - 플레이리스트에 snapshot_id가 없으므로 리소스 etag를 대신 사용
+      (제목/공개 범위/항목 수가 바뀌면 etag도 바뀜)
+    """
+
+    PLATFORM = "youtube"
+    PAGINATION = "token"
+    PLAYLIST_PAGE_SIZE = 50  # playlists.list 최대 maxResults
+    PLAYLIST_TRACK_PAGE_SIZE = 50  # playlistItems.list 최대 maxResults
+    UNAVAILABLE_TITLES = frozenset({"Deleted video", "Private video"})
+
+    def fetch_playlist_page(self, access_token, cursor, cache_scope=None):
+        url = f"{Config.YOUTUBE_API_BASE}/playlists"
+        params = {"part": "snippet,status,contentDetails", "mine": "true", "maxResults": self.PLAYLIST_PAGE_SIZE}
+        if cursor:
+            params["pageToken"] = cursor
+        return self._page(*self._get_json(url, access_token, params, cache_scope))
+
+    def fetch_playlist_tracks_page(self, access_token, playlist_id, cursor, cache_scope=None):
+        url = f"{Config.YOUTUBE_API_BASE}/playlistItems"
+        params = {"part": "snippet,contentDetails", "playlistId": playlist_id, "maxResults": self.PLAYLIST_TRACK_PAGE_SIZE}
+        if cursor:
+            params["pageToken"] = cursor
+        return self._page(*self._get_json(url, access_token, params, cache_scope))
+
+    @staticmethod
+    def _page(data, not_modified):
+        total = (data.get("pageInfo") or {}).get("totalResults")
+        return Page(data.get("items", []), total, data.get("nextPageToken"), not_modified)
+
+    def normalize_playlist(self, item):
+        snippet = item.get("snippet") or {}
+        status = item.get("status") or {}
+        return {
+            "id": item["id"],
+            "name": snippet.get("title") or "",
+            "snapshot_id": item.get("etag"),
+            "public": status.get("privacyStatus", "public") == "public",
+        }
+
+    def normalize_track(self, item):
+        """삭제/비공개 영상은 None"""
+        snippet = item.get("snippet") or {}
+        video_id = (item.get("contentDetails") or {}).get("videoId") or (snippet.get("resourceId") or {}).get("videoId")
+        title = snippet.get("title")
+        if not video_id or title in self.UNAVAILABLE_TITLES:
+            return None
+        return self._normalize_video(video_id, title, snippet.get("videoOwnerChannelTitle"))
+
+    def normalize_user(self, data):
+        #Google userinfo 응답
+        return {"id": data.get("id"), "display_name": data.get("name")}
+
+    def search_track(self, access_token, isrc=None, title=None, artist=None):
+        """YouTube 검색 API로 음악 영상 하나 찾기 (ISRC 검색은 지원하지 않아 제목+아티스트만 사용)
+
+        Returns:
+            dict | None: 검색된 트랙 dict
+        """
+        if not title:
+            return None
+
+        url = f"{Config.YOUTUBE_API_BASE}/search"
+        params = {
+            "part": "snippet",
+            "type": "video",
+            "videoCategoryId": "10",  # Music
+            "maxResults": 1,
+            "q": f"{artist} {title}" if artist else title,
+        }
+        data, _ = self._get_json(url, access_token, params)
+        items = data.get("items") or []
+        if not items:
+            return None
+        snippet = items[0].get("snippet") or {}
+        return self._normalize_video(items[0]["id"]["videoId"], snippet.get("title"), snippet.get("channelTitle"))
+
+    @staticmethod
+    def _normalize_video(video_id, title, channel_title):
+        #YouTube Music 자동 생성 채널은 "아티스트 - Topic" 형식
+        artists = (channel_title or "").removesuffix(" - Topic").strip()
+        return {
+            "id": video_id,
+            "isrc": None,
+            "name": title or "",
+            "artists": artists,
+            "album": None,
+            "duration_ms": None,
+        }
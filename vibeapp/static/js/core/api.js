@@ -152,31 +152,85 @@ class CrossVibeAPI {
 
   // ===== 친구 관리 API =====
   /**
-   * 친구 목록 조회
+   * 목록 API 쿼리 문자열 (cursor/limit 페이지네이션)
+   * @param {string|null} cursor - 이전 응답의 next_cursor
+   * @param {number|null} limit - 페이지 크기
+   * @returns {string} 쿼리 문자열 ("" 또는 "?cursor=...")
+   */
+  static pageQuery(cursor = null, limit = null) {
+    const params = new URLSearchParams();
+    if (cursor) params.set("cursor", cursor);
+    if (limit) params.set("limit", limit);
+    const query = params.toString();
+    return query ? `?${query}` : "";
+  }
+
+  /**
+   * 친구 목록 한 페이지 조회
+   * @param {string|null} [cursor=null] - 이전 페이지의 next_cursor
+   * @param {number|null} [limit=null] - 페이지 크기
+   * @returns {Promise<Object>} {friends, count, next_cursor}
+   */
+  static async getFriendsPage(cursor = null, limit = null) {
+    const result = await this.request(`/api/friends${this.pageQuery(cursor, limit)}`);
+
+    if (result.success) {
+      return result.data;
+    } else {
+      throw new Error(result.data?.error || "친구 목록을 불러올 수 없습니다.");
+    }
+  }
+
+  /**
+   * 친구 목록 조회 (첫 페이지)
    * @returns {Promise<Array>} 친구 목록
    */
   static async getFriends() {
-    const result = await this.request("/api/friends");
+    const page = await this.getFriendsPage();
+    return page.friends || [];
+  }
+
+  /**
+   * 받은 친구 신청 목록 한 페이지 조회
+   * @param {string|null} [cursor=null] - 이전 페이지의 next_cursor
+   * @param {number|null} [limit=null] - 페이지 크기
+   * @returns {Promise<Object>} {requests, count, next_cursor}
+   */
+  static async getPendingRequestsPage(cursor = null, limit = null) {
+    const result = await this.request(`/api/friend-requests${this.pageQuery(cursor, limit)}`);
 
     if (result.success) {
-      return result.data.friends || [];
+      return result.data;
     } else {
-      throw new Error(result.data?.error || "친구 목록을 불러올 수 없습니다.");
+      throw new Error(
+        result.data?.error || "친구 신청 목록을 불러올 수 없습니다.",
+      );
     }
   }
 
   /**
-   * 받은 친구 신청 목록 조회
+   * 받은 친구 신청 목록 조회 (첫 페이지)
    * @returns {Promise<Array>} 받은 친구 신청 목록
    */
   static async getPendingRequests() {
-    const result = await this.request("/api/friend-requests");
+    const page = await this.getPendingRequestsPage();
+    return page.requests || [];
+  }
+
+  /**
+   * 보낸 대기중 친구 신청 목록 한 페이지 조회
+   * @param {string|null} [cursor=null] - 이전 페이지의 next_cursor
+   * @param {number|null} [limit=null] - 페이지 크기
+   * @returns {Promise<Object>} {requests, count, next_cursor}
+   */
+  static async getSentRequestsPage(cursor = null, limit = null) {
+    const result = await this.request(`/api/sent-requests${this.pageQuery(cursor, limit)}`);
 
     if (result.success) {
-      return result.data.requests || [];
+      return result.data;
     } else {
       throw new Error(
-        result.data?.error || "친구 신청 목록을 불러올 수 없습니다.",
+        result.data?.error || "보낸 신청 목록을 불러올 수 없습니다.",
       );
     }
   }
@@ -209,6 +263,21 @@ class CrossVibeAPI {
     return await this.post("/send-friend-request-by-id", { user_id: userId });
   }
 
+  /**
+   * 여러 사용자명에게 한 번에 친구 신청 (연락처 가져오기)
+   * @param {string[]} usernames - 대상 사용자명 목록 (최대 100개)
+   * @returns {Promise<Object>} 응답 결과 (data.results: 사용자명별 status/message, data.sent: 보낸 수)
+   */
+  static async sendFriendRequests(usernames) {
+    if (!Array.isArray(usernames) || usernames.length === 0) {
+      throw new Error("친구 신청할 사용자명을 입력해주세요.");
+    }
+
+    return await this.post("/send-friend-requests", {
+      usernames: usernames.map((username) => String(username).trim()),
+    });
+  }
+
   /**
    * 친구 신청 응답 (수락/거절)
    * @param {number} requestId - 신청 ID
@@ -240,6 +309,19 @@ class CrossVibeAPI {
     return await this.post(`/cancel-friend-request/${requestId}`);
   }
 
+  /**
+   * 친구 삭제
+   * @param {number} userId - 삭제할 친구의 사용자 ID
+   * @returns {Promise<Object>}  응답 결과
+   */
+  static async removeFriend(userId) {
+    if (!userId || isNaN(userId)) {
+      throw new Error("올바른 사용자 ID를 입력해주세요.");
+    }
+
+    return await this.post(`/remove-friend/${userId}`);
+  }
+
   // ===== 사용자 계정 API =====
 
   /**
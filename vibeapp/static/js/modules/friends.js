@@ -141,6 +141,37 @@ class FriendManager {
     });
   }
 
+  /**
+   * 친구 삭제
+   * @param {number} userId - 삭제할 친구의 사용자 ID
+   * @returns {Promise<boolean>} 성공 여부
+   */
+  static async removeFriend(userId) {
+    return new Promise((resolve) => {
+      NotificationManager.confirm(
+        "정말로 친구를 삭제하시겠습니까?",
+        async () => {
+          try {
+            const result = await CrossVibeAPI.removeFriend(userId);
+
+            if (result.success) {
+              NotificationManager.success(result.data.message);
+              resolve(true);
+            } else {
+              NotificationManager.error(result.data.error);
+              resolve(false);
+            }
+          } catch (error) {
+            NotificationManager.error(
+              CrossVibeUtils.handleError(error, "친구 삭제")
+            );
+            resolve(false);
+          }
+        }
+      );
+    });
+  }
+
   // ===== 데이터 조회 =====
 
   /**
@@ -174,6 +205,22 @@ class FriendManager {
     }
   }
 
+  /**
+   * 받은 친구 신청 한 페이지 가져오기 (전체 개수 포함)
+   * @returns {Promise<Object>} {requests, count, next_cursor}
+   */
+  static async getPendingRequestsPage() {
+    try {
+      return await CrossVibeAPI.getPendingRequestsPage();
+    } catch (error) {
+      console.error(error);
+      NotificationManager.error(
+        CrossVibeUtils.handleError(error, "친구 신청 조회")
+      );
+      throw error;
+    }
+  }
+
   /**
    * 프로필 보기
    * @param {string} username
@@ -517,10 +564,10 @@ class FriendEventHandler {
     container.innerHTML = FriendRenderer.createLoadingSkeleton();
 
     try {
-      const request = await FriendManager.getPendingRequests();
-      container.innerHTML = FriendRenderer.generateRequestsHTML(request);
+      const page = await FriendManager.getPendingRequestsPage();
+      container.innerHTML = FriendRenderer.generateRequestsHTML(page.requests || []);
 
-      this.updatePendingRequestsBadge(request.length);
+      this.updatePendingRequestsBadge(page.count);
     } catch (error) {
       container.innerHTML = FriendRenderer.createEmptyState(
         "❌",
@@ -539,9 +586,9 @@ class FriendEventHandler {
     if (!badge) return;
 
     if (count === null) {
-      // count가 조회되지 않으면 API에서 조회
-      const request = await FriendManager.getPendingRequests();
-      this.updatePendingRequestsBadge(request.length);
+      // count가 조회되지 않으면 API에서 조회 (목록은 한 페이지만 오므로 count 사용)
+      const page = await FriendManager.getPendingRequestsPage();
+      this.updatePendingRequestsBadge(page.count);
       return;
     }
 
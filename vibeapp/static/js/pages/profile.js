@@ -36,6 +36,17 @@ const UserProfile = {
     }
   },
 
+  /**
+   * 친구 삭제
+   * @param {number} userId - 삭제할 친구의 사용자 ID
+   */
+  async removeFriend(userId) {
+    const success = await FriendManager.removeFriend(userId);
+    if (success) {
+      setTimeout(() => location.reload(), 500);
+    }
+  },
+
   /**
    * 메시지 보내기 기능 (향후 구현)
    */
@@ -0,0 +1,37 @@
+# vibeapp/utils/db_utils.py - DB 일괄 처리/스키마 관련 유틸리티 함수들
+
+from sqlalchemy import text
+from sqlalchemy.schema import CreateColumn
+
+
+def chunked(items, size):
+    """리스트를 size 크기의 조각으로 나눠서 반환 (IN 절/일괄 쿼리 크기 제한용)"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def add_missing_columns(engine, metadata):
+    """이미 있는 테이블에 모델에는 있지만 DB에는 없는 컬럼을 ALTER TABLE ADD COLUMN으로 추가
+
+    create_all은 이미 있는 테이블을 건너뛰므로 기존 DB에 새 컬럼이 생기지 않음. 기존 행에 값을
+    채워야 하므로 NOT NULL 컬럼은 server_default가 있어야 함
+
+    Returns:
+        dict: 테이블 이름 -> 추가한 컬럼 이름 리스트 (추가한 테이블만)
+    """
+    added = {}
+    with engine.begin() as conn:
+        quote = engine.dialect.identifier_preparer.quote
+        for table in metadata.sorted_tables:
+            existing = {row[1] for row in conn.execute(text(f"PRAGMA table_info({quote(table.name)})"))}
+            if not existing:
+                continue
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                if not column.nullable and column.server_default is None:
+                    raise RuntimeError(f"{table.name}.{column.name}: NOT NULL 컬럼을 추가하려면 server_default가 필요합니다")
+                ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {quote(table.name)} ADD COLUMN {ddl}"))
+                added.setdefault(table.name, []).append(column.name)
+    return added
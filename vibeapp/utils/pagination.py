@@ -0,0 +1,72 @@
+# vibeapp/utils/pagination.py - (created_at, id) 기준 커서(keyset) 페이지네이션 유틸리티 함수들
+import base64
+import binascii
+import json
+
+from sqlalchemy import String, and_, or_, type_coerce
+
+from vibeapp.extensions import db
+
+
+def encode_cursor(created_at, item_id):
+    """마지막 행의 (created_at 원본 문자열, id)를 URL에 넣을 수 있는 불투명한 문자열로 변환"""
+    raw = json.dumps([created_at, item_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor):
+    """encode_cursor의 역변환, 형식이 잘못되면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, item_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    if not isinstance(created_at, str) or not isinstance(item_id, int) or isinstance(item_id, bool):
+        raise ValueError("잘못된 커서입니다.")
+    return created_at, item_id
+
+
+def clamp_limit(limit, default, maximum):
+    """요청한 페이지 크기를 1 ~ maximum 범위로 제한 (없으면 default)"""
+    if limit is None:
+        return default
+    return min(max(limit, 1), maximum)
+
+
+def keyset_page(statement, created_column, id_column, cursor=None, limit=20):
+    """statement를 (created_at, id) 내림차순(최신순)으로 정렬해 cursor 다음 한 페이지를 조회
+
+    OFFSET 없이 마지막 행의 (created_at, id)보다 작은 행부터 읽으므로, 인덱스가
+    (필터 컬럼, created_at, id) 순이면 몇 번째 페이지든 limit + 1행만 읽고 끝남.
+    created_at은 DB에 저장된 문자열 그대로 비교함 (func.now()로 저장된 값에는 마이크로초가
+    없어 파이썬 datetime으로 바인딩하면 같은 초의 행 비교가 어긋남)
+
+    Args:
+        statement: 첫 번째 컬럼이 반환할 항목인 select()
+        created_column, id_column: 정렬 키 컬럼 (id_column은 같은 created_at 안에서 유일해야 함)
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None), 형식이 잘못되면 ValueError
+
+    Returns:
+        tuple: (항목 리스트, 다음 페이지 커서 또는 None)
+    """
+    created_raw = type_coerce(created_column, String)
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        #created_at <= ? 조건을 따로 둬야 플래너가 인덱스 범위 조회로 시작 위치를 찾음
+        statement = statement.where(
+            created_raw <= created_at,
+            or_(created_raw < created_at, and_(created_raw == created_at, id_column < last_id)),
+        )
+    rows = db.session.execute(
+        statement
+        #항목이 같은 테이블의 엔티티면 컬럼 이름이 겹치므로 라벨을 붙여 따로 받음
+        .add_columns(created_raw.label("cursor_created_at"), id_column.label("cursor_id"))
+        .order_by(created_raw.desc(), id_column.desc())
+        .limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][-2], rows[-1][-1])
+    return [row[0] for row in rows], next_cursor
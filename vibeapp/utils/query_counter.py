@@ -0,0 +1,40 @@
+# vibeapp/utils/query_counter.py - 실행된 SQL 문 기록 유틸리티 (N+1 쿼리 확인용)
+
+from sqlalchemy import event
+
+
+class QueryCounter:
+    """with 블록 안에서 engine으로 실행된 SQL 문과 파라미터를 순서대로 기록
+
+        with QueryCounter(db.engine) as counter:
+            client.get("/api/friends")
+        counter.count, counter.selects()
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters, executemany))
+
+    def __enter__(self):
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        return False
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def selects(self):
+        """기록된 SELECT 문의 (SQL, 파라미터) 목록 (executemany 제외)"""
+        return [
+            (statement, parameters)
+            for statement, parameters, executemany in self.statements
+            if not executemany and statement.lstrip().upper().startswith("SELECT")
+        ]
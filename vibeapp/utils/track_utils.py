@@ -0,0 +1,47 @@
+# vibeapp/utils/track_utils.py - 플랫폼 간 트랙 매칭용 정규화 함수들
+
+import re
+
+from text_unidecode import unidecode
+
+
+# "(feat. X)", "[with X]", "- feat. X" 처럼 피처링 아티스트를 표기한 부분
+_FEATURE_PATTERN = re.compile(
+    r"[\(\[]\s*(?:feat\.?|ft\.?|featuring|with)\s[^\)\]]*[\)\]]"
+    r"|\s-\s(?:feat\.?|ft\.?|featuring)\s.*$"
+    r"|\s(?:feat\.?|ft\.?|featuring)\s.*$",
+    re.IGNORECASE,
+)
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(value):
+    """소문자 변환, 로마자 변환(unidecode), 기호 제거한 문자열 반환"""
+    if not value:
+        return ""
+    value = unidecode(value).lower()
+    return _NON_ALNUM_PATTERN.sub(" ", value).strip()
+
+
+def strip_features(title):
+    """곡 제목에서 피처링 표기 제거"""
+    if not title:
+        return ""
+    return _FEATURE_PATTERN.sub("", title).strip()
+
+
+def make_match_key(artists, title):
+    """대표 아티스트 + 제목으로 플랫폼 간 매칭 키 생성
+
+    Args:
+        artists: ", "로 연결된 아티스트 이름들 (첫 번째 아티스트만 사용)
+        title: 곡 제목
+
+    Returns:
+        str | None: "아티스트|제목" 형태의 정규화된 키, 만들 수 없으면 None
+    """
+    primary_artist = normalize_text((artists or "").split(",")[0])
+    normalized_title = normalize_text(strip_features(title))
+    if not primary_artist or not normalized_title:
+        return None
+    return f"{primary_artist}|{normalized_title}"